@@ -64,14 +64,45 @@
 # ./app/__init__.py
 '''
     Application Initialization and Configuration
+    ============================================
+
+    create_app() builds and configures an application instance.  Importing
+    the package has no side effects: no application is built and no
+    database connection is opened.  Connection pools open their first
+    connection on the first request, i.e. inside each pre-fork worker
+    rather than in the parent process.
 ''' 
 from flask import Flask, send_from_directory
-from . import config
+from . import cache, config, database, metrics, suggest
+from .admin import admin_blueprint
 from .authors import authors_blueprint
 from .books import books_blueprint
 
-app = Flask(__name__)
-app.config.from_object(config.Config)
 
-app.register_blueprint(authors_blueprint) 
-app.register_blueprint(books_blueprint)
\ No newline at end of file
+def create_app(config_object=None) -> Flask:
+    """
+    Application factory.
+
+    Args:
+        config_object: Config class to load, or a dict of overrides applied
+            on top of the APP_ENV configuration.  Defaults to config.get_config().
+
+    Returns:
+        Flask: Configured application.
+    """
+    app = Flask(__name__)
+    if config_object is None or isinstance(config_object, dict):
+        app.config.from_object(config.get_config())
+        app.config.update(config_object or {})
+    else:
+        app.config.from_object(config_object)
+
+    database.init_app(app)
+    cache.init_app(app)
+    metrics.init_app(app)
+    suggest.init_app(app)
+
+    app.register_blueprint(authors_blueprint)
+    app.register_blueprint(books_blueprint)
+    app.register_blueprint(admin_blueprint)
+    return app
@@ -0,0 +1,158 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./app/admin.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       Flask
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       curl -H 'X-Admin-Token: ...' http://localhost:5000/admin/queries
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# admin.py
+'''
+    Admin Endpoints
+    ===============
+
+    Operational endpoints, only served when ADMIN_TOKEN is configured and
+    the request carries it in the X-Admin-Token header.
+
+        GET /admin/queries - Heaviest SQL statements seen by this process
+        DELETE /admin/queries - Reset the query aggregates
+'''
+
+import hmac
+
+from flask import Blueprint, current_app, jsonify, request
+
+admin_blueprint = Blueprint('admin', __name__, url_prefix='/admin')
+
+QUERY_ORDERS = ('total_seconds', 'max_seconds', 'avg_seconds', 'count', 'slow_count')
+
+
+@admin_blueprint.before_request
+def require_admin_token():
+    """
+    Rejects admin requests unless ADMIN_TOKEN is set and presented.
+
+    API Response:
+        401 Unauthorized - Missing or wrong X-Admin-Token header.
+        403 Forbidden - Admin endpoints are disabled (no ADMIN_TOKEN).
+    """
+    token = current_app.config.get('ADMIN_TOKEN')
+    if not token:
+        return jsonify({'error': 'Admin endpoints are disabled'}), 403
+    if not hmac.compare_digest(request.headers.get('X-Admin-Token', ''), token):
+        return jsonify({'error': 'Invalid admin token'}), 401
+
+
+# endpoint: GET /admin/queries
+@admin_blueprint.route('/queries', methods=['GET'])
+def get_query_stats() -> dict:
+    """
+    Retrieve per-statement timing aggregates of this process.
+
+    Query Parameters:
+        order (str): One of total_seconds (default), max_seconds, avg_seconds,
+            count or slow_count.
+        limit (int): Number of statements (default 20).
+
+    API Response:
+        200 OK - Aggregates retrieved successfully.
+        400 Bad Request - Invalid order or limit.
+
+    Response Schema:
+        {
+            "threshold_seconds": float,
+            "queries": [
+                {
+                    "sql": str,
+                    "params": str,
+                    "count": int,
+                    "slow_count": int,
+                    "total_seconds": float,
+                    "avg_seconds": float,
+                    "max_seconds": float,
+                    "explain": list | null
+                }
+            ]
+        }
+    """
+    order = request.args.get('order', 'total_seconds')
+    if order not in QUERY_ORDERS:
+        return jsonify({'error': f"'order' must be one of: {', '.join(QUERY_ORDERS)}"}), 400
+    try:
+        limit = int(request.args.get('limit', 20))
+    except ValueError:
+        return jsonify({'error': "'limit' must be an integer"}), 400
+    if limit < 1:
+        return jsonify({'error': "'limit' must be at least 1"}), 400
+
+    profiler = current_app.extensions['query_profiler']
+    return jsonify({'threshold_seconds': profiler.threshold,
+                    'queries': profiler.top(limit, order)}), 200
+
+
+# endpoint: DELETE /admin/queries
+@admin_blueprint.route('/queries', methods=['DELETE'])
+def reset_query_stats() -> dict:
+    """
+    Reset the per-statement timing aggregates of this process.
+
+    API Response:
+        200 OK - Aggregates cleared.
+    """
+    current_app.extensions['query_profiler'].reset()
+    return jsonify({'message': 'Query statistics reset'}), 200
@@ -0,0 +1,706 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./app/asgi.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       Quart, aiomysql, hypercorn (optional)
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       hypercorn 'app.asgi:create_asgi_app()'
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# asgi.py
+'''
+    Async (ASGI) Variant of the Books and Authors API
+    =================================================
+
+    The book and author routes of app/books.py and app/authors.py,
+    implemented as async views over an aiomysql connection pool and served
+    by any ASGI server:
+
+        hypercorn 'app.asgi:create_asgi_app()' --bind 0.0.0.0:8000
+
+    Requests waiting on MySQL do not pin a thread, so one process can hold
+    thousands of slow client connections while using at most
+    MYSQL_POOL_MAX_SIZE database connections.
+
+    Supported: filtered and sorted keyset pages, ?ids= multi-gets, ?fields=,
+    the single-item cache, the single-row write routes and bulk delete and
+    restore.  Cache calls run on the default executor, so a Redis cache
+    shared with the WSGI app does not block the event loop.
+
+    WSGI-only: streaming and ?include= (both rejected with 400 rather than
+    ignored), conditional GET, POST /books/batch, GET /authors/:id/books,
+    GET /books/search, GET /suggest, GET /metrics and the /admin routes.
+'''
+
+import asyncio
+import functools
+import logging
+from contextlib import asynccontextmanager
+
+import aiomysql
+from pymysql.constants import CLIENT
+from quart import Blueprint, Quart, current_app, jsonify, request
+
+from . import config
+from .authors import (DELETE_AUTHOR_BOOKS_SQL, LOCK_AUTHOR_BOOKS_SQL, LOCK_DELETED_WITH_AUTHOR_SQL,
+                      RESTORE_AUTHOR_BOOKS_SQL)
+from .bulk import BulkError, lock_rows_sql, parse_body_ids, set_deleted_sql
+from .cache import cache_key, create_cache
+from .fields import (AUTHOR_COLUMNS, AUTHOR_FIELDS, BOOK_COLUMNS, BOOK_FIELDS, FieldsError,
+                     column_list, parse_fields, projector, select_columns)
+from .multiget import MultiGetError, parse_ids, select_by_ids_sql
+from .pagination import PaginationError, parse_limit
+from .query import AUTHOR_LIST, BOOK_LIST, ListQuery, ListSpec, QueryError
+from .stats import add_books_sql, refresh_authors_sql, refresh_book_authors_sql
+
+async_blueprint = Blueprint('async_api', __name__)
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def connection():
+    """
+    Checks a connection out of the async pool for the duration of a block.
+
+    Waits at most MYSQL_POOL_TIMEOUT seconds for a free connection.  Any
+    transaction left open by the block is rolled back before release.
+
+    Yields:
+        aiomysql.Connection: Pooled connection.
+    """
+    pool = current_app.extensions['aio_pool']
+    conn = await asyncio.wait_for(pool.acquire(), current_app.config['MYSQL_POOL_TIMEOUT'])
+    try:
+        yield conn
+    finally:
+        try:
+            await conn.rollback()
+        finally:
+            pool.release(conn)
+
+
+async def cache_call(method: str, *args):
+    """
+    Calls a method of the single-item cache on the default executor.
+
+    The backends are synchronous; with the Redis backend every call is a
+    network round trip that would otherwise stall the event loop.
+
+    Args:
+        method (str): CacheBackend method name, e.g. 'get' or 'delete'.
+        args: Its arguments.
+
+    Returns:
+        The method's result.
+    """
+    call = functools.partial(getattr(current_app.extensions['cache'], method), *args)
+    return await asyncio.get_running_loop().run_in_executor(None, call)
+
+
+async def fetch_all(query: str, params: tuple = ()) -> list:
+    """
+    Runs a query and returns every row.
+    """
+    async with connection() as conn:
+        async with conn.cursor() as cursor:
+            await cursor.execute(query, params)
+            return await cursor.fetchall()
+
+
+async def fetch_one(query: str, params: tuple = ()):
+    """
+    Runs a query and returns the first row, or None.
+    """
+    async with connection() as conn:
+        async with conn.cursor() as cursor:
+            await cursor.execute(query, params)
+            return await cursor.fetchone()
+
+
+async def execute_write(query: str, params: tuple = (), followups=None) -> tuple:
+    """
+    Runs a write statement in its own transaction.
+
+    Args:
+        query (str): Write statement.
+        params (tuple): Its parameters.
+        followups (callable): Optional; called with (rowcount, lastrowid) and
+            returns further (query, params) statements for the same transaction,
+            e.g. the author_stats maintenance of app.stats.
+
+    Returns:
+        tuple: (rowcount, lastrowid)
+    """
+    async with connection() as conn:
+        async with conn.cursor() as cursor:
+            await cursor.execute(query, params)
+            result = cursor.rowcount, cursor.lastrowid
+            for statement in (followups(*result) if followups else ()):
+                await cursor.execute(*statement)
+        await conn.commit()
+        return result
+
+
+@asynccontextmanager
+async def transaction():
+    """
+    Runs a block as one transaction on a pooled connection.
+
+    The transaction is committed when the block completes and rolled back
+    (by connection()) when it raises.
+
+    Yields:
+        aiomysql.Cursor: Cursor of the transaction.
+    """
+    async with connection() as conn:
+        async with conn.cursor() as cursor:
+            yield cursor
+        await conn.commit()
+
+
+async def list_rows(spec: ListSpec, key: str, default_columns: tuple, allowed_fields: tuple):
+    """
+    Serves one filtered, sorted keyset page of live rows, shaped like the
+    WSGI list endpoints (see app.query.ListQuery).
+    """
+    if 'stream' in request.args:
+        return jsonify({'error': "'stream' is not supported by the async server"}), 400
+    try:
+        limit = parse_limit(request.args, current_app.config['DEFAULT_PAGE_SIZE'],
+                            current_app.config['MAX_PAGE_SIZE'])
+        listing = ListQuery(spec, request.args)
+        fields = parse_fields(request.args.get('fields'), allowed_fields)
+    except (PaginationError, QueryError, FieldsError) as e:
+        return jsonify({'error': str(e)}), 400
+    columns = listing.columns(select_columns(fields, default_columns))
+    shape = projector(columns, fields)
+
+    try:
+        rows = await fetch_all(*listing.sql(columns, limit))
+        rows, next_cursor = listing.paginate(rows, limit, columns)
+        return jsonify({key: [shape(row) for row in rows], 'next_cursor': next_cursor})
+    except Exception as e:
+        logger.error(f"Error fetching {spec.table}: {str(e)}")
+        return jsonify({'error': 'Database error'}), 500
+
+
+async def get_rows_by_ids(table: str, kind: str, key: str, columns: tuple, allowed_fields: tuple):
+    """
+    Serves the live rows listed in ?ids=, in request order, through the
+    single-item cache.  See app.multiget.fetch_by_ids.
+    """
+    try:
+        ids = parse_ids(request.args['ids'], current_app.config['MULTIGET_MAX_IDS'])
+        fields = parse_fields(request.args.get('fields'), allowed_fields)
+    except (MultiGetError, FieldsError) as e:
+        return jsonify({'error': str(e)}), 400
+
+    try:
+        keys = {item_id: cache_key(kind, item_id) for item_id in ids}
+        cached = await cache_call('get_many', list(keys.values()))
+        rows = {item_id: cached[k] for item_id, k in keys.items() if k in cached}
+        misses = [item_id for item_id in ids if item_id not in rows]
+        if misses:
+            chunk_size = current_app.config['MULTIGET_CHUNK_SIZE']
+            found = {}
+            async with connection() as conn:
+                async with conn.cursor() as cursor:
+                    for start in range(0, len(misses), chunk_size):
+                        await cursor.execute(*select_by_ids_sql(table, columns, misses[start:start + chunk_size]))
+                        for row in await cursor.fetchall():
+                            found[row[0]] = row
+            await cache_call('set_many', {keys[item_id]: row for item_id, row in found.items()})
+            rows.update(found)
+    except Exception as e:
+        logger.error(f"Error fetching {table} by id: {str(e)}")
+        return jsonify({'error': 'Database error'}), 500
+    shape = projector(columns, fields)
+    return jsonify({key: [shape(rows[item_id][:-1]) for item_id in ids if item_id in rows],
+                    'missing': [item_id for item_id in ids if item_id not in rows]})
+
+
+async def get_row(table: str, kind: str, item_id: int, columns: tuple, allowed_fields: tuple):
+    """
+    Serves one live row by ID through the read-through cache.
+
+    Cache entries have the shape the WSGI app uses (columns followed by
+    updated_at), so both apps can share one cache server.
+    """
+    if 'include' in request.args:
+        return jsonify({'error': "'include' is not supported by the async server"}), 400
+    try:
+        fields = parse_fields(request.args.get('fields'), allowed_fields)
+    except FieldsError as e:
+        return jsonify({'error': str(e)}), 400
+
+    try:
+        key = cache_key(kind, item_id)
+        row = await cache_call('get', key)
+        if row is None:
+            query = f"SELECT {column_list(columns + ('updated_at',))} FROM {table} WHERE id = %s AND is_deleted = 0"
+            row = await fetch_one(query, (item_id,))
+            if row:
+                await cache_call('set', key, row)
+        if not row:
+            return jsonify({'error': f'{kind.capitalize()} not found'}), 404
+        return jsonify({kind: projector(columns, fields)(row[:-1])})
+    except Exception as e:
+        logger.error(f"Error fetching {kind} {item_id}: {str(e)}")
+        return jsonify({'error': 'Database error'}), 500
+
+
+def book_stats_followups(table: str, item_id: int):
+    """
+    Returns the execute_write followups refreshing author_stats after a
+    book changed state, or None for other tables.
+    """
+    if table != 'books':
+        return None
+    return lambda rowcount, _: [refresh_book_authors_sql([item_id])] if rowcount else []
+
+
+async def soft_delete_row(table: str, kind: str, item_id: int):
+    """
+    Soft deletes a row with a single conditional UPDATE.
+    """
+    try:
+        deleted, _ = await execute_write(f"UPDATE {table} SET is_deleted = 1, deleted_at = NOW(6) "
+                                         f"WHERE id = %s AND is_deleted = 0", (item_id,),
+                                         book_stats_followups(table, item_id))
+        if not deleted:
+            return jsonify({'error': f'{kind.capitalize()} not found or already deleted'}), 404
+        await cache_call('delete', cache_key(kind, item_id))
+        return jsonify({'message': f'{kind.capitalize()} deleted successfully'}), 200
+    except Exception as e:
+        logger.error(f"Error deleting {kind} {item_id}: {str(e)}")
+        return jsonify({'error': 'Database error'}), 500
+
+
+async def restore_row(table: str, kind: str, item_id: int):
+    """
+    Restores a soft-deleted row with a single conditional UPDATE.
+    """
+    try:
+        restored, _ = await execute_write(f"UPDATE {table} SET is_deleted = 0, deleted_at = NULL "
+                                          f"WHERE id = %s AND is_deleted = 1", (item_id,),
+                                          book_stats_followups(table, item_id))
+        if not restored:
+            row = await fetch_one(f"SELECT is_deleted FROM {table} WHERE id = %s", (item_id,))
+            if not row:
+                return jsonify({'error': f'{kind.capitalize()} not found'}), 404
+            return jsonify({'error': f'{kind.capitalize()} is already active'}), 400
+        await cache_call('delete', cache_key(kind, item_id))
+        return jsonify({'message': f'{kind.capitalize()} restored successfully'}), 200
+    except Exception as e:
+        logger.error(f"Error restoring {kind} {item_id}: {str(e)}")
+        return jsonify({'error': 'Database error'}), 500
+
+
+async def bulk_set_deleted(table: str, kind: str, deleted: bool):
+    """
+    Soft deletes or restores many rows in one transaction.  See app.bulk.
+    """
+    try:
+        ids = parse_body_ids(await request.get_json(silent=True), current_app.config['BATCH_MAX_ROWS'])
+    except BulkError as e:
+        return jsonify({'error': str(e)}), 400
+
+    target = int(deleted)
+    chunk_size = current_app.config['BATCH_CHUNK_SIZE']
+    changed, unchanged, missing = [], [], []
+    try:
+        async with transaction() as cursor:
+            for start in range(0, len(ids), chunk_size):
+                chunk = ids[start:start + chunk_size]
+                await cursor.execute(*lock_rows_sql(table, chunk))
+                state = dict(await cursor.fetchall())
+                flip = [item_id for item_id in chunk if item_id in state and state[item_id] != target]
+                if flip:
+                    await cursor.execute(*set_deleted_sql(table, flip, deleted))
+                    if table == 'books':
+                        await cursor.execute(*refresh_book_authors_sql(flip))
+                changed.extend(flip)
+                unchanged.extend(item_id for item_id in chunk if state.get(item_id) == target)
+                missing.extend(item_id for item_id in chunk if item_id not in state)
+    except Exception as e:
+        logger.error(f"Error bulk {'deleting' if deleted else 'restoring'} {table}: {str(e)}")
+        return jsonify({'error': 'Database error'}), 500
+
+    await cache_call('delete', *(cache_key(kind, item_id) for item_id in changed))
+    return jsonify({'changed': changed, 'unchanged': unchanged, 'missing': missing}), 200
+
+
+# endpoint: GET /books
+@async_blueprint.route('/books', methods=['GET'])
+async def get_books():
+    """
+    Retrieve a page of books, optionally filtered and sorted, or the books
+    listed in ?ids=.  See app.books.get_books.
+    """
+    if 'ids' in request.args:
+        return await get_rows_by_ids('books', 'book', 'books', BOOK_COLUMNS, BOOK_FIELDS)
+    return await list_rows(BOOK_LIST, 'books', BOOK_COLUMNS, BOOK_FIELDS)
+
+
+# endpoint: GET /books/:id
+@async_blueprint.route('/books/<int:book_id>', methods=['GET'])
+async def get_book(book_id: int):
+    """
+    Retrieves a book by ID.  See app.books.get_book.
+    """
+    return await get_row('books', 'book', book_id, BOOK_COLUMNS, BOOK_FIELDS)
+
+
+# endpoint: POST /books
+@async_blueprint.route('/books', methods=['POST'])
+async def create_book():
+    """
+    Creates a new book.  See app.books.create_book.
+    """
+    data = await request.get_json()
+    if not data or 'title' not in data or 'author_id' not in data or 'publication_date' not in data:
+        return jsonify({'error': 'Missing required fields'}), 400
+
+    try:
+        query = "INSERT INTO books (title, author_id, publication_date) VALUES (%s, %s, %s)"
+        _, book_id = await execute_write(query, (data['title'], data['author_id'], data['publication_date']),
+                                         lambda _, book_id: [add_books_sql(book_id, book_id)])
+        await cache_call('delete', cache_key('book', book_id))
+        return jsonify({'message': 'Book created successfully'}), 201
+    except Exception as e:
+        logger.error(f"Error creating book: {str(e)}")
+        return jsonify({'error': 'Database error'}), 500
+
+
+# endpoint: PUT /books/:id
+@async_blueprint.route('/books/<int:book_id>', methods=['PUT'])
+async def update_book(book_id: int):
+    """
+    Updates an existing book.  See app.books.update_book.
+    """
+    data = await request.get_json()
+    if not data or 'title' not in data or 'author_id' not in data or 'publication_date' not in data:
+        return jsonify({'error': 'Missing required fields'}), 400
+
+    try:
+        async with transaction() as cursor:
+            await cursor.execute("SELECT author_id FROM books WHERE id = %s FOR UPDATE", (book_id,))
+            previous = await cursor.fetchone()
+            query = "UPDATE books SET title = %s, author_id = %s, publication_date = %s WHERE id = %s"
+            await cursor.execute(query, (data['title'], data['author_id'], data['publication_date'], book_id))
+            updated = cursor.rowcount
+            if updated:
+                # The book may have moved from one author to another
+                if previous[0] is not None:
+                    await cursor.execute(*refresh_authors_sql([previous[0]]))
+                await cursor.execute(*refresh_book_authors_sql([book_id]))
+        if not updated:
+            return jsonify({'error': 'Book not found'}), 404
+        await cache_call('delete', cache_key('book', book_id))
+
+        return jsonify({'message': 'Book updated successfully', 'book': {
+            'id': book_id,
+            'title': data['title'],
+            'author_id': data['author_id'],
+            'publication_date': data['publication_date']
+        }}), 200
+    except Exception as e:
+        logger.error(f"Error updating book {book_id}: {str(e)}")
+        return jsonify({'error': 'Database error'}), 500
+
+
+# endpoint: DELETE /books/:id
+@async_blueprint.route('/books/<int:book_id>', methods=['DELETE'])
+async def delete_book(book_id: int):
+    """
+    Soft deletes a book.  See app.books.delete_book.
+    """
+    return await soft_delete_row('books', 'book', book_id)
+
+
+# endpoint: PATCH /books/:id/restore
+@async_blueprint.route('/books/<int:book_id>/restore', methods=['PATCH'])
+async def restore_book(book_id: int):
+    """
+    Restores a soft-deleted book.  See app.books.restore_book.
+    """
+    return await restore_row('books', 'book', book_id)
+
+
+# endpoint: POST /books/bulk-delete
+@async_blueprint.route('/books/bulk-delete', methods=['POST'])
+async def bulk_delete_books():
+    """
+    Soft deletes many books in one transaction.  See app.books.bulk_delete_books.
+    """
+    return await bulk_set_deleted('books', 'book', True)
+
+
+# endpoint: POST /books/bulk-restore
+@async_blueprint.route('/books/bulk-restore', methods=['POST'])
+async def bulk_restore_books():
+    """
+    Restores many soft-deleted books in one transaction.  See app.books.bulk_restore_books.
+    """
+    return await bulk_set_deleted('books', 'book', False)
+
+
+# endpoint: GET /authors
+@async_blueprint.route('/authors', methods=['GET'])
+async def get_authors():
+    """
+    Retrieve a page of authors, optionally filtered and sorted, or the
+    authors listed in ?ids=.  See app.authors.get_authors.
+    """
+    if 'ids' in request.args:
+        return await get_rows_by_ids('authors', 'author', 'authors', AUTHOR_COLUMNS, AUTHOR_FIELDS)
+    return await list_rows(AUTHOR_LIST, 'authors', AUTHOR_COLUMNS, AUTHOR_FIELDS)
+
+
+# endpoint: GET /authors/:id
+@async_blueprint.route('/authors/<int:author_id>', methods=['GET'])
+async def get_author(author_id: int):
+    """
+    Retrieves an author by ID.  See app.authors.get_author.
+    """
+    return await get_row('authors', 'author', author_id, AUTHOR_COLUMNS, AUTHOR_FIELDS)
+
+
+# endpoint: POST /authors
+@async_blueprint.route('/authors', methods=['POST'])
+async def create_author():
+    """
+    Creates a new author.  See app.authors.create_author.
+    """
+    data = await request.get_json()
+    if not data or 'name' not in data or 'email' not in data:
+        return jsonify({'error': 'Missing required fields'}), 400
+
+    try:
+        query = "INSERT INTO authors (name, email) VALUES (%s, %s)"
+        _, author_id = await execute_write(query, (data['name'], data['email']))
+        await cache_call('delete', cache_key('author', author_id))
+        return jsonify({'message': 'Author created successfully'}), 201
+    except Exception as e:
+        logger.error(f"Error creating author: {str(e)}")
+        return jsonify({'error': 'Database error'}), 500
+
+
+# endpoint: PUT /authors/:id
+@async_blueprint.route('/authors/<int:author_id>', methods=['PUT'])
+async def update_author(author_id: int):
+    """
+    Updates an existing author.  See app.authors.update_author.
+    """
+    data = await request.get_json()
+    if not data or 'name' not in data or 'email' not in data:
+        return jsonify({'error': 'Missing required fields'}), 400
+
+    try:
+        query = "UPDATE authors SET name = %s, email = %s WHERE id = %s"
+        updated, _ = await execute_write(query, (data['name'], data['email'], author_id))
+        if not updated:
+            return jsonify({'error': 'Author not found'}), 404
+        await cache_call('delete', cache_key('author', author_id))
+
+        return jsonify({'message': 'Author updated successfully', 'author': {
+            'id': author_id,
+            'name': data['name'],
+            'email': data['email']
+        }}), 200
+    except Exception as e:
+        logger.error(f"Error updating author {author_id}: {str(e)}")
+        return jsonify({'error': 'Database error'}), 500
+
+
+# endpoint: DELETE /authors/:id
+@async_blueprint.route('/authors/<int:author_id>', methods=['DELETE'])
+async def delete_author(author_id: int):
+    """
+    Soft deletes an author, and with ?cascade=books its live books.
+    See app.authors.delete_author.
+    """
+    cascade = request.args.get('cascade')
+    if cascade not in (None, 'books'):
+        return jsonify({'error': "Unsupported cascade; expected 'books'"}), 400
+    if not cascade:
+        return await soft_delete_row('authors', 'author', author_id)
+
+    try:
+        book_ids = []
+        async with transaction() as cursor:
+            await cursor.execute("UPDATE authors SET is_deleted = 1, deleted_at = NOW(6) "
+                                 "WHERE id = %s AND is_deleted = 0", (author_id,))
+            deleted = cursor.rowcount
+            if deleted:
+                await cursor.execute(LOCK_AUTHOR_BOOKS_SQL, (author_id,))
+                book_ids = [row[0] for row in await cursor.fetchall()]
+                if book_ids:
+                    await cursor.execute(DELETE_AUTHOR_BOOKS_SQL, (author_id,))
+                    await cursor.execute(*refresh_authors_sql([author_id]))
+        if not deleted:
+            return jsonify({'error': 'Author not found or already deleted'}), 404
+        await cache_call('delete', cache_key('author', author_id),
+                         *(cache_key('book', book_id) for book_id in book_ids))
+        return jsonify({'message': 'Author deleted successfully', 'books_deleted': len(book_ids)}), 200
+    except Exception as e:
+        logger.error(f"Error deleting author {author_id}: {str(e)}")
+        return jsonify({'error': 'Database error'}), 500
+
+
+# endpoint: PATCH /authors/:id/restore
+@async_blueprint.route('/authors/<int:author_id>/restore', methods=['PATCH'])
+async def restore_author(author_id: int):
+    """
+    Restores a soft-deleted author, and with ?cascade=books the books
+    deleted together with it.  See app.authors.restore_author.
+    """
+    cascade = request.args.get('cascade')
+    if cascade not in (None, 'books'):
+        return jsonify({'error': "Unsupported cascade; expected 'books'"}), 400
+    if not cascade:
+        return await restore_row('authors', 'author', author_id)
+
+    try:
+        async with transaction() as cursor:
+            # The books are matched on the author's deleted_at, so restore them first.
+            await cursor.execute(LOCK_DELETED_WITH_AUTHOR_SQL, (author_id,))
+            book_ids = [row[0] for row in await cursor.fetchall()]
+            if book_ids:
+                await cursor.execute(RESTORE_AUTHOR_BOOKS_SQL, (author_id,))
+                await cursor.execute(*refresh_authors_sql([author_id]))
+            await cursor.execute("UPDATE authors SET is_deleted = 0, deleted_at = NULL "
+                                 "WHERE id = %s AND is_deleted = 1", (author_id,))
+            restored = cursor.rowcount
+        if not restored:
+            row = await fetch_one("SELECT is_deleted FROM authors WHERE id = %s", (author_id,))
+            if not row:
+                return jsonify({'error': 'Author not found'}), 404
+            return jsonify({'error': 'Author is already active'}), 400
+        await cache_call('delete', cache_key('author', author_id),
+                         *(cache_key('book', book_id) for book_id in book_ids))
+        return jsonify({'message': 'Author restored successfully', 'books_restored': len(book_ids)}), 200
+    except Exception as e:
+        logger.error(f"Error restoring author {author_id}: {str(e)}")
+        return jsonify({'error': 'Database error'}), 500
+
+
+# endpoint: POST /authors/bulk-delete
+@async_blueprint.route('/authors/bulk-delete', methods=['POST'])
+async def bulk_delete_authors():
+    """
+    Soft deletes many authors in one transaction.  See app.authors.bulk_delete_authors.
+    """
+    return await bulk_set_deleted('authors', 'author', True)
+
+
+# endpoint: POST /authors/bulk-restore
+@async_blueprint.route('/authors/bulk-restore', methods=['POST'])
+async def bulk_restore_authors():
+    """
+    Restores many soft-deleted authors in one transaction.  See app.authors.bulk_restore_authors.
+    """
+    return await bulk_set_deleted('authors', 'author', False)
+
+
+def create_asgi_app(config_object=None) -> Quart:
+    """
+    ASGI application factory.
+
+    The aiomysql pool is opened when the server starts serving (inside each
+    worker process) and closed on shutdown.
+
+    Args:
+        config_object: Config class to load, or a dict of overrides applied
+            on top of the APP_ENV configuration.
+
+    Returns:
+        Quart: Configured ASGI application.
+    """
+    app = Quart(__name__)
+    if config_object is None or isinstance(config_object, dict):
+        app.config.from_object(config.get_config())
+        app.config.update(config_object or {})
+    else:
+        app.config.from_object(config_object)
+    app.extensions['cache'] = create_cache(app.config)
+
+    @app.before_serving
+    async def open_pool():
+        app.extensions['aio_pool'] = await aiomysql.create_pool(
+            host=app.config['MYSQL_HOST'],
+            user=app.config['MYSQL_USER'],
+            password=app.config['MYSQL_PASSWORD'],
+            db=app.config['MYSQL_DB'],
+            minsize=app.config['MYSQL_POOL_MIN_SIZE'],
+            maxsize=app.config['MYSQL_POOL_MAX_SIZE'],
+            pool_recycle=int(app.config['MYSQL_POOL_IDLE_TIMEOUT']),
+            autocommit=False,
+            # rowcount of an UPDATE counts matched rows, as in app/database.py
+            client_flag=CLIENT.FOUND_ROWS,
+            init_command="SET time_zone = '+00:00'",
+        )
+
+    @app.after_serving
+    async def close_pool():
+        pool = app.extensions.pop('aio_pool', None)
+        if pool is not None:
+            pool.close()
+            await pool.wait_closed()
+
+    app.register_blueprint(async_blueprint)
+    return app
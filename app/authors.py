@@ -65,31 +65,80 @@
 '''
     API Endpoints Summary
         POST /authors - Create author
-        GET /authors - Get all authors
-        GET /authors/:id - Get author by ID
+        GET /authors - Get authors (filtered, sorted, keyset paginated, or streamed as NDJSON)
+        GET /authors?ids=1,2,3 - Get many authors by ID
+        GET /authors/:id - Get author by ID (optionally with ?include=books,stats)
+        GET /authors/:id/books - Get an author's books (keyset paginated)
         PUT /authors/:id - Update author
-        DELETE /authors/:id - Soft-delete author
-        PATCH /authors/:id/restore - Restore soft-deleted author
+        DELETE /authors/:id - Soft-delete author (with ?cascade=books, its books too)
+        PATCH /authors/:id/restore - Restore soft-deleted author (with ?cascade=books, its books too)
+        POST /authors/bulk-delete - Soft-delete many authors in one transaction
+        POST /authors/bulk-restore - Restore many soft-deleted authors in one transaction
 '''
  
 from flask import Blueprint, jsonify, request
-from .database import db  
+from .bulk import bulk_set_deleted
+from .cache import cache_key, get_cache
+from .database import get_db
+from .etags import add_validators, collection_versions, is_not_modified, make_etag, not_modified
+from .fields import (AUTHOR_COLUMNS, AUTHOR_FIELDS, BOOK_COLUMNS, BOOK_FIELDS, FieldsError,
+                     column_list, get_fields, projector, select_columns)
+from .multiget import MultiGetError, fetch_by_ids, get_ids
+from .pagination import PaginationError, get_page_params, get_page_size, paginate
+from .query import AUTHOR_LIST, ListQuery, QueryError
+from .stats import fetch_author_stats, refresh_authors
+from .streaming import stream_rows, wants_stream
+from .suggest import suggest_discard, suggest_put, suggest_restore
 import logging
 
 authors_blueprint = Blueprint('authors', __name__)
 logger = logging.getLogger(__name__)
 
+# Statements of the ?cascade=books delete and restore, shared with app.asgi.
+# Each takes the author's ID as its only parameter.
+LOCK_AUTHOR_BOOKS_SQL = "SELECT id FROM books WHERE author_id = %s AND is_deleted = 0 FOR UPDATE"
+DELETE_AUTHOR_BOOKS_SQL = """
+    UPDATE books b JOIN authors a ON a.id = b.author_id
+    SET b.is_deleted = 1, b.deleted_at = a.deleted_at
+    WHERE b.author_id = %s AND b.is_deleted = 0
+"""
+LOCK_DELETED_WITH_AUTHOR_SQL = """
+    SELECT b.id FROM books b JOIN authors a ON a.id = b.author_id
+    WHERE b.author_id = %s AND a.is_deleted = 1 AND b.is_deleted = 1 AND b.deleted_at = a.deleted_at
+    FOR UPDATE
+"""
+RESTORE_AUTHOR_BOOKS_SQL = """
+    UPDATE books b JOIN authors a ON a.id = b.author_id
+    SET b.is_deleted = 0, b.deleted_at = NULL
+    WHERE b.author_id = %s AND a.is_deleted = 1 AND b.is_deleted = 1 AND b.deleted_at = a.deleted_at
+"""
+
 # endpoint: GET /authors
 @authors_blueprint.route('/authors', methods=['GET'])
 def get_authors() -> dict:
     """
-    Retrieve a list of authors.
+    Retrieve a page of authors, optionally filtered and sorted (by ID by default).
+
+    Query Parameters:
+        limit (int): Page size (default DEFAULT_PAGE_SIZE, capped at MAX_PAGE_SIZE).
+        after_id (int): Only return authors with a greater ID (default sort only).
+        cursor (str): "next_cursor" value from the previous page.
+        email_domain (str): Only authors whose email is at this domain.
+        sort (str): Comma-separated sort keys among id, name and email;
+            "-" sorts descending (default "id").
+        ids (str): Comma-separated IDs; returns exactly those authors
+            (see get_authors_by_ids) and ignores every other parameter but fields.
+        fields (str): Comma-separated subset of fields; rows become objects.
+        stream (bool): Stream every author after the start position as NDJSON
+            instead of one page; also selected by "Accept: application/x-ndjson".
 
     Returns:
-        dict: A dictionary containing a list of authors.
+        dict: A dictionary containing a page of authors and the next cursor.
 
     API Response:
         200 OK - List of authors retrieved successfully.
+        304 Not Modified - No author changed since the ETag in If-None-Match.
+        400 Bad Request - Invalid paging, filter or sort parameters, or unknown field.
         500 Internal Server Error - Database error occurred.
 
     Response Schema:
@@ -100,48 +149,242 @@ def get_authors() -> dict:
                     "name": str,
                     "email": str
                 }
-            ]
+            ],
+            "next_cursor": str | null
         }
     """
+    if 'ids' in request.args:
+        return get_authors_by_ids()
+
     try:
+        limit = get_page_size()
+        listing = ListQuery(AUTHOR_LIST, request.args)
+        fields = get_fields(AUTHOR_FIELDS)
+    except (PaginationError, QueryError, FieldsError) as e:
+        return jsonify({'error': str(e)}), 400
+    columns = listing.columns(select_columns(fields, AUTHOR_COLUMNS))
+    shape = projector(columns, fields)
+
+    try:
+        db = get_db()
         cursor = db.cursor()
-        query = "SELECT * FROM authors WHERE is_deleted = 0"
-        cursor.execute(query)
+        stream = wants_stream()
+        (version,), settled = collection_versions(cursor, 'authors')
+        etag = make_etag('authors', version, stream, request.query_string) if settled else None
+        if is_not_modified(etag, version):
+            cursor.close()
+            return not_modified(etag, version)
+
+        if stream:
+            cursor.close()
+            query, params = listing.sql(columns)
+            return add_validators(stream_rows(query, params, shape), etag, version)
+
+        query, params = listing.sql(columns, limit)
+        cursor.execute(query, params)
         authors = cursor.fetchall()
         cursor.close()
-        return jsonify({'authors': authors})
+        authors, next_cursor = listing.paginate(authors, limit, columns)
+        response = jsonify({'authors': [shape(author) for author in authors], 'next_cursor': next_cursor})
+        return add_validators(response, etag, version)
     except Exception as e:
         logger.error(f"Error fetching authors: {str(e)}")
         return jsonify({'error': 'Database error'}), 500
 
 
+def get_authors_by_ids() -> dict:
+    """
+    Retrieves the live authors with the IDs listed in ?ids=, in request order.
+
+    Rows come from the single-item cache where possible; the rest are read
+    with chunked "id IN (...)" queries (see app.multiget).
+
+    Returns:
+        dict: JSON response with the authors found and the IDs that were not.
+
+    API Response:
+        200 OK - Lookup done (possibly with every ID missing).
+        400 Bad Request - Invalid or too many IDs, or unknown field.
+        500 Internal Server Error - Database error occurred.
+
+    Response Schema:
+        {
+            "authors": [...],
+            "missing": [int]
+        }
+    """
+    try:
+        ids = get_ids()
+        fields = get_fields(AUTHOR_FIELDS)
+    except (MultiGetError, FieldsError) as e:
+        return jsonify({'error': str(e)}), 400
+
+    try:
+        rows = fetch_by_ids('authors', 'author', AUTHOR_COLUMNS, ids)
+    except Exception as e:
+        logger.error(f"Error fetching authors by id: {str(e)}")
+        return jsonify({'error': 'Database error'}), 500
+    shape = projector(AUTHOR_COLUMNS, fields)
+    return jsonify({'authors': [shape(rows[item_id][:-1]) for item_id in ids if item_id in rows],
+                    'missing': [item_id for item_id in ids if item_id not in rows]})
+
+
 # New route: GET /authors/:id
 @authors_blueprint.route('/authors/<int:author_id>', methods=['GET'])
 def get_author(author_id: int) -> dict:
     """
-    Retrieves an author by ID.
+    Retrieves an author by ID, served from the cache when possible.
+
+    Without ?include, responds 304 Not Modified when If-None-Match /
+    If-Modified-Since show the client already holds the current version.
 
     Args:
         author_id (int): Author's ID.
 
+    Query Parameters:
+        fields (str): Comma-separated subset of author fields; the author becomes an object.
+        include (str): Comma-separated; 'books' adds the first page of the
+            author's books, paged with limit / after_id / cursor like
+            GET /authors/:id/books, and 'stats' the author's book count, live
+            book count and first / last publication date (one row of author_stats).
+
     Returns:
         dict: JSON response with author details or error.
     """
     try:
-        cursor = db.cursor()
-        query = "SELECT * FROM authors WHERE id = %s AND is_deleted = 0"
-        cursor.execute(query, (author_id,))
-        author = cursor.fetchone()
-        cursor.close()
-        if author:
-            return jsonify({'author': author})
-        else:
+        fields = get_fields(AUTHOR_FIELDS)
+    except FieldsError as e:
+        return jsonify({'error': str(e)}), 400
+    include = set(filter(None, request.args.get('include', '').split(',')))
+    if include - {'books', 'stats'}:
+        return jsonify({'error': "Unsupported include; expected 'books' or 'stats'"}), 400
+    if 'books' in include:
+        try:
+            limit, after_id = get_page_params()
+        except PaginationError as e:
+            return jsonify({'error': str(e)}), 400
+
+    try:
+        cache = get_cache()
+        key = cache_key('author', author_id)
+        author = cache.get(key)
+        if author is None:
+            db = get_db()
+            cursor = db.cursor()
+            query = f"SELECT {column_list(AUTHOR_COLUMNS + ('updated_at',))} FROM authors WHERE id = %s AND is_deleted = 0"
+            cursor.execute(query, (author_id,))
+            author = cursor.fetchone()
+            cursor.close()
+            if author:
+                cache.set(key, author)
+        if not author:
             return jsonify({'error': 'Author not found'}), 404
+
+        author, version = author[:-1], author[-1]
+        if not include:
+            etag = make_etag('author', author_id, version, request.query_string)
+            if is_not_modified(etag, version):
+                return not_modified(etag, version)
+            return add_validators(jsonify({'author': projector(AUTHOR_COLUMNS, fields)(author)}), etag, version)
+
+        body = {'author': projector(AUTHOR_COLUMNS, fields)(author)}
+        cursor = get_db().cursor()
+        if 'books' in include:
+            _, books = fetch_author_books(cursor, author_id, after_id, limit)
+            body['books'], body['books_next_cursor'] = paginate(books, limit)
+        if 'stats' in include:
+            body['stats'] = fetch_author_stats(cursor, author_id)
+        cursor.close()
+        return jsonify(body)
     except Exception as e:
         logger.error(f"Error fetching author {author_id}: {str(e)}")
         return jsonify({'error': 'Database error'}), 500
 
 
+# endpoint: GET /authors/:id/books
+@authors_blueprint.route('/authors/<int:author_id>/books', methods=['GET'])
+def get_author_books(author_id: int) -> dict:
+    """
+    Retrieves a page of an author's live books, ordered by ID.
+
+    Args:
+        author_id (int): Author's ID.
+
+    Query Parameters:
+        limit (int): Page size (default DEFAULT_PAGE_SIZE, capped at MAX_PAGE_SIZE).
+        after_id (int): Only return books with a greater ID.
+        cursor (str): "next_cursor" value from the previous page.
+        fields (str): Comma-separated subset of book fields; books become objects.
+
+    Returns:
+        dict: JSON response with a page of books or error.
+
+    API Response:
+        200 OK - Books retrieved successfully (possibly an empty page).
+        304 Not Modified - No book or author changed since the ETag in If-None-Match.
+        400 Bad Request - Invalid paging parameters or unknown field.
+        404 Not Found - Author does not exist or is deleted.
+        500 Internal Server Error - Database error occurred.
+    """
+    try:
+        limit, after_id = get_page_params()
+        fields = get_fields(BOOK_FIELDS)
+    except (PaginationError, FieldsError) as e:
+        return jsonify({'error': str(e)}), 400
+    columns = select_columns(fields, BOOK_COLUMNS)
+    shape = projector(columns, fields)
+
+    try:
+        cursor = get_db().cursor()
+        versions, settled = collection_versions(cursor, 'books', 'authors')
+        etag = make_etag('author-books', author_id, *versions, request.query_string) if settled else None
+        if is_not_modified(etag):
+            cursor.close()
+            return not_modified(etag)
+
+        found, books = fetch_author_books(cursor, author_id, after_id, limit, columns)
+        cursor.close()
+        if not found:
+            return jsonify({'error': 'Author not found'}), 404
+        books, next_cursor = paginate(books, limit)
+        response = jsonify({'books': [shape(book) for book in books], 'next_cursor': next_cursor})
+        return add_validators(response, etag)
+    except Exception as e:
+        logger.error(f"Error fetching books of author {author_id}: {str(e)}")
+        return jsonify({'error': 'Database error'}), 500
+
+
+def fetch_author_books(cursor, author_id: int, after_id: int, limit: int,
+                       columns: tuple = BOOK_COLUMNS) -> tuple:
+    """
+    Reads up to limit + 1 live books of a live author in one round trip.
+
+    The author row is joined as a constant table, so the books side is a
+    range scan on idx_books_author_live (author_id, is_deleted, id) with no
+    sort.  An author without books yields a single all-NULL books row,
+    which tells "no books" apart from "no author".
+
+    Args:
+        cursor: Database cursor.
+        author_id (int): Author's ID.
+        after_id (int): Only return books with a greater ID.
+        limit (int): Page size.
+        columns (tuple): Book columns to read; 'id' must come first.
+
+    Returns:
+        tuple: (author found, list of book rows)
+    """
+    query = (
+        f"SELECT {column_list(columns, 'b')} FROM authors a "
+        "LEFT JOIN books b ON b.author_id = a.id AND b.is_deleted = 0 AND b.id > %s "
+        "WHERE a.id = %s AND a.is_deleted = 0 "
+        "ORDER BY b.id LIMIT %s"
+    )
+    cursor.execute(query, (after_id, author_id, limit + 1))
+    rows = cursor.fetchall()
+    return bool(rows), [row for row in rows if row[0] is not None]
+
+
 # endpoint: POST /authors 
 @authors_blueprint.route('/authors', methods=['POST'])
 def create_author() -> dict:
@@ -156,10 +399,13 @@ def create_author() -> dict:
         return jsonify({'error': 'Missing required fields'}), 400
 
     try:
+        db = get_db()
         cursor = db.cursor()
         query = "INSERT INTO authors (name, email) VALUES (%s, %s)"
         cursor.execute(query, (data['name'], data['email']))
         db.commit()
+        get_cache().delete(cache_key('author', cursor.lastrowid))
+        suggest_put('author', cursor.lastrowid, data['name'])
         cursor.close()
         return jsonify({'message': 'Author created successfully'}), 201
     except Exception as e:
@@ -184,29 +430,27 @@ def update_author(author_id: int) -> dict:
         return jsonify({'error': 'Missing required fields'}), 400
 
     try:
+        db = get_db()
         cursor = db.cursor()
-        query = "SELECT * FROM authors WHERE id = %s"
-        cursor.execute(query, (author_id,))
-        author = cursor.fetchone()
-
-        if not author:
-            return jsonify({'error': 'Author not found'}), 404
-
+        cursor.execute("SELECT is_deleted FROM authors WHERE id = %s FOR UPDATE", (author_id,))
+        previous = cursor.fetchone()
         query = "UPDATE authors SET name = %s, email = %s WHERE id = %s"
         cursor.execute(query, (data['name'], data['email'], author_id))
+        updated = cursor.rowcount
         db.commit()
         cursor.close()
 
-        query = "SELECT * FROM authors WHERE id = %s"
-        cursor = db.cursor()
-        cursor.execute(query, (author_id,))
-        updated_author = cursor.fetchone()
-        cursor.close()
+        if not updated:
+            return jsonify({'error': 'Author not found'}), 404
+        get_cache().delete(cache_key('author', author_id))
+        # A soft-deleted author keeps its new name out of the suggestions until restored
+        if not previous[0]:
+            suggest_put('author', author_id, data['name'])
 
         return jsonify({'message': 'Author updated successfully', 'author': {
-            'id': updated_author[0],
-            'name': updated_author[1],
-            'email': updated_author[2]
+            'id': author_id,
+            'name': data['name'],
+            'email': data['email']
         }}), 200
     except Exception as e:
         logger.error(f"Error updating author {author_id}: {str(e)}")
@@ -218,28 +462,45 @@ def update_author(author_id: int) -> dict:
 @authors_blueprint.route('/authors/<int:author_id>', methods=['DELETE'])
 def delete_author(author_id: int) -> dict:
     """
-    Soft deletes an author.
+    Soft deletes an author, and with ?cascade=books all of its live books.
+
+    The cascade runs in the same transaction as the author's UPDATE and
+    stamps the books with the author's deleted_at, so a cascading restore
+    can later bring back exactly these books.
 
     Args:
         author_id (int): Author's ID.
 
+    Query Parameters:
+        cascade (str): 'books' also soft-deletes the author's books.
+
     Returns:
-        dict: JSON response with success message or error.
+        dict: JSON response with success message (and books_deleted when
+        cascading) or error.
     """
+    cascade = request.args.get('cascade')
+    if cascade not in (None, 'books'):
+        return jsonify({'error': "Unsupported cascade; expected 'books'"}), 400
+
     try:
+        db = get_db()
         cursor = db.cursor()
-        query = "SELECT * FROM authors WHERE id = %s AND is_deleted = 0"
-        cursor.execute(query, (author_id,))
-        author = cursor.fetchone()
-
-        if not author:
-            return jsonify({'error': 'Author not found or already deleted'}), 404
-
-        query = "UPDATE authors SET is_deleted = 1 WHERE id = %s"
+        query = "UPDATE authors SET is_deleted = 1, deleted_at = NOW(6) WHERE id = %s AND is_deleted = 0"
         cursor.execute(query, (author_id,))
+        deleted = cursor.rowcount
+        book_ids = delete_author_books(cursor, author_id) if deleted and cascade else []
         db.commit()
         cursor.close()
 
+        if not deleted:
+            return jsonify({'error': 'Author not found or already deleted'}), 404
+        get_cache().delete(cache_key('author', author_id), *(cache_key('book', book_id) for book_id in book_ids))
+        suggest_discard('author', author_id)
+        for book_id in book_ids:
+            suggest_discard('book', book_id)
+
+        if cascade:
+            return jsonify({'message': 'Author deleted successfully', 'books_deleted': len(book_ids)}), 200
         return jsonify({'message': 'Author deleted successfully'}), 200
     except Exception as e:
         logger.error(f"Error deleting author {author_id}: {str(e)}")
@@ -250,34 +511,143 @@ def delete_author(author_id: int) -> dict:
 @authors_blueprint.route('/authors/<int:author_id>/restore', methods=['PATCH'])
 def restore_author(author_id: int) -> dict:
     """
-    Restores a soft-deleted author.
+    Restores a soft-deleted author, and with ?cascade=books the books
+    deleted together with it by DELETE /authors/:id?cascade=books.
+
+    Books that were deleted on their own keep their own deleted_at and
+    stay deleted.
 
     Args:
         author_id (int): Author's ID.
 
+    Query Parameters:
+        cascade (str): 'books' also restores the books deleted with the author.
+
     Returns:
-        dict: JSON response with success message or error.
+        dict: JSON response with success message (and books_restored when
+        cascading) or error.
     """
+    cascade = request.args.get('cascade')
+    if cascade not in (None, 'books'):
+        return jsonify({'error': "Unsupported cascade; expected 'books'"}), 400
+
     try:
+        db = get_db()
         cursor = db.cursor()
-        query = "SELECT * FROM authors WHERE id = %s"
+        # The books are matched on the author's deleted_at, so restore them first.
+        book_ids = restore_author_books(cursor, author_id) if cascade else []
+        query = "UPDATE authors SET is_deleted = 0, deleted_at = NULL WHERE id = %s AND is_deleted = 1"
         cursor.execute(query, (author_id,))
-        author = cursor.fetchone()
-
-        if not author:
-            return jsonify({'error': 'Author not found'}), 404
+        restored = cursor.rowcount
+        db.commit()
 
-        if author[3] == 0:  # Check if author is already active
+        if not restored:
+            # Only the failure path needs a read, to tell "missing" from "already active"
+            cursor.execute("SELECT is_deleted FROM authors WHERE id = %s", (author_id,))
+            author = cursor.fetchone()
+            cursor.close()
+            if not author:
+                return jsonify({'error': 'Author not found'}), 404
             return jsonify({'error': 'Author is already active'}), 400
-
-        query = "UPDATE authors SET is_deleted = 0 WHERE id = %s"
-        cursor.execute(query, (author_id,))
-        db.commit()
         cursor.close()
+        get_cache().delete(cache_key('author', author_id), *(cache_key('book', book_id) for book_id in book_ids))
+        suggest_restore('author', author_id)
+        for book_id in book_ids:
+            suggest_restore('book', book_id)
 
+        if cascade:
+            return jsonify({'message': 'Author restored successfully', 'books_restored': len(book_ids)}), 200
         return jsonify({'message': 'Author restored successfully'}), 200
     except Exception as e:
         logger.error(f"Error restoring author {author_id}: {str(e)}")
         return jsonify({'error': 'Database error'}), 500
-        
-        
\ No newline at end of file
+
+
+def delete_author_books(cursor, author_id: int) -> list:
+    """
+    Soft deletes the live books of an author whose row was just soft-deleted.
+
+    Runs inside the caller's transaction.  Both statements are range scans
+    of idx_books_author_live (author_id, is_deleted, id).
+
+    Args:
+        cursor: Database cursor.
+        author_id (int): Author's ID.
+
+    Returns:
+        list: IDs of the books deleted.
+    """
+    cursor.execute(LOCK_AUTHOR_BOOKS_SQL, (author_id,))
+    book_ids = [row[0] for row in cursor.fetchall()]
+    if book_ids:
+        cursor.execute(DELETE_AUTHOR_BOOKS_SQL, (author_id,))
+        refresh_authors(cursor, [author_id])
+    return book_ids
+
+
+def restore_author_books(cursor, author_id: int) -> list:
+    """
+    Restores the books soft-deleted together with a still-deleted author.
+
+    Runs inside the caller's transaction, before the author's own restore.
+
+    Args:
+        cursor: Database cursor.
+        author_id (int): Author's ID.
+
+    Returns:
+        list: IDs of the books restored; empty when the author is not deleted.
+    """
+    cursor.execute(LOCK_DELETED_WITH_AUTHOR_SQL, (author_id,))
+    book_ids = [row[0] for row in cursor.fetchall()]
+    if book_ids:
+        cursor.execute(RESTORE_AUTHOR_BOOKS_SQL, (author_id,))
+        refresh_authors(cursor, [author_id])
+    return book_ids
+
+
+# endpoint: POST /authors/bulk-delete
+@authors_blueprint.route('/authors/bulk-delete', methods=['POST'])
+def bulk_delete_authors() -> dict:
+    """
+    Soft deletes many authors in one transaction (see app.bulk).
+
+    Request Body:
+        {"ids": [int, ...]} - at most BATCH_MAX_ROWS distinct IDs.
+
+    Returns:
+        dict: JSON response listing which IDs changed state.
+
+    API Response:
+        200 OK - Done; IDs already deleted are "unchanged", unknown IDs "missing".
+        400 Bad Request - Body is not an object with a non-empty list of IDs.
+        500 Internal Server Error - Database error occurred; nothing was changed.
+
+    Response Schema:
+        {
+            "changed": [int],
+            "unchanged": [int],
+            "missing": [int]
+        }
+    """
+    return bulk_set_deleted('authors', 'author', True)
+
+
+# endpoint: POST /authors/bulk-restore
+@authors_blueprint.route('/authors/bulk-restore', methods=['POST'])
+def bulk_restore_authors() -> dict:
+    """
+    Restores many soft-deleted authors in one transaction (see app.bulk).
+
+    Request Body:
+        {"ids": [int, ...]} - at most BATCH_MAX_ROWS distinct IDs.
+
+    Returns:
+        dict: JSON response listing which IDs changed state.
+
+    API Response:
+        200 OK - Done; IDs already active are "unchanged", unknown IDs "missing".
+        400 Bad Request - Body is not an object with a non-empty list of IDs.
+        500 Internal Server Error - Database error occurred; nothing was changed.
+    """
+    return bulk_set_deleted('authors', 'author', False)
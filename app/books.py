@@ -65,15 +65,32 @@
 '''
     API Endpoints Summary
         POST /books - Create book
-        GET /books - Get all books
+        POST /books/batch - Create many books in chunked transactions
+        GET /books - Get books (filtered, sorted, keyset paginated, or streamed as NDJSON)
+        GET /books?ids=1,2,3 - Get many books by ID
+        GET /books/search - Full-text search on titles, ranked by relevance
         GET /books/:id - Get book by ID
         PUT /books/:id - Update book
         DELETE /books/:id - Soft-delete book
         PATCH /books/:id/restore - Restore soft-deleted book
+        POST /books/bulk-delete - Soft-delete many books in one transaction
+        POST /books/bulk-restore - Restore many soft-deleted books in one transaction
 '''
  
-from flask import Blueprint, jsonify, request
-from .database import db  
+from flask import Blueprint, current_app, jsonify, request
+from .bulk import bulk_set_deleted
+from .cache import cache_key, get_cache
+from .database import get_db
+from .etags import add_validators, collection_versions, is_not_modified, make_etag, not_modified
+from .fields import BOOK_COLUMNS, BOOK_FIELDS, FieldsError, column_list, get_fields, projector, select_columns
+from .multiget import MultiGetError, fetch_by_ids, get_ids
+from .pagination import PaginationError, get_page_size
+from .query import BOOK_LIST, ListQuery, QueryError
+from .search import SearchError, get_search_params, next_search_cursor
+from .stats import add_books, refresh_authors, refresh_book_authors
+from .streaming import NDJSON_MIMETYPE, stream_rows, wants_stream
+from .suggest import suggest_discard, suggest_put, suggest_restore
+import json
 import logging
 
 books_blueprint = Blueprint('books', __name__)
@@ -83,13 +100,31 @@ logger = logging.getLogger(__name__)
 @books_blueprint.route('/books', methods=['GET'])
 def get_books() -> dict:
     """
-    Retrieve a list of books.
+    Retrieve a page of books, optionally filtered and sorted (by ID by default).
+
+    Query Parameters:
+        limit (int): Page size (default DEFAULT_PAGE_SIZE, capped at MAX_PAGE_SIZE).
+        after_id (int): Only return books with a greater ID (default sort only).
+        cursor (str): "next_cursor" value from the previous page.
+        author_id (int): Only books by this author.
+        published_after (date): Only books published after this day (YYYY-MM-DD).
+        published_before (date): Only books published before this day.
+        title_prefix (str): Only books whose title starts with this text.
+        sort (str): Comma-separated sort keys among id, title, author_id and
+            publication_date; "-" sorts descending (default "id").
+        ids (str): Comma-separated IDs; returns exactly those books
+            (see get_books_by_ids) and ignores every other parameter but fields.
+        fields (str): Comma-separated subset of fields; rows become objects.
+        stream (bool): Stream every book after the start position as NDJSON
+            instead of one page; also selected by "Accept: application/x-ndjson".
 
     Returns:
-        dict: A dictionary containing a list of books.
+        dict: A dictionary containing a page of books and the next cursor.
 
     API Response:
         200 OK - List of books retrieved successfully.
+        304 Not Modified - No book changed since the ETag in If-None-Match.
+        400 Bad Request - Invalid paging, filter or sort parameters, or unknown field.
         500 Internal Server Error - Database error occurred.
 
     Response Schema:
@@ -101,43 +136,204 @@ def get_books() -> dict:
                     "author_id": int,
                     "publication_date": str
                 }
-            ]
+            ],
+            "next_cursor": str | null
         }
     """
+    if 'ids' in request.args:
+        return get_books_by_ids()
+
+    try:
+        limit = get_page_size()
+        listing = ListQuery(BOOK_LIST, request.args)
+        fields = get_fields(BOOK_FIELDS)
+    except (PaginationError, QueryError, FieldsError) as e:
+        return jsonify({'error': str(e)}), 400
+    columns = listing.columns(select_columns(fields, BOOK_COLUMNS))
+    shape = projector(columns, fields)
+
     try:
+        db = get_db()
         cursor = db.cursor()
-        query = "SELECT * FROM books WHERE is_deleted = 0"
-        cursor.execute(query)
+        stream = wants_stream()
+        (version,), settled = collection_versions(cursor, 'books')
+        etag = make_etag('books', version, stream, request.query_string) if settled else None
+        if is_not_modified(etag, version):
+            cursor.close()
+            return not_modified(etag, version)
+
+        if stream:
+            cursor.close()
+            query, params = listing.sql(columns)
+            return add_validators(stream_rows(query, params, shape), etag, version)
+
+        query, params = listing.sql(columns, limit)
+        cursor.execute(query, params)
         books = cursor.fetchall()
         cursor.close()
-        return jsonify({'books': books})
+        books, next_cursor = listing.paginate(books, limit, columns)
+        response = jsonify({'books': [shape(book) for book in books], 'next_cursor': next_cursor})
+        return add_validators(response, etag, version)
     except Exception as e:
         logger.error(f"Error fetching books: {str(e)}")
         return jsonify({'error': 'Database error'}), 500
 
 
+def get_books_by_ids() -> dict:
+    """
+    Retrieves the live books with the IDs listed in ?ids=, in request order.
+
+    Rows come from the single-item cache where possible; the rest are read
+    with chunked "id IN (...)" queries (see app.multiget).
+
+    Returns:
+        dict: JSON response with the books found and the IDs that were not.
+
+    API Response:
+        200 OK - Lookup done (possibly with every ID missing).
+        400 Bad Request - Invalid or too many IDs, or unknown field.
+        500 Internal Server Error - Database error occurred.
+
+    Response Schema:
+        {
+            "books": [...],
+            "missing": [int]
+        }
+    """
+    try:
+        ids = get_ids()
+        fields = get_fields(BOOK_FIELDS)
+    except (MultiGetError, FieldsError) as e:
+        return jsonify({'error': str(e)}), 400
+
+    try:
+        rows = fetch_by_ids('books', 'book', BOOK_COLUMNS, ids)
+    except Exception as e:
+        logger.error(f"Error fetching books by id: {str(e)}")
+        return jsonify({'error': 'Database error'}), 500
+    shape = projector(BOOK_COLUMNS, fields)
+    return jsonify({'books': [shape(rows[item_id][:-1]) for item_id in ids if item_id in rows],
+                    'missing': [item_id for item_id in ids if item_id not in rows]})
+
+
+# endpoint: GET /books/search
+@books_blueprint.route('/books/search', methods=['GET'])
+def search_books() -> dict:
+    """
+    Search live books by title, best matches first.
+
+    Every word of q must match the start of a word in the title.  Matches
+    are ranked on the FULLTEXT index of books.title; the author's name is
+    joined onto the page only.
+
+    Query Parameters:
+        q (str): Search text.
+        limit (int): Page size (default SEARCH_PAGE_SIZE, capped at MAX_PAGE_SIZE).
+        cursor (str): "next_cursor" value from the previous page.
+
+    Returns:
+        dict: A dictionary containing a page of matches and the next cursor.
+
+    API Response:
+        200 OK - Matches retrieved successfully (possibly none).
+        400 Bad Request - Missing search text or invalid paging parameters.
+        500 Internal Server Error - Database error occurred.
+
+    Response Schema:
+        {
+            "books": [
+                {
+                    "id": int,
+                    "title": str,
+                    "author_id": int,
+                    "author_name": str,
+                    "publication_date": str,
+                    "score": float
+                }
+            ],
+            "next_cursor": str | null
+        }
+    """
+    try:
+        match, limit, offset = get_search_params()
+    except (SearchError, PaginationError) as e:
+        return jsonify({'error': str(e)}), 400
+    max_results = current_app.config['SEARCH_MAX_RESULTS']
+    limit = min(limit, max(max_results - offset, 0))
+    if limit == 0:
+        return jsonify({'books': [], 'next_cursor': None})
+
+    try:
+        db = get_db()
+        cursor = db.cursor()
+        # Rank on the index alone, then join the page to its columns and author.
+        query = """
+            SELECT b.id, b.title, b.author_id, a.name, b.publication_date, m.score
+            FROM (SELECT id, MATCH (title) AGAINST (%s IN BOOLEAN MODE) AS score
+                  FROM books
+                  WHERE MATCH (title) AGAINST (%s IN BOOLEAN MODE) AND is_deleted = 0
+                  ORDER BY score DESC, id
+                  LIMIT %s, %s) AS m
+            JOIN books b ON b.id = m.id
+            LEFT JOIN authors a ON a.id = b.author_id
+            ORDER BY m.score DESC, m.id
+        """
+        cursor.execute(query, (match, match, offset, limit + 1))
+        rows = cursor.fetchall()
+        cursor.close()
+        rows, next_cursor = next_search_cursor(rows, limit, offset, max_results)
+        books = [{'id': row[0], 'title': row[1], 'author_id': row[2], 'author_name': row[3],
+                  'publication_date': row[4], 'score': round(float(row[5]), 6)} for row in rows]
+        return jsonify({'books': books, 'next_cursor': next_cursor})
+    except Exception as e:
+        logger.error(f"Error searching books: {str(e)}")
+        return jsonify({'error': 'Database error'}), 500
+
+
 # New route: GET /books/:id
 @books_blueprint.route('/books/<int:book_id>', methods=['GET'])
 def get_book(book_id: int) -> dict:
     """
-    Retrieves a book by ID.
+    Retrieves a book by ID, served from the cache when possible.
+
+    Responds 304 Not Modified when If-None-Match / If-Modified-Since show
+    the client already holds the current version.
 
     Args:
         book_id (int): Book's ID.
 
+    Query Parameters:
+        fields (str): Comma-separated subset of fields; the book becomes an object.
+
     Returns:
         dict: JSON response with book details or error.
     """
     try:
-        cursor = db.cursor()
-        query = "SELECT * FROM books WHERE id = %s AND is_deleted = 0"
-        cursor.execute(query, (book_id,))
-        book = cursor.fetchone()
-        cursor.close()
-        if book:
-            return jsonify({'book': book})
-        else:
+        fields = get_fields(BOOK_FIELDS)
+    except FieldsError as e:
+        return jsonify({'error': str(e)}), 400
+
+    try:
+        cache = get_cache()
+        key = cache_key('book', book_id)
+        book = cache.get(key)
+        if book is None:
+            db = get_db()
+            cursor = db.cursor()
+            query = f"SELECT {column_list(BOOK_COLUMNS + ('updated_at',))} FROM books WHERE id = %s AND is_deleted = 0"
+            cursor.execute(query, (book_id,))
+            book = cursor.fetchone()
+            cursor.close()
+            if book:
+                cache.set(key, book)
+        if not book:
             return jsonify({'error': 'Book not found'}), 404
+
+        book, version = book[:-1], book[-1]
+        etag = make_etag('book', book_id, version, request.query_string)
+        if is_not_modified(etag, version):
+            return not_modified(etag, version)
+        return add_validators(jsonify({'book': projector(BOOK_COLUMNS, fields)(book)}), etag, version)
     except Exception as e:
         logger.error(f"Error fetching book {book_id}: {str(e)}")
         return jsonify({'error': 'Database error'}), 500
@@ -157,10 +353,15 @@ def create_book() -> dict:
         return jsonify({'error': 'Missing required fields'}), 400
 
     try:
+        db = get_db()
         cursor = db.cursor()
         query = "INSERT INTO books (title, author_id, publication_date) VALUES (%s, %s, %s)"
         cursor.execute(query, (data['title'], data['author_id'], data['publication_date']))
+        book_id = cursor.lastrowid
+        add_books(cursor, book_id, book_id)
         db.commit()
+        get_cache().delete(cache_key('book', book_id))
+        suggest_put('book', book_id, data['title'])
         cursor.close()
         return jsonify({'message': 'Book created successfully'}), 201
     except Exception as e:
@@ -168,6 +369,98 @@ def create_book() -> dict:
         return jsonify({'error': 'Database error'}), 500
 
 
+# endpoint: POST /books/batch
+@books_blueprint.route('/books/batch', methods=['POST'])
+def create_books_batch() -> dict:
+    """
+    Creates many books in chunked multi-row INSERTs.
+
+    The body is a JSON array of book objects, or NDJSON (one book object per
+    line) when sent as application/x-ndjson.  Every row is validated first;
+    valid rows are inserted BATCH_CHUNK_SIZE at a time, each chunk in its
+    own transaction.  A chunk that fails is rolled back and all its rows
+    are reported as errors.
+
+    Generated IDs are derived from the first insert ID of each chunk, which
+    relies on InnoDB assigning consecutive IDs to a single multi-row INSERT.
+
+    Returns:
+        dict: JSON response with one result per input row.
+
+    API Response:
+        201 Created - Every row was created.
+        207 Multi-Status - Some rows failed; see "results".
+        400 Bad Request - Body is not a non-empty list or exceeds BATCH_MAX_ROWS.
+
+    Response Schema:
+        {
+            "created": int,
+            "failed": int,
+            "results": [
+                {"index": int, "status": "created", "id": int}
+                | {"index": int, "status": "error", "error": str}
+            ]
+        }
+    """
+    if request.mimetype == NDJSON_MIMETYPE:
+        items = []
+        for line in request.get_data(as_text=True).splitlines():
+            if line.strip():
+                try:
+                    items.append(json.loads(line))
+                except ValueError:
+                    items.append(None)
+    else:
+        items = request.get_json(silent=True)
+
+    if not isinstance(items, list) or not items:
+        return jsonify({'error': 'Request body must be a non-empty list of books'}), 400
+    if len(items) > current_app.config['BATCH_MAX_ROWS']:
+        return jsonify({'error': f"At most {current_app.config['BATCH_MAX_ROWS']} books per batch"}), 400
+
+    results = [None] * len(items)
+    rows = []
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            results[index] = {'index': index, 'status': 'error', 'error': 'Invalid book'}
+        elif 'title' not in item or 'author_id' not in item or 'publication_date' not in item:
+            results[index] = {'index': index, 'status': 'error', 'error': 'Missing required fields'}
+        else:
+            rows.append((index, (item['title'], item['author_id'], item['publication_date'])))
+
+    chunk_size = current_app.config['BATCH_CHUNK_SIZE']
+    query = "INSERT INTO books (title, author_id, publication_date) VALUES (%s, %s, %s)"
+    try:
+        db = get_db()
+    except Exception as e:
+        logger.error(f"Error creating books: {str(e)}")
+        return jsonify({'error': 'Database error'}), 500
+
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        try:
+            cursor = db.cursor()
+            # executemany() rewrites this into a single multi-row INSERT
+            cursor.executemany(query, [values for _, values in chunk])
+            first_id = cursor.lastrowid
+            add_books(cursor, first_id, first_id + len(chunk) - 1)
+            db.commit()
+            cursor.close()
+        except Exception as e:
+            logger.error(f"Error creating books {chunk[0][0]}-{chunk[-1][0]}: {str(e)}")
+            db.rollback()
+            for index, _ in chunk:
+                results[index] = {'index': index, 'status': 'error', 'error': 'Database error'}
+            continue
+        for offset, (index, values) in enumerate(chunk):
+            results[index] = {'index': index, 'status': 'created', 'id': first_id + offset}
+            suggest_put('book', first_id + offset, values[0])
+
+    created = sum(1 for result in results if result['status'] == 'created')
+    status = 201 if created == len(results) else 207
+    return jsonify({'created': created, 'failed': len(results) - created, 'results': results}), status
+
+
 # endpoint: PUT /books/:id
 @books_blueprint.route('/books/<int:book_id>', methods=['PUT'])
 def update_book(book_id: int) -> dict:
@@ -185,30 +478,32 @@ def update_book(book_id: int) -> dict:
         return jsonify({'error': 'Missing required fields'}), 400
 
     try:
+        db = get_db()
         cursor = db.cursor()
-        query = "SELECT * FROM books WHERE id = %s"
-        cursor.execute(query, (book_id,))
-        book = cursor.fetchone()
-
-        if not book:
-            return jsonify({'error': 'Book not found'}), 404
-
+        cursor.execute("SELECT author_id, is_deleted FROM books WHERE id = %s FOR UPDATE", (book_id,))
+        previous = cursor.fetchone()
         query = "UPDATE books SET title = %s, author_id = %s, publication_date = %s WHERE id = %s"
         cursor.execute(query, (data['title'], data['author_id'], data['publication_date'], book_id))
+        updated = cursor.rowcount
+        if updated:
+            # The book may have moved from one author to another
+            refresh_authors(cursor, [previous[0]])
+            refresh_book_authors(cursor, [book_id])
         db.commit()
         cursor.close()
 
-        query = "SELECT * FROM books WHERE id = %s"
-        cursor = db.cursor()
-        cursor.execute(query, (book_id,))
-        updated_book = cursor.fetchone()
-        cursor.close()
+        if not updated:
+            return jsonify({'error': 'Book not found'}), 404
+        get_cache().delete(cache_key('book', book_id))
+        # A soft-deleted book keeps its new title out of the suggestions until restored
+        if not previous[1]:
+            suggest_put('book', book_id, data['title'])
 
         return jsonify({'message': 'Book updated successfully', 'book': {
-            'id': updated_book[0],
-            'title': updated_book[1],
-            'author_id': updated_book[2],
-            'publication_date': updated_book[3]
+            'id': book_id,
+            'title': data['title'],
+            'author_id': data['author_id'],
+            'publication_date': data['publication_date']
         }}), 200
     except Exception as e:
         logger.error(f"Error updating book {book_id}: {str(e)}")
@@ -229,19 +524,21 @@ def delete_book(book_id: int) -> dict:
         dict: JSON response with success message or error.
     """
     try:
+        db = get_db()
         cursor = db.cursor()
-        query = "SELECT * FROM books WHERE id = %s AND is_deleted = 0"
-        cursor.execute(query, (book_id,))
-        book = cursor.fetchone()
-
-        if not book:
-            return jsonify({'error': 'Book not found or already deleted'}), 404
-
-        query = "UPDATE books SET is_deleted = 1 WHERE id = %s"
+        query = "UPDATE books SET is_deleted = 1, deleted_at = NOW(6) WHERE id = %s AND is_deleted = 0"
         cursor.execute(query, (book_id,))
+        deleted = cursor.rowcount
+        if deleted:
+            refresh_book_authors(cursor, [book_id])
         db.commit()
         cursor.close()
 
+        if not deleted:
+            return jsonify({'error': 'Book not found or already deleted'}), 404
+        get_cache().delete(cache_key('book', book_id))
+        suggest_discard('book', book_id)
+
         return jsonify({'message': 'Book deleted successfully'}), 200
     except Exception as e:
         logger.error(f"Error deleting book {book_id}: {str(e)}")
@@ -261,23 +558,75 @@ def restore_book(book_id: int) -> dict:
         dict: JSON response with success message or error.
     """
     try:
+        db = get_db()
         cursor = db.cursor()
-        query = "SELECT * FROM books WHERE id = %s"
+        query = "UPDATE books SET is_deleted = 0, deleted_at = NULL WHERE id = %s AND is_deleted = 1"
         cursor.execute(query, (book_id,))
-        book = cursor.fetchone()
-
-        if not book:
-            return jsonify({'error': 'Book not found'}), 404
+        restored = cursor.rowcount
+        if restored:
+            refresh_book_authors(cursor, [book_id])
+        db.commit()
 
-        if book[4] == 0:  # Check if book is already active
+        if not restored:
+            # Only the failure path needs a read, to tell "missing" from "already active"
+            cursor.execute("SELECT is_deleted FROM books WHERE id = %s", (book_id,))
+            book = cursor.fetchone()
+            cursor.close()
+            if not book:
+                return jsonify({'error': 'Book not found'}), 404
             return jsonify({'error': 'Book is already active'}), 400
-
-        query = "UPDATE books SET is_deleted = 0 WHERE id = %s"
-        cursor.execute(query, (book_id,))
-        db.commit()
         cursor.close()
+        get_cache().delete(cache_key('book', book_id))
+        suggest_restore('book', book_id)
 
         return jsonify({'message': 'Book restored successfully'}), 200
     except Exception as e:
         logger.error(f"Error restoring book {book_id}: {str(e)}")
-        return jsonify({'error': 'Database error'}), 500
\ No newline at end of file
+        return jsonify({'error': 'Database error'}), 500
+
+
+# endpoint: POST /books/bulk-delete
+@books_blueprint.route('/books/bulk-delete', methods=['POST'])
+def bulk_delete_books() -> dict:
+    """
+    Soft deletes many books in one transaction (see app.bulk).
+
+    Request Body:
+        {"ids": [int, ...]} - at most BATCH_MAX_ROWS distinct IDs.
+
+    Returns:
+        dict: JSON response listing which IDs changed state.
+
+    API Response:
+        200 OK - Done; IDs already deleted are "unchanged", unknown IDs "missing".
+        400 Bad Request - Body is not an object with a non-empty list of IDs.
+        500 Internal Server Error - Database error occurred; nothing was changed.
+
+    Response Schema:
+        {
+            "changed": [int],
+            "unchanged": [int],
+            "missing": [int]
+        }
+    """
+    return bulk_set_deleted('books', 'book', True)
+
+
+# endpoint: POST /books/bulk-restore
+@books_blueprint.route('/books/bulk-restore', methods=['POST'])
+def bulk_restore_books() -> dict:
+    """
+    Restores many soft-deleted books in one transaction (see app.bulk).
+
+    Request Body:
+        {"ids": [int, ...]} - at most BATCH_MAX_ROWS distinct IDs.
+
+    Returns:
+        dict: JSON response listing which IDs changed state.
+
+    API Response:
+        200 OK - Done; IDs already active are "unchanged", unknown IDs "missing".
+        400 Bad Request - Body is not an object with a non-empty list of IDs.
+        500 Internal Server Error - Database error occurred; nothing was changed.
+    """
+    return bulk_set_deleted('books', 'book', False)
@@ -0,0 +1,230 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./app/bulk.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       Flask, mysql-connector-python
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       Imported by app.books and app.authors
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# bulk.py
+'''
+    Bulk Soft-Delete and Restore
+    ============================
+
+    POST /books/bulk-delete, /books/bulk-restore and the author versions
+    take {"ids": [...]} and flip is_deleted for every listed row in one
+    transaction.  Each chunk of BATCH_CHUNK_SIZE IDs costs two statements:
+    a locking read (SELECT ... FOR UPDATE) that finds which rows exist and
+    which are already in the target state, and one set-based UPDATE of the
+    rest.  IDs are locked in ascending order so concurrent bulk requests
+    cannot deadlock on each other.
+'''
+
+import logging
+
+from flask import current_app, jsonify, request
+
+from .cache import cache_key, get_cache
+from .database import get_db
+from .stats import refresh_book_authors
+from .suggest import suggest_discard, suggest_restore
+
+logger = logging.getLogger(__name__)
+
+
+class BulkError(ValueError):
+    """
+    Raised when the body of a bulk request is invalid.
+    """
+
+
+def parse_body_ids(body, max_ids: int) -> list:
+    """
+    Validates the body of a bulk request.
+
+    Args:
+        body: Parsed JSON body; must be {"ids": [positive int, ...]}.
+        max_ids (int): Largest number of distinct IDs accepted.
+
+    Returns:
+        list: Distinct IDs in ascending order.
+
+    Raises:
+        BulkError: If the body is not an object with a non-empty list of IDs.
+    """
+    if not isinstance(body, dict) or not isinstance(body.get('ids'), list) or not body['ids']:
+        raise BulkError("Request body must be an object with a non-empty 'ids' list")
+    ids = set()
+    for item_id in body['ids']:
+        if isinstance(item_id, bool) or not isinstance(item_id, int) or item_id <= 0:
+            raise BulkError(f"Invalid id {item_id!r}")
+        ids.add(item_id)
+    if len(ids) > max_ids:
+        raise BulkError(f"At most {max_ids} ids per request")
+    return sorted(ids)
+
+
+def lock_rows_sql(table: str, ids: list) -> tuple:
+    """
+    Builds the locking read of one chunk of a bulk request.
+
+    Args:
+        table (str): 'books' or 'authors'.
+        ids (list): IDs of one chunk, in ascending order.
+
+    Returns:
+        tuple: (query, params); the rows are (id, is_deleted).
+    """
+    placeholders = ', '.join(['%s'] * len(ids))
+    return (f"SELECT id, is_deleted FROM {table} WHERE id IN ({placeholders}) "
+            f"ORDER BY id FOR UPDATE", tuple(ids))
+
+
+def set_deleted_sql(table: str, ids: list, deleted: bool) -> tuple:
+    """
+    Builds the UPDATE flipping is_deleted (and deleted_at) on locked rows.
+
+    Args:
+        table (str): 'books' or 'authors'.
+        ids (list): IDs currently in the opposite state.
+        deleted (bool): Target state.
+
+    Returns:
+        tuple: (query, params)
+    """
+    target = int(deleted)
+    placeholders = ', '.join(['%s'] * len(ids))
+    deleted_at = 'NOW(6)' if deleted else 'NULL'
+    return (f"UPDATE {table} SET is_deleted = %s, deleted_at = {deleted_at} "
+            f"WHERE id IN ({placeholders}) AND is_deleted = %s", (target, *ids, 1 - target))
+
+
+def set_deleted(table: str, ids: list, deleted: bool) -> tuple:
+    """
+    Sets is_deleted on many rows in a single transaction.
+
+    Args:
+        table (str): 'books' or 'authors'.
+        ids (list): Distinct IDs in ascending order.
+        deleted (bool): Target state.
+
+    Returns:
+        tuple: (changed IDs, IDs already in the target state, missing IDs)
+
+    Raises:
+        Exception: Any database error; the transaction is rolled back first.
+    """
+    target = int(deleted)
+    chunk_size = current_app.config['BATCH_CHUNK_SIZE']
+    changed, unchanged, missing = [], [], []
+    db = get_db()
+    cursor = db.cursor()
+    try:
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start:start + chunk_size]
+            cursor.execute(*lock_rows_sql(table, chunk))
+            state = dict(cursor.fetchall())
+            flip = [item_id for item_id in chunk if item_id in state and state[item_id] != target]
+            if flip:
+                cursor.execute(*set_deleted_sql(table, flip, deleted))
+                if table == 'books':
+                    refresh_book_authors(cursor, flip)
+            changed.extend(flip)
+            unchanged.extend(item_id for item_id in chunk if state.get(item_id) == target)
+            missing.extend(item_id for item_id in chunk if item_id not in state)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        cursor.close()
+    return changed, unchanged, missing
+
+
+def bulk_set_deleted(table: str, kind: str, deleted: bool):
+    """
+    Handles a bulk soft-delete or restore request.
+
+    Args:
+        table (str): 'books' or 'authors'.
+        kind (str): Row type for cache keys and suggestions, 'book' or 'author'.
+        deleted (bool): True to soft-delete, False to restore.
+
+    Returns:
+        Response: {"changed": [...], "unchanged": [...], "missing": [...]}
+        with 200, 400 for an invalid body or 500 on a database error.
+    """
+    try:
+        ids = parse_body_ids(request.get_json(silent=True), current_app.config['BATCH_MAX_ROWS'])
+    except BulkError as e:
+        return jsonify({'error': str(e)}), 400
+
+    action = 'deleting' if deleted else 'restoring'
+    try:
+        changed, unchanged, missing = set_deleted(table, ids, deleted)
+    except Exception as e:
+        logger.error(f"Error bulk {action} {table}: {str(e)}")
+        return jsonify({'error': 'Database error'}), 500
+
+    get_cache().delete(*(cache_key(kind, item_id) for item_id in changed))
+    for item_id in changed:
+        if deleted:
+            suggest_discard(kind, item_id)
+        else:
+            suggest_restore(kind, item_id)
+    return jsonify({'changed': changed, 'unchanged': unchanged, 'missing': missing}), 200
@@ -0,0 +1,366 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./app/cache.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       Flask, redis (optional)
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       Import get_cache in blueprints
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# cache.py
+'''
+    Read-Through Cache for Single-Item Lookups
+    ==========================================
+
+    GET /books/:id and GET /authors/:id (and the ?ids= multi-gets of the list
+    endpoints) look rows up in the cache first and populate it on a miss;
+    every write handler deletes the keys it touched.
+    Entries also expire after CACHE_TTL seconds, which bounds staleness if
+    a read races with a concurrent write.
+
+    Backends (CACHE_TYPE):
+        lru   - in-process LRU with TTL (default outside production)
+        redis - any Redis-compatible server at CACHE_REDIS_URL
+        null  - caching disabled
+
+    Every worker process of the production server has its own memory, so
+    ProductionConfig defaults to 'redis' (or 'null' without CACHE_REDIS_URL):
+    an 'lru' cache there would keep serving rows another worker changed.
+'''
+
+import logging
+import pickle
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+from flask import current_app
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(kind: str, item_id: int) -> str:
+    """
+    Builds the cache key of a single row.
+
+    Args:
+        kind (str): Row type, e.g. 'book' or 'author'.
+        item_id (int): Row ID.
+
+    Returns:
+        str: Cache key.
+    """
+    return f'{kind}:{item_id}'
+
+
+class CacheBackend(ABC):
+    """
+    Interface implemented by cache backends.
+
+    A value of None is never stored, so ``get`` returning None means a miss.
+    """
+
+    @abstractmethod
+    def get(self, key: str):
+        """
+        Returns the cached value for key, or None on a miss.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value, ttl: float = None) -> None:
+        """
+        Stores value under key for ttl seconds (backend default when None).
+        """
+
+    @abstractmethod
+    def delete(self, *keys: str) -> None:
+        """
+        Removes the given keys; missing keys are ignored.
+        """
+
+    def get_many(self, keys: list) -> dict:
+        """
+        Returns the cached values of several keys, omitting misses.
+        """
+        values = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                values[key] = value
+        return values
+
+    def set_many(self, values: dict, ttl: float = None) -> None:
+        """
+        Stores several key/value pairs for ttl seconds.
+        """
+        for key, value in values.items():
+            self.set(key, value, ttl)
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Removes every entry owned by this application.
+        """
+
+
+class NullCache(CacheBackend):
+    """
+    Backend that stores nothing; used when caching is disabled.
+    """
+
+    def get(self, key):
+        return None
+
+    def set(self, key, value, ttl=None):
+        pass
+
+    def get_many(self, keys):
+        return {}
+
+    def set_many(self, values, ttl=None):
+        pass
+
+    def delete(self, *keys):
+        pass
+
+    def clear(self):
+        pass
+
+
+class LRUCache(CacheBackend):
+    """
+    Thread-safe in-process LRU cache with per-entry expiry.
+
+    Args:
+        max_entries (int): Entries kept before the least recently used is evicted.
+        ttl (float): Default lifetime of an entry in seconds.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_many(self, keys):
+        now = time.monotonic()
+        values = {}
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                if entry[0] <= now:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                values[key] = entry[1]
+        return values
+
+    def set_many(self, values, ttl=None):
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            for key, value in values.items():
+                self._entries[key] = (expires_at, value)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisCache(CacheBackend):
+    """
+    Backend for a Redis-compatible server.
+
+    Values are pickled, so only point it at a server this application owns.
+    Connection errors are logged and treated as cache misses.
+
+    Args:
+        url (str): Server URL, e.g. redis://localhost:6379/0.
+        ttl (float): Default lifetime of an entry in seconds.
+        prefix (str): Namespace prepended to every key.
+    """
+
+    def __init__(self, url: str, ttl: float = 300.0, prefix: str = 'bookstore:'):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("CACHE_TYPE 'redis' requires the redis package: pip install redis")
+        self._client = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, key):
+        try:
+            raw = self._client.get(self.prefix + key)
+        except Exception as e:
+            logger.warning(f"Cache get failed for {key}: {str(e)}")
+            return None
+        return None if raw is None else pickle.loads(raw)
+
+    def set(self, key, value, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        try:
+            self._client.set(self.prefix + key, pickle.dumps(value), px=int(ttl * 1000))
+        except Exception as e:
+            logger.warning(f"Cache set failed for {key}: {str(e)}")
+
+    def get_many(self, keys):
+        if not keys:
+            return {}
+        try:
+            raws = self._client.mget([self.prefix + key for key in keys])
+        except Exception as e:
+            logger.warning(f"Cache get failed for {len(keys)} keys: {str(e)}")
+            return {}
+        return {key: pickle.loads(raw) for key, raw in zip(keys, raws) if raw is not None}
+
+    def set_many(self, values, ttl=None):
+        if not values:
+            return
+        ttl = self.ttl if ttl is None else ttl
+        try:
+            pipeline = self._client.pipeline(transaction=False)
+            for key, value in values.items():
+                pipeline.set(self.prefix + key, pickle.dumps(value), px=int(ttl * 1000))
+            pipeline.execute()
+        except Exception as e:
+            logger.warning(f"Cache set failed for {len(values)} keys: {str(e)}")
+
+    def delete(self, *keys):
+        if not keys:
+            return
+        try:
+            self._client.delete(*(self.prefix + key for key in keys))
+        except Exception as e:
+            logger.warning(f"Cache delete failed for {keys}: {str(e)}")
+
+    def clear(self):
+        try:
+            for key in self._client.scan_iter(match=self.prefix + '*'):
+                self._client.delete(key)
+        except Exception as e:
+            logger.warning(f"Cache clear failed: {str(e)}")
+
+
+def create_cache(app_config) -> CacheBackend:
+    """
+    Builds the cache backend selected by CACHE_TYPE.
+
+    Args:
+        app_config (dict): Flask application config.
+
+    Returns:
+        CacheBackend: Configured backend.
+    """
+    cache_type = app_config['CACHE_TYPE'].lower()
+    if cache_type == 'lru':
+        return LRUCache(app_config['CACHE_MAX_ENTRIES'], app_config['CACHE_TTL'])
+    if cache_type == 'redis':
+        return RedisCache(app_config['CACHE_REDIS_URL'], app_config['CACHE_TTL'])
+    if cache_type == 'null':
+        return NullCache()
+    raise ValueError(f"Unknown CACHE_TYPE: {app_config['CACHE_TYPE']}")
+
+
+def get_cache() -> CacheBackend:
+    """
+    Returns the cache backend of the current application.
+    """
+    return current_app.extensions['cache']
+
+
+def init_app(app) -> None:
+    """
+    Attaches the configured cache backend to the application.
+
+    Args:
+        app (Flask): Flask application.
+    """
+    app.extensions['cache'] = create_cache(app.config)
@@ -66,6 +66,7 @@
     Application Configuration Settings
 '''
 
+import multiprocessing
 import os
 from dotenv import load_dotenv
 
@@ -85,6 +86,39 @@ class Config:
         MYSQL_DB (str): MySQL database name.
         MYSQL_SSL_MODE (str): MySQL SSL mode.
         MYSQL_CONNECT_STRING (str): MySQL connection string.
+        MYSQL_POOL_MIN_SIZE (int): Connections kept open when idle.
+        MYSQL_POOL_MAX_SIZE (int): Maximum open connections per process.
+        MYSQL_POOL_TIMEOUT (float): Seconds to wait for a free connection.
+        MYSQL_POOL_IDLE_TIMEOUT (float): Seconds before an idle connection is closed.
+        MYSQL_POOL_PING_INTERVAL (float): Idle seconds before a connection is pinged on checkout.
+        DEFAULT_PAGE_SIZE (int): Page size of list endpoints when no limit is given.
+        MAX_PAGE_SIZE (int): Largest accepted limit on list endpoints.
+        STREAM_BATCH_SIZE (int): Rows fetched per batch when streaming NDJSON.
+        ETAG_SETTLE_SECONDS (float): Age a collection version must reach before list responses get validators.
+        BATCH_MAX_ROWS (int): Largest number of rows accepted by a batch endpoint.
+        BATCH_CHUNK_SIZE (int): Rows written per statement and transaction by batch endpoints.
+        MULTIGET_MAX_IDS (int): Largest number of IDs accepted by ?ids= on list endpoints.
+        MULTIGET_CHUNK_SIZE (int): IDs per IN (...) query of a multi-get.
+        SEARCH_PAGE_SIZE (int): Page size of GET /books/search when no limit is given.
+        SEARCH_MAX_RESULTS (int): Deepest ranked match served by GET /books/search.
+        SEARCH_MIN_TOKEN_SIZE (int): Shortest searchable word; match innodb_ft_min_token_size.
+        SUGGEST_ENABLED (bool): Serve GET /suggest from an in-process prefix index.
+        SUGGEST_LIMIT (int): Suggestions per type when no limit is given.
+        SUGGEST_REFRESH_INTERVAL (float): Seconds between polls for rows changed by other processes.
+        SUGGEST_REFRESH_OVERLAP (float): Seconds each poll reaches back before the newest version seen.
+        SUGGEST_MAX_WORDS (int): Word starts indexed per title or name.
+        SUGGEST_COMPACT_RATIO (float): Pending writes, relative to the index size, that trigger a merge.
+        CACHE_TYPE (str): Single-item cache backend: 'lru', 'redis' or 'null'.
+        CACHE_MAX_ENTRIES (int): Entries kept by the in-process LRU cache.
+        CACHE_TTL (float): Seconds a cached row stays valid.
+        CACHE_REDIS_URL (str): Server URL for the 'redis' backend.
+        PURGE_RETENTION_DAYS (float): Days a soft-deleted row is kept before purge.py archives it.
+        PURGE_BATCH_SIZE (int): Rows archived per purge transaction.
+        PURGE_SLEEP (float): Seconds purge.py pauses between batches.
+        SLOW_QUERY_THRESHOLD (float): Seconds above which a statement is logged as slow.
+        SLOW_QUERY_EXPLAIN (bool): Capture EXPLAIN plans of slow SELECTs.
+        QUERY_STATS_MAX_ENTRIES (int): Distinct statements kept by the query profiler.
+        ADMIN_TOKEN (str): Token required in X-Admin-Token by /admin endpoints; unset disables them.
         DEBUG (bool): Flask debug mode.
         TESTING (bool): Flask testing mode.
     """
@@ -97,6 +131,59 @@ class Config:
 
     MYSQL_CONNECT_STRING = f"mysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}/{MYSQL_DB}?ssl_mode={MYSQL_SSL_MODE}"
 
+    # Connection pool settings
+    MYSQL_POOL_MIN_SIZE = int(os.environ.get('MYSQL_POOL_MIN_SIZE', 1))
+    MYSQL_POOL_MAX_SIZE = int(os.environ.get('MYSQL_POOL_MAX_SIZE', 10))
+    MYSQL_POOL_TIMEOUT = float(os.environ.get('MYSQL_POOL_TIMEOUT', 5))
+    MYSQL_POOL_IDLE_TIMEOUT = float(os.environ.get('MYSQL_POOL_IDLE_TIMEOUT', 300))
+    MYSQL_POOL_PING_INTERVAL = float(os.environ.get('MYSQL_POOL_PING_INTERVAL', 5))
+
+    # Pagination settings
+    DEFAULT_PAGE_SIZE = int(os.environ.get('DEFAULT_PAGE_SIZE', 100))
+    MAX_PAGE_SIZE = int(os.environ.get('MAX_PAGE_SIZE', 1000))
+    STREAM_BATCH_SIZE = int(os.environ.get('STREAM_BATCH_SIZE', 1000))
+
+    # Conditional GET settings
+    ETAG_SETTLE_SECONDS = float(os.environ.get('ETAG_SETTLE_SECONDS', 5))
+
+    # Batch write settings
+    BATCH_MAX_ROWS = int(os.environ.get('BATCH_MAX_ROWS', 50000))
+    BATCH_CHUNK_SIZE = int(os.environ.get('BATCH_CHUNK_SIZE', 1000))
+
+    # Multi-get settings
+    MULTIGET_MAX_IDS = int(os.environ.get('MULTIGET_MAX_IDS', 1000))
+    MULTIGET_CHUNK_SIZE = int(os.environ.get('MULTIGET_CHUNK_SIZE', 500))
+
+    # Search settings
+    SEARCH_PAGE_SIZE = int(os.environ.get('SEARCH_PAGE_SIZE', 20))
+    SEARCH_MAX_RESULTS = int(os.environ.get('SEARCH_MAX_RESULTS', 1000))
+    SEARCH_MIN_TOKEN_SIZE = int(os.environ.get('SEARCH_MIN_TOKEN_SIZE', 3))
+
+    # Suggestion index settings
+    SUGGEST_ENABLED = os.environ.get('SUGGEST_ENABLED', '1').lower() in ('1', 'true', 'yes')
+    SUGGEST_LIMIT = int(os.environ.get('SUGGEST_LIMIT', 10))
+    SUGGEST_REFRESH_INTERVAL = float(os.environ.get('SUGGEST_REFRESH_INTERVAL', 5))
+    SUGGEST_REFRESH_OVERLAP = float(os.environ.get('SUGGEST_REFRESH_OVERLAP', 5))
+    SUGGEST_MAX_WORDS = int(os.environ.get('SUGGEST_MAX_WORDS', 8))
+    SUGGEST_COMPACT_RATIO = float(os.environ.get('SUGGEST_COMPACT_RATIO', 0.05))
+
+    # Cache settings
+    CACHE_TYPE = os.environ.get('CACHE_TYPE', 'lru')
+    CACHE_MAX_ENTRIES = int(os.environ.get('CACHE_MAX_ENTRIES', 10000))
+    CACHE_TTL = float(os.environ.get('CACHE_TTL', 300))
+    CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL', 'redis://localhost:6379/0')
+
+    # Purge settings
+    PURGE_RETENTION_DAYS = float(os.environ.get('PURGE_RETENTION_DAYS', 90))
+    PURGE_BATCH_SIZE = int(os.environ.get('PURGE_BATCH_SIZE', 500))
+    PURGE_SLEEP = float(os.environ.get('PURGE_SLEEP', 0.1))
+
+    # Query profiling settings
+    SLOW_QUERY_THRESHOLD = float(os.environ.get('SLOW_QUERY_THRESHOLD', 0.5))
+    SLOW_QUERY_EXPLAIN = os.environ.get('SLOW_QUERY_EXPLAIN', '').lower() in ('1', 'true', 'yes')
+    QUERY_STATS_MAX_ENTRIES = int(os.environ.get('QUERY_STATS_MAX_ENTRIES', 500))
+    ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN')
+
     # Flask settings
     DEBUG = os.environ.get('FLASK_DEBUG', False)
     TESTING = os.environ.get('FLASK_TESTING', False)
@@ -115,8 +202,50 @@ class DevelopmentConfig(Config):
 class ProductionConfig(Config):
     """
     Production configuration class.
+
+    The SERVER_* settings drive the pre-fork server started by
+    "python run.py --production".  Each worker process has its own
+    connection pool, sized by default to its thread count.
     
     Attributes:
         DEBUG (bool): Flask debug mode.
+        SERVER_BIND (str): Address the server listens on.
+        SERVER_WORKERS (int): Number of worker processes.
+        SERVER_THREADS (int): Request threads per worker.
+        SERVER_KEEPALIVE (int): Seconds an idle keep-alive connection is held open.
+        SERVER_TIMEOUT (int): Seconds before a silent worker is killed and restarted.
+        SERVER_GRACEFUL_TIMEOUT (int): Seconds workers get to finish requests on shutdown.
+        MYSQL_POOL_MAX_SIZE (int): Maximum open connections per worker.
+        CACHE_TYPE (str): 'redis' when CACHE_REDIS_URL is set, otherwise 'null'.  An
+            in-process 'lru' cache per worker would miss the other workers' invalidations.
+    """
+    DEBUG = False
+
+    SERVER_BIND = os.environ.get('SERVER_BIND', '0.0.0.0:8000')
+    SERVER_WORKERS = int(os.environ.get('SERVER_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+    SERVER_THREADS = int(os.environ.get('SERVER_THREADS', 4))
+    SERVER_KEEPALIVE = int(os.environ.get('SERVER_KEEPALIVE', 5))
+    SERVER_TIMEOUT = int(os.environ.get('SERVER_TIMEOUT', 30))
+    SERVER_GRACEFUL_TIMEOUT = int(os.environ.get('SERVER_GRACEFUL_TIMEOUT', 30))
+
+    MYSQL_POOL_MAX_SIZE = int(os.environ.get('MYSQL_POOL_MAX_SIZE', SERVER_THREADS))
+
+    CACHE_TYPE = os.environ.get('CACHE_TYPE', 'redis' if os.environ.get('CACHE_REDIS_URL') else 'null')
+
+
+def get_config(name: str = None):
+    """
+    Returns the configuration class for an environment name.
+
+    Args:
+        name (str): 'development', 'production' or None; defaults to the
+            APP_ENV environment variable.
+
+    Returns:
+        type: Config subclass (Config when the name is unset or unknown).
     """
-    DEBUG = False 
\ No newline at end of file
+    name = (name or os.environ.get('APP_ENV', '')).lower()
+    return {
+        'development': DevelopmentConfig,
+        'production': ProductionConfig,
+    }.get(name, Config)
@@ -25,11 +25,11 @@
 # version           :       1.0
 # Release           :       R1
 #
-# Dependencies      :       mysql-connector-python
+# Dependencies      :       Flask, mysql-connector-python
 #
 # Installation      :       $ pip install requirements.txt
 #
-# Usage             :       Import db object in application
+# Usage             :       Import get_db in application
 #
 # ---------------------------------------------------------------------------
 #
@@ -65,24 +65,62 @@
 '''
     MySQL Database Connection Module
     ===============================
+
+    Connections are handed out by a thread-safe ``ConnectionPool``.  Each
+    request checks one out on first use through ``get_db()`` and the
+    connection is returned to the pool when the application context is
+    torn down.
+
+    Connections from ``get_db()`` hand out ``TimedCursor`` objects, which
+    time every driver call and report it to app/metrics.py and to the
+    query profiler in app/profiling.py.
 '''
 
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import deque
+
 import mysql.connector
-from . import config
- 
-def get_database_config():
+from mysql.connector.constants import ClientFlag
+from flask import current_app, g
+from . import config, metrics, profiling
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeoutError(Exception):
+    """
+    Raised when no pooled connection becomes available within the wait timeout.
+    """
+
+
+def get_database_config(app_config=None):
     """
     Returns MySQL database configuration.
 
+    Args:
+        app_config (dict): Flask application config to read the MYSQL_*
+            settings from; config.Config when None (command-line tools).
+
     Returns:
         dict: Database configuration
     """
+    if app_config is None:
+        app_config = {key: getattr(config.Config, key)
+                      for key in ('MYSQL_HOST', 'MYSQL_USER', 'MYSQL_PASSWORD', 'MYSQL_DB')}
     return {
-        'host': config.Config.MYSQL_HOST,
-        'user': config.Config.MYSQL_USER,
-        'password': config.Config.MYSQL_PASSWORD,
-        'database': config.Config.MYSQL_DB,
-        'ssl_disabled': True
+        'host': app_config['MYSQL_HOST'],
+        'user': app_config['MYSQL_USER'],
+        'password': app_config['MYSQL_PASSWORD'],
+        'database': app_config['MYSQL_DB'],
+        'ssl_disabled': True,
+        # TIMESTAMP values (e.g. updated_at) are read as naive UTC
+        'time_zone': '+00:00',
+        # rowcount of an UPDATE counts matched rows, not only changed ones
+        'client_flags': [ClientFlag.FOUND_ROWS]
     }
 
 
@@ -99,4 +137,441 @@ def establish_database_connection():
     return mysql.connector.connect(**mysql_config)
 
 
-db = establish_database_connection() 
\ No newline at end of file
+def connection_factory(app_config):
+    """
+    Returns a function opening connections with an application's settings.
+
+    Args:
+        app_config (dict): Flask application config.
+
+    Returns:
+        callable: Opens a new mysql.connector connection on each call.
+    """
+    settings = get_database_config(app_config)
+
+    def connect():
+        return mysql.connector.connect(**settings)
+    return connect
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of MySQL connections.
+
+    Connections are opened on demand up to ``max_size``; at least ``min_size``
+    are kept open once created.  Idle connections are checked with a ping
+    before being handed out, and connections idle for longer than
+    ``idle_timeout`` are closed on checkout, on release and by a daemon
+    reaper thread, so they also go away once traffic stops.  Callers block
+    for at most ``timeout`` seconds when the pool is exhausted.
+
+    The pool is fork-aware: a process forked from the one that created it
+    (e.g. a pre-fork server worker) starts with an empty pool of its own
+    instead of sharing the parent's sockets.
+
+    Args:
+        connect (callable): Factory returning a new DB-API connection.
+        min_size (int): Number of idle connections never reaped.
+        max_size (int): Upper bound on open connections.
+        timeout (float): Seconds to wait for a free connection.
+        idle_timeout (float): Seconds after which idle connections are closed.
+        ping_interval (float): Idle seconds after which a connection is pinged on borrow.
+    """
+
+    def __init__(self, connect, min_size=1, max_size=10, timeout=5.0,
+                 idle_timeout=300.0, ping_interval=5.0):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError('Invalid pool size: min=%s max=%s' % (min_size, max_size))
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.ping_interval = ping_interval
+        self._cond = threading.Condition()
+        self._idle = deque()  # (connection, last_used) pairs, most recent on the right
+        self._size = 0
+        self._reaper_started = False
+
+        if hasattr(os, 'register_at_fork'):
+            pool = weakref.ref(self)
+            os.register_at_fork(after_in_child=lambda: pool() and pool()._after_fork())
+
+    @property
+    def size(self) -> int:
+        """
+        Returns the number of open connections, idle or checked out.
+        """
+        with self._cond:
+            return self._size
+
+    @property
+    def idle(self) -> int:
+        """
+        Returns the number of idle connections.
+        """
+        with self._cond:
+            return len(self._idle)
+
+    def acquire(self):
+        """
+        Checks out a healthy connection, opening a new one if allowed.
+
+        Returns:
+            Connection object.
+
+        Raises:
+            PoolTimeoutError: If the pool stays exhausted for ``timeout`` seconds.
+        """
+        deadline = time.monotonic() + self.timeout
+        while True:
+            conn, last_used = None, 0.0
+            with self._cond:
+                expired = self._reap_idle()
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolTimeoutError(
+                            f'No database connection available after {self.timeout}s')
+                    self._cond.wait(remaining)
+                if self._idle:
+                    # LIFO keeps the hot connections busy and lets the rest age out
+                    conn, last_used = self._idle.pop()
+                else:
+                    self._size += 1
+            for stale in expired:
+                self._close(stale)
+
+            if conn is None:
+                try:
+                    return self._connect()
+                except Exception:
+                    self._forget()
+                    raise
+
+            if self._is_healthy(conn, last_used):
+                return conn
+            logger.warning('Discarding broken pooled connection')
+            self._close(conn)
+            self._forget()
+
+    def release(self, conn) -> None:
+        """
+        Returns a connection to the pool.
+
+        Any open transaction is rolled back; connections with unread results
+        or that fail to reset are closed instead of being reused.
+
+        Args:
+            conn: Connection previously returned by ``acquire``.
+        """
+        reusable = not getattr(conn, 'unread_result', False)
+        if reusable and getattr(conn, 'in_transaction', False):
+            try:
+                conn.rollback()
+            except Exception as e:
+                logger.warning(f"Rollback of pooled connection failed: {str(e)}")
+                reusable = False
+        if not reusable:
+            self._close(conn)
+            self._forget()
+            return
+
+        with self._cond:
+            self._idle.append((conn, time.monotonic()))
+            expired = self._reap_idle()
+            self._cond.notify()
+            if not self._reaper_started and self._size > self.min_size:
+                self._reaper_started = True
+                self._start_reaper()
+        for stale in expired:
+            self._close(stale)
+
+    def reap(self) -> None:
+        """
+        Closes the connections idle longer than ``idle_timeout``, keeping ``min_size`` open.
+        """
+        with self._cond:
+            expired = self._reap_idle()
+        for stale in expired:
+            self._close(stale)
+
+    def close_all(self) -> None:
+        """
+        Closes every idle connection.  Checked-out connections are closed when released.
+        """
+        with self._cond:
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            self._close(conn)
+
+    def _after_fork(self) -> None:
+        """
+        Drops connections inherited from the parent process.
+
+        Runs in the child right after fork, while it is still single-threaded.
+        The connections are not closed: closing would send COM_QUIT over
+        sockets the parent still owns.
+        """
+        self._cond = threading.Condition()
+        self._idle = deque()
+        self._size = 0
+        self._reaper_started = False  # threads do not survive fork
+
+    def _start_reaper(self) -> None:
+        """
+        Starts the daemon thread calling reap() every idle_timeout / 2 seconds.
+
+        The thread only holds a weak reference and exits once the pool is gone.
+        """
+        pool = weakref.ref(self)
+        interval = self.idle_timeout / 2
+
+        def run():
+            while True:
+                time.sleep(interval)
+                current = pool()
+                if current is None:
+                    return
+                current.reap()
+                del current
+
+        threading.Thread(target=run, name='db-pool-reaper', daemon=True).start()
+
+    def _reap_idle(self) -> list:
+        """
+        Pops connections idle longer than ``idle_timeout``.  Caller holds the lock.
+
+        Returns:
+            list: Connections to be closed outside the lock.
+        """
+        expired = []
+        cutoff = time.monotonic() - self.idle_timeout
+        while self._idle and self._size > self.min_size and self._idle[0][1] < cutoff:
+            expired.append(self._idle.popleft()[0])
+            self._size -= 1
+        return expired
+
+    def _is_healthy(self, conn, last_used: float) -> bool:
+        if time.monotonic() - last_used < self.ping_interval:
+            return True
+        try:
+            conn.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    def _forget(self) -> None:
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    @staticmethod
+    def _close(conn) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+class TimedCursor:
+    """
+    Cursor wrapper that times statements and fetches.
+
+    Driver time is reported to app/metrics.py as it is spent.  Each
+    statement is also timed from execute() until its result has been
+    fetched (or the cursor moves on) and handed to the query profiler.
+
+    Attributes other than the wrapped methods (rowcount, lastrowid,
+    column_names, ...) are read from the underlying cursor.
+
+    Args:
+        cursor: DB-API cursor.
+        connection (InstrumentedConnection): Connection that created the cursor.
+    """
+
+    def __init__(self, cursor, connection):
+        self._cursor = cursor
+        self._connection = connection
+        self._statement = None  # [operation, params, seconds, many]
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def _timed(self, method, statements, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            metrics.observe_query(elapsed, statements)
+            if self._statement is not None:
+                self._statement[2] += elapsed
+
+    def _run(self, method, operation, params, many, *args, **kwargs):
+        self.finish()
+        self._statement = [operation, params, 0.0, many]
+        try:
+            return self._timed(method, 1, operation, params, *args, **kwargs)
+        finally:
+            if not getattr(self._cursor, 'with_rows', False):
+                self.finish()
+
+    def finish(self) -> None:
+        """
+        Hands the current statement, if any, to the query profiler.
+        """
+        statement, self._statement = self._statement, None
+        if statement is not None:
+            self._connection.profile(*statement)
+
+    def execute(self, operation, params=None, *args, **kwargs):
+        return self._run(self._cursor.execute, operation, params, False, *args, **kwargs)
+
+    def executemany(self, operation, seq_params, *args, **kwargs):
+        return self._run(self._cursor.executemany, operation, seq_params, True, *args, **kwargs)
+
+    def fetchone(self):
+        row = self._timed(self._cursor.fetchone, 0)
+        if row is None:
+            self.finish()
+        return row
+
+    def fetchmany(self, *args, **kwargs):
+        rows = self._timed(self._cursor.fetchmany, 0, *args, **kwargs)
+        if not rows:
+            self.finish()
+        return rows
+
+    def fetchall(self):
+        try:
+            return self._timed(self._cursor.fetchall, 0)
+        finally:
+            self.finish()
+
+    def close(self):
+        self.finish()
+        return self._cursor.close()
+
+
+class InstrumentedConnection:
+    """
+    Connection wrapper whose cursors are ``TimedCursor`` objects.
+
+    Args:
+        connection: Pooled DB-API connection.
+        profiler (QueryProfiler): Receives every statement; None disables profiling.
+    """
+
+    def __init__(self, connection, profiler=None):
+        self.connection = connection
+        self.profiler = profiler
+        self._cursors = []
+        self._explain = []
+
+    def __getattr__(self, name):
+        return getattr(self.connection, name)
+
+    def cursor(self, *args, **kwargs):
+        cursor = TimedCursor(self.connection.cursor(*args, **kwargs), self)
+        self._cursors.append(cursor)
+        return cursor
+
+    def profile(self, operation, params, seconds: float, many: bool) -> None:
+        """
+        Records a finished statement; slow SELECTs are queued for EXPLAIN.
+        """
+        if self.profiler is not None and self.profiler.record(operation, params, seconds, many):
+            self._explain.append((operation, params))
+
+    def finish(self) -> None:
+        """
+        Profiles statements still open and runs queued EXPLAINs.
+
+        Called before the connection goes back to the pool, once no
+        statement can still be reading from it.
+        """
+        for cursor in self._cursors:
+            cursor.finish()
+        self._cursors.clear()
+        explain, self._explain = self._explain, []
+        if not explain or getattr(self.connection, 'unread_result', False):
+            return
+        for operation, params in explain:
+            try:
+                cursor = self.connection.cursor()
+                cursor.execute('EXPLAIN ' + operation, params)
+                plan = [dict(zip(cursor.column_names, row)) for row in cursor.fetchall()]
+                cursor.close()
+                self.profiler.record_explain(operation, plan)
+            except Exception as e:
+                logger.warning(f"EXPLAIN of slow query failed: {str(e)}")
+
+
+def create_pool(app_config) -> ConnectionPool:
+    """
+    Builds a connection pool from the Flask configuration.
+
+    Args:
+        app_config (dict): Flask application config.
+
+    Returns:
+        ConnectionPool: Pool of MySQL connections (opened lazily).
+    """
+    return ConnectionPool(
+        connection_factory(app_config),
+        min_size=app_config['MYSQL_POOL_MIN_SIZE'],
+        max_size=app_config['MYSQL_POOL_MAX_SIZE'],
+        timeout=app_config['MYSQL_POOL_TIMEOUT'],
+        idle_timeout=app_config['MYSQL_POOL_IDLE_TIMEOUT'],
+        ping_interval=app_config['MYSQL_POOL_PING_INTERVAL'],
+    )
+
+
+def get_db():
+    """
+    Returns the connection checked out for the current application context.
+
+    The first call within a request borrows a connection from the pool;
+    it is released by ``close_db`` on teardown.
+
+    Returns:
+        InstrumentedConnection: Wrapped database connection object
+    """
+    if 'db' not in g:
+        start = time.perf_counter()
+        g.db = InstrumentedConnection(current_app.extensions['db_pool'].acquire(),
+                                      current_app.extensions.get('query_profiler'))
+        metrics.observe_pool_wait(time.perf_counter() - start)
+    return g.db
+
+
+def close_db(exception=None) -> None:
+    """
+    Returns the current context's connection to the pool, if one was taken.
+
+    Args:
+        exception (Exception): Unhandled exception from the request, if any.
+    """
+    db = g.pop('db', None)
+    if db is not None:
+        db.finish()
+        current_app.extensions['db_pool'].release(db.connection)
+
+
+def init_app(app) -> None:
+    """
+    Attaches a connection pool and a query profiler to the application.
+
+    Args:
+        app (Flask): Flask application.
+    """
+    app.extensions['db_pool'] = create_pool(app.config)
+    app.extensions['query_profiler'] = profiling.create_profiler(app.config)
+    app.teardown_appcontext(close_db)
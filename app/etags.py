@@ -0,0 +1,188 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./app/etags.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       Flask
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       Import ETag helpers in blueprints
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# etags.py
+'''
+    Conditional GET Support (ETag / Last-Modified)
+    ==============================================
+
+    Single-row ETags are derived from the row's 'updated_at' version.  List
+    ETags are derived from the table's version, the newer of MAX(updated_at)
+    (moved by every insert, update, soft delete and restore) and
+    MAX(archived_at) of its archive table (moved when the purge job
+    hard-deletes rows), plus the query string.  Both are read from an index.
+
+    updated_at is stamped when a statement runs, not when it commits, so a
+    transaction can still commit rows older than the version just read.  A
+    list is therefore only given validators once its version is
+    ETAG_SETTLE_SECONDS old; until then it is served without them.
+    When the client's If-None-Match / If-Modified-Since still matches, the
+    handler answers 304 Not Modified before serializing anything.
+'''
+
+import hashlib
+from datetime import timezone
+
+from flask import Response, current_app, request
+
+
+def make_etag(*parts) -> str:
+    """
+    Builds a strong ETag value from the parts identifying a representation.
+
+    Args:
+        parts: Values such as the resource kind, ID, version and query string.
+
+    Returns:
+        str: Unquoted ETag value.
+    """
+    raw = '|'.join(str(part) for part in parts).encode('utf-8')
+    return hashlib.sha1(raw).hexdigest()
+
+
+def collection_versions(cursor, *tables: str) -> tuple:
+    """
+    Reads the version of each table in one round trip.
+
+    Every subquery is answered from the updated_at index of the table or
+    the archived_at index of its archive table.
+
+    Args:
+        cursor: Database cursor.
+        tables (str): Table names (constants, never user input).
+
+    Returns:
+        tuple: (versions, settled).  versions holds the latest version of
+        each table (None when it was never written); settled is False while
+        any of them is younger than ETAG_SETTLE_SECONDS.
+    """
+    subqueries = ', '.join(f"(SELECT MAX(updated_at) FROM {table}), "
+                           f"(SELECT MAX(archived_at) FROM {table}_archive)" for table in tables)
+    settle = int(current_app.config['ETAG_SETTLE_SECONDS'] * 1000000)
+    cursor.execute(f"SELECT NOW(6) - INTERVAL %s MICROSECOND, {subqueries}", (settle,))
+    horizon, *row = cursor.fetchone()
+    versions = tuple(max((version for version in pair if version is not None), default=None)
+                     for pair in zip(row[::2], row[1::2]))
+    return versions, all(version is None or version <= horizon for version in versions)
+
+
+def _http_date(version):
+    # Connections run with time_zone '+00:00', so versions are naive UTC
+    return version.replace(tzinfo=timezone.utc) if version is not None else None
+
+
+def is_not_modified(etag: str, version=None) -> bool:
+    """
+    Tells whether the client's cached copy is still current.
+
+    If-None-Match takes precedence; If-Modified-Since is only consulted
+    when no If-None-Match header was sent.
+
+    Args:
+        etag (str): Current ETag value; None for a representation without validators.
+        version (datetime): Current Last-Modified time, if known.
+
+    Returns:
+        bool: True when a 304 response should be sent.
+    """
+    if etag is None:
+        return False
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if version is not None and request.if_modified_since:
+        return _http_date(version).replace(microsecond=0) <= request.if_modified_since
+    return False
+
+
+def add_validators(response: Response, etag: str, version=None) -> Response:
+    """
+    Sets the ETag and Last-Modified headers on a response.
+
+    Args:
+        response (Response): Response to decorate.
+        etag (str): ETag value; None leaves the response without validators.
+        version (datetime): Last-Modified time, if known.
+
+    Returns:
+        Response: The same response.
+    """
+    if etag is None:
+        return response
+    response.set_etag(etag)
+    if version is not None:
+        response.last_modified = _http_date(version)
+    return response
+
+
+def not_modified(etag: str, version=None) -> Response:
+    """
+    Builds an empty 304 Not Modified response carrying the validators.
+
+    Args:
+        etag (str): ETag value.
+        version (datetime): Last-Modified time, if known.
+
+    Returns:
+        Response: 304 response.
+    """
+    return add_validators(Response(status=304), etag, version)
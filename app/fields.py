@@ -0,0 +1,186 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./app/fields.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       Flask
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       Import field helpers in blueprints
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# fields.py
+'''
+    Column Whitelists and Sparse Fieldsets
+    ======================================
+
+    Read endpoints select an explicit column list instead of "SELECT *".
+    With "?fields=title,publication_date" only the requested whitelisted
+    columns are read from MySQL and each row is returned as an object
+    keyed by field name.  Without it, rows keep their positional shape.
+'''
+
+from flask import request
+
+# Positional shape of a row when no fieldset is requested
+BOOK_COLUMNS = ('id', 'title', 'author_id', 'publication_date', 'is_deleted')
+AUTHOR_COLUMNS = ('id', 'name', 'email', 'is_deleted')
+
+# Fields a client may request
+BOOK_FIELDS = ('id', 'title', 'author_id', 'publication_date')
+AUTHOR_FIELDS = ('id', 'name', 'email')
+
+
+class FieldsError(ValueError):
+    """
+    Raised when the fields query parameter names an unknown field.
+    """
+
+
+def get_fields(allowed: tuple):
+    """
+    Reads the requested fieldset from the current request.
+
+    Args:
+        allowed (tuple): Whitelisted field names.
+
+    Returns:
+        tuple: Requested fields in request order, or None when not given.
+
+    Raises:
+        FieldsError: If the list is empty or names an unknown field.
+    """
+    return parse_fields(request.args.get('fields'), allowed)
+
+
+def parse_fields(raw, allowed: tuple):
+    """
+    Parses a comma-separated fieldset.
+
+    Args:
+        raw (str): Value of the fields parameter, or None.
+        allowed (tuple): Whitelisted field names.
+
+    Returns:
+        tuple: Requested fields in request order, or None when raw is None.
+
+    Raises:
+        FieldsError: If the list is empty or names an unknown field.
+    """
+    if raw is None:
+        return None
+    fields = []
+    for name in raw.split(','):
+        name = name.strip()
+        if not name:
+            continue
+        if name not in allowed:
+            raise FieldsError(f"Unknown field '{name}'; expected any of {', '.join(allowed)}")
+        if name not in fields:
+            fields.append(name)
+    if not fields:
+        raise FieldsError("'fields' must name at least one field")
+    return tuple(fields)
+
+
+def select_columns(fields, default: tuple) -> tuple:
+    """
+    Returns the columns to read for a fieldset.
+
+    'id' always comes first, since keyset pagination needs it even when the
+    client did not ask for it.
+
+    Args:
+        fields (tuple): Requested fields, or None.
+        default (tuple): Columns read when no fieldset is requested.
+
+    Returns:
+        tuple: Column names.
+    """
+    if fields is None:
+        return default
+    return ('id',) + tuple(field for field in fields if field != 'id')
+
+
+def column_list(columns: tuple, alias: str = None) -> str:
+    """
+    Renders whitelisted columns as a SQL select list.
+
+    Args:
+        columns (tuple): Column names from a whitelist above.
+        alias (str): Optional table alias to qualify the columns with.
+
+    Returns:
+        str: Comma-separated select list.
+    """
+    prefix = f'{alias}.' if alias else ''
+    return ', '.join(prefix + column for column in columns)
+
+
+def projector(columns: tuple, fields):
+    """
+    Builds a function shaping one row read with the given columns.
+
+    Args:
+        columns (tuple): Columns the row was read with.
+        fields (tuple): Requested fields, or None for the positional shape.
+
+    Returns:
+        callable: row -> tuple (no fieldset) or dict keyed by field.
+    """
+    if fields is None:
+        return lambda row: row
+    positions = [(field, columns.index(field)) for field in fields]
+    return lambda row: {field: row[position] for field, position in positions}
@@ -0,0 +1,335 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./app/metrics.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       Flask
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       Scrape GET /metrics
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# metrics.py
+'''
+    Request and Database Metrics
+    ============================
+
+    Request hooks and the cursor wrapper in app/database.py feed an
+    in-process registry, exposed in Prometheus text format at GET /metrics:
+
+        http_requests_total                 requests by route, method and status
+        http_request_duration_seconds       latency histogram by route
+        http_response_size_bytes            body size histogram by route
+        http_request_db_queries             statements run per request, by route
+        http_request_db_seconds             time spent in MySQL per request, by route
+        db_pool_wait_seconds                time spent waiting for a pooled connection
+        db_pool_connections                 open / idle pooled connections
+
+    Streamed responses are measured when the last chunk has been sent,
+    including the rows their body fetched.
+    Every process keeps its own registry: under the pre-fork server a
+    scrape reports the worker that answered it.
+'''
+
+import threading
+import time
+from bisect import bisect_left
+
+from flask import Response, current_app, g, has_app_context, request
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (100, 1000, 10000, 100000, 1000000, 10000000)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+PROMETHEUS_MIMETYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _format_labels(labelnames: tuple, values: tuple, extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Counter:
+    """
+    Monotonic counter with labels.
+
+    Args:
+        name (str): Metric name.
+        documentation (str): HELP text.
+        labelnames (tuple): Label names, in the order values are passed.
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def inc(self, *labels, amount: float = 1) -> None:
+        """
+        Adds amount to the series identified by labels.
+        """
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> list:
+        """
+        Returns the metric in Prometheus text format, one line per item.
+        """
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} counter']
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f'{self.name}{_format_labels(self.labelnames, labels)} {value}')
+        return lines
+
+
+class Histogram:
+    """
+    Cumulative histogram with labels.
+
+    Args:
+        name (str): Metric name.
+        documentation (str): HELP text.
+        buckets (tuple): Ascending upper bounds; +Inf is implied.
+        labelnames (tuple): Label names, in the order values are passed.
+    """
+
+    def __init__(self, name: str, documentation: str, buckets: tuple, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(buckets)
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+        self._series = {}  # labels -> [bucket counts..., +Inf count, sum]
+
+    def observe(self, value: float, *labels) -> None:
+        """
+        Records one observation in the series identified by labels.
+        """
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def render(self) -> list:
+        """
+        Returns the metric in Prometheus text format, one line per item.
+        """
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            snapshot = sorted((labels, list(series)) for labels, series in self._series.items())
+        for labels, series in snapshot:
+            cumulative = 0
+            for bound, count in zip(self.buckets + ('+Inf',), series):
+                cumulative += count
+                le = f'le="{bound}"'
+                lines.append(f'{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}')
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f'{self.name}_sum{label_text} {series[-1]}')
+            lines.append(f'{self.name}_count{label_text} {cumulative}')
+        return lines
+
+
+class RequestStats:
+    """
+    Database work done on behalf of one request.
+    """
+    __slots__ = ('start', 'queries', 'db_seconds')
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.queries = 0
+        self.db_seconds = 0.0
+
+
+class MetricsRegistry:
+    """
+    The metrics collected by one application.
+    """
+
+    def __init__(self):
+        self.requests = Counter('http_requests_total', 'Requests served.',
+                                ('route', 'method', 'status'))
+        self.latency = Histogram('http_request_duration_seconds', 'Request latency.',
+                                 LATENCY_BUCKETS, ('route', 'method'))
+        self.response_size = Histogram('http_response_size_bytes', 'Response body size.',
+                                       SIZE_BUCKETS, ('route', 'method'))
+        self.db_queries = Histogram('http_request_db_queries', 'SQL statements run per request.',
+                                    COUNT_BUCKETS, ('route', 'method'))
+        self.db_time = Histogram('http_request_db_seconds', 'Time spent in MySQL per request.',
+                                 LATENCY_BUCKETS, ('route', 'method'))
+        self.pool_wait = Histogram('db_pool_wait_seconds', 'Time spent waiting for a pooled connection.',
+                                   LATENCY_BUCKETS)
+
+    def render(self, pool=None) -> str:
+        """
+        Returns every metric in Prometheus text format.
+
+        Args:
+            pool (ConnectionPool): Pool whose size is reported as a gauge, if given.
+        """
+        lines = []
+        for metric in (self.requests, self.latency, self.response_size,
+                       self.db_queries, self.db_time, self.pool_wait):
+            lines.extend(metric.render())
+        if pool is not None:
+            lines.append('# HELP db_pool_connections Pooled MySQL connections.')
+            lines.append('# TYPE db_pool_connections gauge')
+            lines.append(f'db_pool_connections{{state="open"}} {pool.size}')
+            lines.append(f'db_pool_connections{{state="idle"}} {pool.idle}')
+        return '\n'.join(lines) + '\n'
+
+
+def observe_query(seconds: float, statements: int = 0) -> None:
+    """
+    Adds driver time to the current request; a no-op outside a request.
+
+    Called by the cursor wrapper in app/database.py for every execute and
+    fetch, since unbuffered cursors spend most of their time fetching.
+
+    Args:
+        seconds (float): Time spent in the driver call.
+        statements (int): Number of SQL statements the call ran.
+    """
+    stats = g.get('request_stats') if has_app_context() else None
+    if stats is not None:
+        stats.db_seconds += seconds
+        stats.queries += statements
+
+
+def observe_pool_wait(seconds: float) -> None:
+    """
+    Records how long the current context waited for a pooled connection.
+
+    Args:
+        seconds (float): Time spent in ConnectionPool.acquire().
+    """
+    registry = current_app.extensions.get('metrics') if has_app_context() else None
+    if registry is not None:
+        registry.pool_wait.observe(seconds)
+
+
+def _start_request() -> None:
+    g.request_stats = RequestStats()
+
+
+def _finish_request(response):
+    stats = g.get('request_stats')
+    if stats is None:
+        return response
+    registry = current_app.extensions['metrics']
+    route = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+    method = request.method
+    status = response.status_code
+
+    def record(size):
+        registry.requests.inc(route, method, str(status))
+        registry.latency.observe(time.perf_counter() - stats.start, route, method)
+        registry.db_queries.observe(stats.queries, route, method)
+        registry.db_time.observe(stats.db_seconds, route, method)
+        if size is not None:
+            registry.response_size.observe(size, route, method)
+
+    if not response.is_streamed:
+        g.pop('request_stats')
+        record(response.calculate_content_length())
+        return response
+
+    # Streamed bodies: count bytes as they are sent, record once the stream is closed.
+    # The stats stay in g, where observe_query still finds them while a
+    # stream_with_context body fetches its rows.
+    sent = [0]
+    body = response.response
+
+    def counting():
+        for chunk in body:
+            sent[0] += len(chunk.encode() if isinstance(chunk, str) else chunk)
+            yield chunk
+
+    response.response = counting()
+    response.call_on_close(lambda: record(sent[0]))
+    return response
+
+
+def metrics_view():
+    """
+    GET /metrics: every metric of this process in Prometheus text format.
+    """
+    registry = current_app.extensions['metrics']
+    body = registry.render(current_app.extensions.get('db_pool'))
+    return Response(body, mimetype=PROMETHEUS_MIMETYPE)
+
+
+def init_app(app) -> None:
+    """
+    Installs the request hooks and the /metrics endpoint.
+
+    Args:
+        app (Flask): Flask application.
+    """
+    app.extensions['metrics'] = MetricsRegistry()
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
+    app.add_url_rule('/metrics', 'metrics', metrics_view, methods=['GET'])
@@ -0,0 +1,212 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./app/migrations.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       mysql-connector-python
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       python ../migrate.py
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# migrations.py
+'''
+    Schema Migration Runner
+    =======================
+
+    Versioned migrations live in sql/migrations as NNNN_description.sql and
+    are applied in version order on top of sql/create_tables.sql.  Applied
+    versions are recorded in the 'schema_migrations' table, so running the
+    runner again only applies new files.
+'''
+
+import logging
+import os
+import re
+from collections import namedtuple
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                              'sql', 'migrations')
+
+# Serializes concurrent runners, e.g. several hosts deploying at once
+LOCK_NAME = 'bookstore_schema_migrations'
+LOCK_TIMEOUT = 60
+
+Migration = namedtuple('Migration', ['version', 'name', 'path'])
+
+_FILENAME = re.compile(r'^(\d+)_([\w-]+)\.sql$')
+
+logger = logging.getLogger(__name__)
+
+
+def load_migrations(directory: str = MIGRATIONS_DIR) -> list:
+    """
+    Lists the migration files in a directory.
+
+    Args:
+        directory (str): Directory holding NNNN_description.sql files.
+
+    Returns:
+        list: Migration tuples sorted by version.
+
+    Raises:
+        ValueError: If two files share a version number.
+    """
+    migrations = {}
+    for filename in os.listdir(directory):
+        match = _FILENAME.match(filename)
+        if not match:
+            continue
+        version = int(match.group(1))
+        if version in migrations:
+            raise ValueError(f'Duplicate migration version {version}: {filename}')
+        migrations[version] = Migration(version, match.group(2), os.path.join(directory, filename))
+    return [migrations[version] for version in sorted(migrations)]
+
+
+def split_statements(sql: str) -> list:
+    """
+    Splits a migration script into statements.
+
+    Full-line '--' comments are dropped and statements are separated by ';'.
+    Migrations must therefore not contain ';' inside string literals.
+
+    Args:
+        sql (str): Script text.
+
+    Returns:
+        list: Non-empty SQL statements without the trailing ';'.
+    """
+    lines = [line for line in sql.splitlines() if not line.strip().startswith('--')]
+    return [statement.strip() for statement in '\n'.join(lines).split(';') if statement.strip()]
+
+
+def applied_versions(cursor) -> set:
+    """
+    Returns the versions recorded in 'schema_migrations', creating the table if needed.
+
+    Args:
+        cursor: Database cursor.
+
+    Returns:
+        set: Applied version numbers.
+    """
+    cursor.execute(
+        "CREATE TABLE IF NOT EXISTS schema_migrations ("
+        " version INT NOT NULL PRIMARY KEY,"
+        " name VARCHAR(255) NOT NULL,"
+        " applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+    )
+    cursor.execute("SELECT version FROM schema_migrations")
+    return {row[0] for row in cursor.fetchall()}
+
+
+def pending_migrations(conn, directory: str = MIGRATIONS_DIR) -> list:
+    """
+    Lists migrations that have not been applied yet.
+
+    Args:
+        conn: Database connection.
+        directory (str): Migration directory.
+
+    Returns:
+        list: Pending Migration tuples in version order.
+    """
+    cursor = conn.cursor()
+    applied = applied_versions(cursor)
+    cursor.close()
+    return [migration for migration in load_migrations(directory) if migration.version not in applied]
+
+
+def apply_migrations(conn, directory: str = MIGRATIONS_DIR) -> list:
+    """
+    Applies every pending migration in version order.
+
+    MySQL commits DDL implicitly, so a migration that fails half-way is not
+    rolled back; it is left unrecorded and must be fixed by hand.
+
+    Args:
+        conn: Database connection.
+        directory (str): Migration directory.
+
+    Returns:
+        list: Migration tuples that were applied.
+
+    Raises:
+        RuntimeError: If another runner holds the migration lock.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT GET_LOCK(%s, %s)", (LOCK_NAME, LOCK_TIMEOUT))
+    if cursor.fetchone()[0] != 1:
+        cursor.close()
+        raise RuntimeError('Another migration run is in progress')
+
+    applied = []
+    try:
+        for migration in pending_migrations(conn, directory):
+            logger.info(f"Applying migration {migration.version:04d}_{migration.name}")
+            with open(migration.path, encoding='utf-8') as f:
+                statements = split_statements(f.read())
+            for statement in statements:
+                cursor.execute(statement)
+            cursor.execute("INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+                           (migration.version, migration.name))
+            conn.commit()
+            applied.append(migration)
+    finally:
+        cursor.execute("SELECT RELEASE_LOCK(%s)", (LOCK_NAME,))
+        cursor.fetchone()
+        cursor.close()
+    return applied
@@ -0,0 +1,193 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./app/multiget.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       Flask, mysql-connector-python
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       Imported by app.books and app.authors
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# multiget.py
+'''
+    Multi-Get by ID
+    ===============
+
+    GET /books?ids=1,2,3 and GET /authors?ids=... resolve a list of IDs in
+    one request.  Each ID is first looked up in the single-item cache (the
+    same entries GET /books/:id uses); the misses are read with one
+    parameterized "WHERE id IN (...)" query per MULTIGET_CHUNK_SIZE IDs
+    and written back to the cache.
+
+    Query parameters:
+        ids - comma-separated IDs, at most MULTIGET_MAX_IDS of them
+'''
+
+from flask import current_app, request
+
+from .cache import cache_key, get_cache
+from .database import get_db
+from .fields import column_list
+
+
+class MultiGetError(ValueError):
+    """
+    Raised when the ids query parameter is invalid.
+    """
+
+
+def parse_ids(raw: str, max_ids: int) -> list:
+    """
+    Parses a comma-separated list of IDs.
+
+    Duplicates are dropped; the first occurrence keeps its position.
+
+    Args:
+        raw (str): Value of the ids parameter.
+        max_ids (int): Largest number of distinct IDs accepted.
+
+    Returns:
+        list: Distinct IDs in request order.
+
+    Raises:
+        MultiGetError: If the list is empty, too long or holds a non-positive integer.
+    """
+    ids = {}
+    for part in raw.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            item_id = int(part)
+        except ValueError:
+            raise MultiGetError(f"Invalid id '{part}'")
+        if item_id <= 0:
+            raise MultiGetError(f"Invalid id '{part}'")
+        ids[item_id] = None
+    if not ids:
+        raise MultiGetError("'ids' must list at least one id")
+    if len(ids) > max_ids:
+        raise MultiGetError(f"At most {max_ids} ids per request")
+    return list(ids)
+
+
+def get_ids() -> list:
+    """
+    Reads the ids parameter of the current request.
+
+    Returns:
+        list: Distinct IDs in request order.
+
+    Raises:
+        MultiGetError: If ids is invalid.
+    """
+    return parse_ids(request.args['ids'], current_app.config['MULTIGET_MAX_IDS'])
+
+
+def select_by_ids_sql(table: str, columns: tuple, ids: list) -> tuple:
+    """
+    Builds the query reading one chunk of live rows by ID.
+
+    Args:
+        table (str): Table name.
+        columns (tuple): Columns to select, before updated_at.
+        ids (list): IDs of one chunk.
+
+    Returns:
+        tuple: (query, params)
+    """
+    placeholders = ', '.join(['%s'] * len(ids))
+    return (f"SELECT {column_list(columns + ('updated_at',))} FROM {table} "
+            f"WHERE id IN ({placeholders}) AND is_deleted = 0", tuple(ids))
+
+
+def fetch_by_ids(table: str, kind: str, columns: tuple, ids: list) -> dict:
+    """
+    Fetches live rows by ID through the single-item cache.
+
+    Rows are cached exactly as the single-item endpoint caches them:
+    the given columns followed by updated_at.
+
+    Args:
+        table (str): Table name.
+        kind (str): Cache key kind, e.g. 'book' or 'author'.
+        columns (tuple): Columns to select, before updated_at.
+        ids (list): Distinct IDs.
+
+    Returns:
+        dict: Row tuple by ID; IDs that are missing or soft-deleted are absent.
+    """
+    cache = get_cache()
+    keys = {item_id: cache_key(kind, item_id) for item_id in ids}
+    cached = cache.get_many(list(keys.values()))
+    rows = {item_id: cached[key] for item_id, key in keys.items() if key in cached}
+    misses = [item_id for item_id in ids if item_id not in rows]
+    if not misses:
+        return rows
+
+    chunk_size = current_app.config['MULTIGET_CHUNK_SIZE']
+    found = {}
+    cursor = get_db().cursor()
+    try:
+        for start in range(0, len(misses), chunk_size):
+            cursor.execute(*select_by_ids_sql(table, columns, misses[start:start + chunk_size]))
+            for row in cursor.fetchall():
+                found[row[0]] = row
+    finally:
+        cursor.close()
+    cache.set_many({keys[item_id]: row for item_id, row in found.items()})
+    rows.update(found)
+    return rows
@@ -0,0 +1,232 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./app/pagination.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       Flask
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       Import pagination helpers in blueprints
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# pagination.py
+'''
+    Keyset Pagination Helpers
+    =========================
+
+    List endpoints walk the primary key instead of using OFFSET, so every
+    page is an index range scan ("id > last seen id") whatever its depth.
+
+    Query parameters:
+        limit     - page size (defaults to DEFAULT_PAGE_SIZE, capped at MAX_PAGE_SIZE)
+        after_id  - return rows with an id greater than this value
+        cursor    - opaque token returned as "next_cursor" by the previous page
+'''
+
+import base64
+import binascii
+import json
+
+from flask import current_app, request
+
+
+class PaginationError(ValueError):
+    """
+    Raised when paging parameters in the query string are invalid.
+    """
+
+
+def encode_cursor(position: dict) -> str:
+    """
+    Encodes a page position as an opaque, URL-safe token.
+
+    Args:
+        position (dict): JSON-serializable page position.
+
+    Returns:
+        str: Cursor token.
+    """
+    raw = json.dumps(position, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token: str) -> dict:
+    """
+    Decodes a token produced by encode_cursor.
+
+    Args:
+        token (str): Cursor token.
+
+    Returns:
+        dict: Page position.
+
+    Raises:
+        PaginationError: If the token is malformed.
+    """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, binascii.Error, UnicodeError):
+        raise PaginationError('Invalid cursor')
+    if not isinstance(position, dict):
+        raise PaginationError('Invalid cursor')
+    return position
+
+
+def _non_negative_int(name: str, value) -> int:
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise PaginationError(f"'{name}' must be an integer")
+    if number < 0:
+        raise PaginationError(f"'{name}' must not be negative")
+    return number
+
+
+def get_page_params() -> tuple:
+    """
+    Reads the page size and start position from the current request.
+
+    Returns:
+        tuple: (limit, after_id)
+
+    Raises:
+        PaginationError: If limit, after_id or cursor are invalid.
+    """
+    return parse_page_params(request.args, current_app.config['DEFAULT_PAGE_SIZE'],
+                             current_app.config['MAX_PAGE_SIZE'])
+
+
+def get_page_size() -> int:
+    """
+    Reads the page size from the current request.
+
+    Returns:
+        int: Page size.
+
+    Raises:
+        PaginationError: If limit is invalid.
+    """
+    return parse_limit(request.args, current_app.config['DEFAULT_PAGE_SIZE'],
+                       current_app.config['MAX_PAGE_SIZE'])
+
+
+def parse_limit(args, default_size: int, max_size: int) -> int:
+    """
+    Parses the page size from query arguments.
+
+    Args:
+        args (Mapping): Query string arguments.
+        default_size (int): Page size when no limit is given.
+        max_size (int): Largest page size honoured.
+
+    Returns:
+        int: Page size.
+
+    Raises:
+        PaginationError: If limit is not a positive integer.
+    """
+    limit = default_size
+    if 'limit' in args:
+        limit = _non_negative_int('limit', args['limit'])
+        if limit == 0:
+            raise PaginationError("'limit' must be positive")
+    return min(limit, max_size)
+
+
+def parse_page_params(args, default_size: int, max_size: int) -> tuple:
+    """
+    Parses the page size and start position from query arguments.
+
+    Args:
+        args (Mapping): Query string arguments.
+        default_size (int): Page size when no limit is given.
+        max_size (int): Largest page size honoured.
+
+    Returns:
+        tuple: (limit, after_id)
+
+    Raises:
+        PaginationError: If limit, after_id or cursor are invalid.
+    """
+    limit = parse_limit(args, default_size, max_size)
+
+    after_id = 0
+    if 'cursor' in args:
+        after_id = _non_negative_int('cursor', decode_cursor(args['cursor']).get('after_id'))
+    elif 'after_id' in args:
+        after_id = _non_negative_int('after_id', args['after_id'])
+    return limit, after_id
+
+
+def paginate(rows: list, limit: int, key=lambda row: row[0]) -> tuple:
+    """
+    Trims a "limit + 1" result set to one page and builds the next cursor.
+
+    Queries fetch one row more than the page size; its presence tells
+    whether a further page exists without a separate COUNT query.
+
+    Args:
+        rows (list): Rows ordered by primary key, at most limit + 1 of them.
+        limit (int): Page size.
+        key (callable): Returns the primary key of a row.
+
+    Returns:
+        tuple: (page rows, next cursor or None)
+    """
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor({'after_id': key(rows[-1])})
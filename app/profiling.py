@@ -0,0 +1,250 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./app/profiling.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       Flask
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       Imported by app.database; read via GET /admin/queries
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# profiling.py
+'''
+    Query Profiling and Slow-Query Log
+    ==================================
+
+    Every statement run through a ``get_db()`` cursor is timed from
+    execute() until its results have been fetched, and aggregated here by
+    normalized SQL text (literals and placeholders replaced by "?").
+
+    Statements slower than SLOW_QUERY_THRESHOLD seconds are logged with
+    the shape of their bind parameters (types only, never values).  With
+    SLOW_QUERY_EXPLAIN enabled, the EXPLAIN plan of slow SELECTs is captured
+    as well, just before the connection goes back to the pool.
+
+    At most QUERY_STATS_MAX_ENTRIES distinct statements are kept; when full,
+    the statement with the least total time is dropped.
+'''
+
+import logging
+import re
+import threading
+
+logger = logging.getLogger(__name__)
+
+_STRING = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.|\"\")*\"")
+_NUMBER = re.compile(r'(?<![\w.])-?\d+(?:\.\d+)?\b')
+_PLACEHOLDER = re.compile(r'%\(\w+\)s|%s')
+_IN_LIST = re.compile(r'\(\s*\?(?:\s*,\s*\?)+\s*\)')
+_ROW_LIST = re.compile(r'(\(\s*\?(?:\s*,\s*\?)*\s*\))(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))+')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_sql(statement) -> str:
+    """
+    Reduces a statement to its shape so that executions can be grouped.
+
+    Args:
+        statement (str | bytes): SQL text.
+
+    Returns:
+        str: SQL with literals and placeholders as "?" and lists collapsed.
+    """
+    if isinstance(statement, bytes):
+        statement = statement.decode('utf-8', 'replace')
+    sql = _WHITESPACE.sub(' ', statement).strip()
+    sql = _STRING.sub('?', sql)
+    sql = _PLACEHOLDER.sub('?', sql)
+    sql = _NUMBER.sub('?', sql)
+    sql = _ROW_LIST.sub(r'\1, ...', sql)
+    return _IN_LIST.sub('(...)', sql)
+
+
+def param_shape(params, many: bool = False) -> str:
+    """
+    Describes bind parameters by type, without their values.
+
+    Args:
+        params: Parameters passed to execute(), or the sequence passed to executemany().
+        many (bool): Whether params is an executemany() sequence.
+
+    Returns:
+        str: e.g. "(int, str)", "{id: int}" or "1000 x (str, int, str)".
+    """
+    if many:
+        params = list(params)
+        return f'{len(params)} x {param_shape(params[0]) if params else "()"}'
+    if params is None:
+        return '()'
+    if isinstance(params, dict):
+        return '{' + ', '.join(f'{key}: {type(value).__name__}' for key, value in params.items()) + '}'
+    return '(' + ', '.join(type(value).__name__ for value in params) + ')'
+
+
+def is_select(statement) -> bool:
+    """
+    Returns whether a statement is a plain SELECT that EXPLAIN can describe.
+    """
+    if isinstance(statement, bytes):
+        statement = statement.decode('utf-8', 'replace')
+    return statement.lstrip().upper().startswith('SELECT')
+
+
+class QueryProfiler:
+    """
+    Thread-safe per-statement aggregates and slow-query log.
+
+    Args:
+        threshold (float): Seconds above which a statement is logged as slow.
+        explain (bool): Whether to capture EXPLAIN for slow SELECTs.
+        max_entries (int): Distinct statements kept.
+    """
+
+    def __init__(self, threshold: float = 0.5, explain: bool = False, max_entries: int = 500):
+        self.threshold = threshold
+        self.explain = explain
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def record(self, statement, params, seconds: float, many: bool = False) -> bool:
+        """
+        Adds one execution to the aggregates and logs it if slow.
+
+        Args:
+            statement (str): SQL text as passed to the cursor.
+            params: Bind parameters.
+            seconds (float): Execute plus fetch time.
+            many (bool): Whether this was an executemany().
+
+        Returns:
+            bool: True when the statement was slow and EXPLAIN is wanted.
+        """
+        sql = normalize_sql(statement)
+        slow = seconds >= self.threshold
+        shape = param_shape(params, many)
+        with self._lock:
+            entry = self._stats.get(sql)
+            if entry is None:
+                if len(self._stats) >= self.max_entries:
+                    del self._stats[min(self._stats, key=lambda key: self._stats[key]['total_seconds'])]
+                entry = self._stats[sql] = {'sql': sql, 'count': 0, 'total_seconds': 0.0,
+                                            'max_seconds': 0.0, 'slow_count': 0,
+                                            'params': shape, 'explain': None}
+            entry['count'] += 1
+            entry['total_seconds'] += seconds
+            entry['max_seconds'] = max(entry['max_seconds'], seconds)
+            if slow:
+                entry['slow_count'] += 1
+        if slow:
+            logger.warning(f"Slow query ({seconds:.3f}s): {sql} params={shape}")
+        return slow and self.explain and is_select(statement)
+
+    def record_explain(self, statement, plan: list) -> None:
+        """
+        Attaches an EXPLAIN plan to a statement and logs it.
+
+        Args:
+            statement (str): SQL text as passed to the cursor.
+            plan (list): EXPLAIN rows as dictionaries.
+        """
+        sql = normalize_sql(statement)
+        with self._lock:
+            if sql in self._stats:
+                self._stats[sql]['explain'] = plan
+        logger.warning(f"EXPLAIN {sql}: {plan}")
+
+    def top(self, limit: int = 20, order: str = 'total_seconds') -> list:
+        """
+        Returns the heaviest statements.
+
+        Args:
+            limit (int): Number of statements.
+            order (str): 'total_seconds', 'max_seconds', 'count' or 'slow_count'.
+
+        Returns:
+            list: Aggregate dictionaries, heaviest first, with avg_seconds added.
+        """
+        with self._lock:
+            entries = [dict(entry) for entry in self._stats.values()]
+        for entry in entries:
+            entry['avg_seconds'] = entry['total_seconds'] / entry['count']
+        entries.sort(key=lambda entry: entry[order], reverse=True)
+        return entries[:limit]
+
+    def reset(self) -> None:
+        """
+        Drops every aggregate.
+        """
+        with self._lock:
+            self._stats.clear()
+
+
+def create_profiler(app_config) -> QueryProfiler:
+    """
+    Builds the query profiler from the Flask configuration.
+
+    Args:
+        app_config (dict): Flask application config.
+
+    Returns:
+        QueryProfiler: Profiler instance.
+    """
+    return QueryProfiler(
+        threshold=app_config['SLOW_QUERY_THRESHOLD'],
+        explain=app_config['SLOW_QUERY_EXPLAIN'],
+        max_entries=app_config['QUERY_STATS_MAX_ENTRIES'],
+    )
@@ -0,0 +1,234 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./app/purge.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       mysql-connector-python
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       Run from the command line using python purge.py
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# purge.py
+'''
+    Purge of Long-Deleted Rows
+    ==========================
+
+    Soft-deleted rows stay in books and authors until they are purged.
+    purge_table() moves rows whose deleted_at is older than the retention
+    window into books_archive / authors_archive, a small batch at a time:
+
+        SELECT id ... FOR UPDATE        (idx_*_purge range, keyset on deleted_at, id)
+        INSERT INTO *_archive SELECT ... WHERE id IN (...)
+        DELETE FROM * WHERE id IN (...)
+        update author_stats for the authors involved
+        COMMIT, then sleep
+
+    Each batch is its own short transaction, so row locks are held for
+    milliseconds and replicas apply the job as many small events.  Books
+    are purged before authors; an author is only archived once no book
+    in the hot table references it.
+
+    Rows soft-deleted before deleted_at existed carry the migration's
+    backfill from updated_at; rows with no deleted_at at all (e.g. bulk
+    loaded by tools.generate_data) are never purged.
+'''
+
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+
+from .stats import discard_authors, refresh_authors
+
+logger = logging.getLogger(__name__)
+
+# Hot-table columns copied to the archive (generated columns are left out)
+ARCHIVE_COLUMNS = {
+    'books': ('id', 'title', 'author_id', 'publication_date', 'is_deleted', 'updated_at', 'deleted_at'),
+    'authors': ('id', 'name', 'email', 'is_deleted', 'updated_at', 'deleted_at'),
+}
+
+# Extra condition a row must meet before it can leave the hot table
+PURGE_CONDITIONS = {
+    'books': '',
+    'authors': 'AND NOT EXISTS (SELECT 1 FROM books b WHERE b.author_id = t.id)',
+}
+
+
+def purge_cutoff(retention_days: float, now: datetime = None) -> datetime:
+    """
+    Returns the deleted_at value before which rows are purged.
+
+    Args:
+        retention_days (float): Days a soft-deleted row is kept.
+        now (datetime): Current time as naive UTC; the current UTC time when None.
+
+    Returns:
+        datetime: Cutoff as naive UTC, comparable with deleted_at (sessions
+        run with time_zone '+00:00').
+    """
+    return (now or datetime.now(timezone.utc).replace(tzinfo=None)) - timedelta(days=retention_days)
+
+
+def purge_batch(conn, table: str, cutoff: datetime, after: tuple, batch_size: int,
+                dry_run: bool = False) -> tuple:
+    """
+    Archives and deletes one batch of long-deleted rows in one transaction.
+
+    Args:
+        conn: Database connection (autocommit off).
+        table (str): 'books' or 'authors'.
+        cutoff (datetime): Only rows deleted before this are purged.
+        after (tuple): (deleted_at, id) of the last row seen, or None to start.
+        batch_size (int): Rows per batch.
+        dry_run (bool): Only find the rows; nothing is changed or locked.
+
+    Returns:
+        tuple: (number of rows purged, (deleted_at, id) of the last row or None)
+    """
+    columns = ', '.join(ARCHIVE_COLUMNS[table])
+    query = (f"SELECT t.id, t.deleted_at FROM {table} t "
+             f"WHERE t.is_deleted = 1 AND t.deleted_at < %s {PURGE_CONDITIONS[table]}")
+    params = [cutoff]
+    if after:
+        query += " AND (t.deleted_at, t.id) > (%s, %s)"
+        params.extend(after)
+    query += " ORDER BY t.deleted_at, t.id LIMIT %s"
+    params.append(batch_size)
+    if not dry_run:
+        query += " FOR UPDATE"
+
+    cursor = conn.cursor()
+    try:
+        cursor.execute(query, tuple(params))
+        rows = cursor.fetchall()
+        if not rows:
+            conn.rollback()
+            return 0, None
+        if dry_run:
+            conn.rollback()
+            return len(rows), (rows[-1][1], rows[-1][0])
+
+        ids = tuple(row[0] for row in rows)
+        placeholders = ', '.join(['%s'] * len(ids))
+        if table == 'books':
+            cursor.execute(f"SELECT DISTINCT author_id FROM books WHERE id IN ({placeholders})", ids)
+            author_ids = [row[0] for row in cursor.fetchall()]
+        cursor.execute(f"INSERT INTO {table}_archive ({columns}, archived_at) "
+                       f"SELECT {columns}, NOW(6) FROM {table} WHERE id IN ({placeholders})", ids)
+        cursor.execute(f"DELETE FROM {table} WHERE id IN ({placeholders}) AND is_deleted = 1", ids)
+        purged = cursor.rowcount
+        if table == 'books':
+            refresh_authors(cursor, author_ids)
+        else:
+            discard_authors(cursor, ids)
+        conn.commit()
+        return purged, (rows[-1][1], rows[-1][0])
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def purge_table(conn, table: str, cutoff: datetime, batch_size: int = 500, sleep: float = 0.1,
+                max_batches: int = None, dry_run: bool = False) -> int:
+    """
+    Purges every row of a table soft-deleted before cutoff, batch by batch.
+
+    Args:
+        conn: Database connection (autocommit off).
+        table (str): 'books' or 'authors'.
+        cutoff (datetime): Only rows deleted before this are purged.
+        batch_size (int): Rows per batch and transaction.
+        sleep (float): Seconds to pause between batches.
+        max_batches (int): Stop after this many batches; None for no limit.
+        dry_run (bool): Count the rows that would be purged without changing them.
+
+    Returns:
+        int: Rows purged (or that would be purged).
+    """
+    total, after, batches = 0, None, 0
+    while max_batches is None or batches < max_batches:
+        purged, after = purge_batch(conn, table, cutoff, after, batch_size, dry_run)
+        total += purged
+        batches += 1
+        if after is None or purged < batch_size:
+            break
+        logger.info(f"{table}: {'found' if dry_run else 'purged'} {total} row(s) so far")
+        if sleep and not dry_run:
+            time.sleep(sleep)
+    return total
+
+
+def purge(conn, retention_days: float, batch_size: int = 500, sleep: float = 0.1,
+          max_batches: int = None, dry_run: bool = False) -> dict:
+    """
+    Purges long-deleted books, then long-deleted authors.
+
+    Args:
+        conn: Database connection (autocommit off).
+        retention_days (float): Days a soft-deleted row is kept.
+        batch_size (int): Rows per batch and transaction.
+        sleep (float): Seconds to pause between batches.
+        max_batches (int): Batch limit per table; None for no limit.
+        dry_run (bool): Count the rows that would be purged without changing them.
+
+    Returns:
+        dict: Rows purged per table.
+    """
+    cutoff = purge_cutoff(retention_days)
+    return {table: purge_table(conn, table, cutoff, batch_size, sleep, max_batches, dry_run)
+            for table in ('books', 'authors')}
@@ -0,0 +1,320 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./app/query.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       Flask
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       Imported by app.books and app.authors
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# query.py
+'''
+    Filtered and Sorted List Queries
+    ================================
+
+    GET /books and GET /authors accept whitelisted filters and a sort
+    order.  ListQuery turns them into parameterized SQL: column names come
+    only from the specs below, and values are always bind parameters.
+
+        /books?author_id=7&published_after=2020-01-01&sort=publication_date,-id
+        /authors?email_domain=example.com&sort=name
+
+    Sorting is paginated by keyset on the sort key, with id appended as the
+    final tie-breaker (in the direction of the last key, unless given).  The
+    composite indexes of migration 0004 lead with is_deleted followed by
+    each sort column, so a single-direction sort is a range scan; a sort
+    mixing directions needs a filesort of the matching rows.
+
+    Sorting by id alone keeps the original "after_id" cursors.  Any other
+    sort uses cursors that carry the sort and the last row's key values.
+'''
+
+from collections import namedtuple
+from datetime import date
+
+from .pagination import PaginationError, _non_negative_int, decode_cursor, encode_cursor
+
+Filter = namedtuple('Filter', 'param column operator parse')
+ListSpec = namedtuple('ListSpec', 'table filters sortable nullable')
+
+
+class QueryError(ValueError):
+    """
+    Raised when a filter or sort parameter is invalid.
+    """
+
+
+def _parse_int(param: str, value: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        raise QueryError(f"'{param}' must be an integer")
+
+
+def _parse_date(param: str, value: str) -> date:
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise QueryError(f"'{param}' must be a date (YYYY-MM-DD)")
+
+
+def _parse_prefix(param: str, value: str) -> str:
+    if not value:
+        raise QueryError(f"'{param}' must not be empty")
+    # Escape LIKE wildcards so the prefix matches literally
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+
+
+def _parse_domain(param: str, value: str) -> str:
+    value = value.strip().lstrip('@')
+    if not value or '@' in value:
+        raise QueryError(f"'{param}' must be a domain such as example.com")
+    return value
+
+
+def _parse_text(param: str, value: str) -> str:
+    return value
+
+
+BOOK_LIST = ListSpec(
+    table='books',
+    filters=(
+        Filter('author_id', 'author_id', '=', _parse_int),
+        Filter('published_after', 'publication_date', '>', _parse_date),
+        Filter('published_before', 'publication_date', '<', _parse_date),
+        Filter('title_prefix', 'title', 'LIKE', _parse_prefix),
+    ),
+    sortable={'id': _parse_int, 'title': _parse_text, 'author_id': _parse_int,
+              'publication_date': _parse_date},
+    nullable=('author_id', 'publication_date'),
+)
+
+AUTHOR_LIST = ListSpec(
+    table='authors',
+    filters=(
+        Filter('email_domain', 'email_domain', '=', _parse_domain),
+    ),
+    sortable={'id': _parse_int, 'name': _parse_text, 'email': _parse_text},
+    nullable=('email',),
+)
+
+
+def parse_sort(raw, spec: ListSpec) -> tuple:
+    """
+    Parses "?sort=col,-col" into (column, descending) pairs ending with id.
+
+    Args:
+        raw (str): Value of the sort parameter, or None.
+        spec (ListSpec): Resource whose sortable columns are allowed.
+
+    Returns:
+        tuple: (column, descending) pairs.
+
+    Raises:
+        QueryError: If a column is unknown or repeated.
+    """
+    keys = []
+    for item in (raw or '').split(','):
+        item = item.strip()
+        if not item:
+            continue
+        descending = item.startswith('-')
+        column = item.lstrip('-+')
+        if column not in spec.sortable:
+            raise QueryError(f"Cannot sort by '{column}'; expected any of {', '.join(spec.sortable)}")
+        if column in (key for key, _ in keys):
+            raise QueryError(f"'{column}' appears more than once in 'sort'")
+        keys.append((column, descending))
+        if column == 'id':
+            break
+    if not keys or keys[-1][0] != 'id':
+        keys.append(('id', keys[-1][1] if keys else False))
+    return tuple(keys)
+
+
+def sort_text(keys: tuple) -> str:
+    """
+    Renders sort keys back to their "?sort=" form.
+    """
+    return ','.join(('-' if descending else '') + column for column, descending in keys)
+
+
+class ListQuery:
+    """
+    A filtered, sorted, keyset-paginated list read from query arguments.
+
+    Args:
+        spec (ListSpec): Resource being listed.
+        args (Mapping): Query string arguments.
+
+    Raises:
+        QueryError: If a filter or the sort is invalid.
+        PaginationError: If after_id or cursor are invalid.
+    """
+
+    def __init__(self, spec: ListSpec, args):
+        self.spec = spec
+        self.filters = [(f, f.parse(f.param, args[f.param])) for f in spec.filters if f.param in args]
+        self.sort = parse_sort(args.get('sort'), spec)
+        self.by_id = self.sort == (('id', False),)
+        self.after = None
+
+        if self.by_id:
+            if 'cursor' in args:
+                self.after = (_non_negative_int('cursor', decode_cursor(args['cursor']).get('after_id')),)
+            elif 'after_id' in args:
+                self.after = (_non_negative_int('after_id', args['after_id']),)
+        elif 'after_id' in args:
+            raise PaginationError("'after_id' only applies to the default sort; use 'cursor'")
+        elif 'cursor' in args:
+            position = decode_cursor(args['cursor'])
+            values = position.get('after')
+            if position.get('sort') != sort_text(self.sort) or not isinstance(values, list) \
+                    or len(values) != len(self.sort):
+                raise PaginationError('Cursor does not match the sort')
+            self.after = tuple(None if value is None else self._parse_key(column, value)
+                               for (column, _), value in zip(self.sort, values))
+
+    def _parse_key(self, column: str, value):
+        try:
+            return self.spec.sortable[column](column, str(value))
+        except QueryError:
+            raise PaginationError('Invalid cursor')
+
+    def columns(self, columns: tuple) -> tuple:
+        """
+        Adds the sort columns a cursor is built from to a select list.
+        """
+        return columns + tuple(column for column, _ in self.sort if column not in columns)
+
+    def sql(self, columns: tuple, limit: int = None) -> tuple:
+        """
+        Builds the SELECT for one page, or for every matching row when limit is None.
+
+        Args:
+            columns (tuple): Whitelisted columns to select; see columns().
+            limit (int): Page size; one extra row is fetched to detect a next page.
+
+        Returns:
+            tuple: (query, params)
+        """
+        clauses, params = ['is_deleted = 0'], []
+        for f, value in self.filters:
+            clauses.append(f"{f.column} {f.operator} %s")
+            params.append(value)
+        if self.after is not None:
+            clause, after_params = self._after_clause(self.sort, self.after, leading=True)
+            clauses.append(clause)
+            params.extend(after_params)
+
+        order = ', '.join(f"{column} {'DESC' if descending else 'ASC'}" for column, descending in self.sort)
+        query = f"SELECT {', '.join(columns)} FROM {self.spec.table} WHERE {' AND '.join(clauses)} ORDER BY {order}"
+        if limit is not None:
+            query += " LIMIT %s"
+            params.append(limit + 1)
+        return query, tuple(params)
+
+    def _after_clause(self, keys: tuple, values: tuple, leading: bool = False) -> tuple:
+        """
+        Builds "row sorts after values" for the given keys.
+
+        MySQL sorts NULL first ascending and last descending; the clause
+        follows that.  The leading key also gets a plain range condition,
+        which lets the optimizer seek the index instead of scanning.
+        """
+        (column, descending), rest = keys[0], keys[1:]
+        value = values[0]
+        nullable = column in self.spec.nullable
+        beyond = '<' if descending else '>'
+        if not rest:
+            return f"{column} {beyond} %s", [value]
+
+        tail, tail_params = self._after_clause(rest, values[1:])
+        if value is None:
+            if descending:
+                return f"({column} IS NULL AND {tail})", tail_params
+            return f"({column} IS NOT NULL OR ({column} IS NULL AND {tail}))", tail_params
+
+        after_nulls = f" OR {column} IS NULL" if descending and nullable else ''
+        clause = f"({column} {beyond} %s{after_nulls} OR ({column} = %s AND {tail}))"
+        params = [value, value] + tail_params
+        if leading:
+            seek = f"({column} {'<=' if descending else '>='} %s{after_nulls})"
+            clause, params = f"{seek} AND {clause}", [value] + params
+        return clause, params
+
+    def paginate(self, rows: list, limit: int, columns: tuple) -> tuple:
+        """
+        Trims a "limit + 1" result to one page and builds the next cursor.
+
+        Args:
+            rows (list): Rows read with sql(columns, limit).
+            limit (int): Page size.
+            columns (tuple): Columns the rows were read with.
+
+        Returns:
+            tuple: (page rows, next cursor or None)
+        """
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        last = rows[-1]
+        if self.by_id:
+            return rows, encode_cursor({'after_id': last[columns.index('id')]})
+        values = [last[columns.index(column)] for column, _ in self.sort]
+        values = [value.isoformat() if isinstance(value, date) else value for value in values]
+        return rows, encode_cursor({'sort': sort_text(self.sort), 'after': values})
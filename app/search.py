@@ -0,0 +1,167 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./app/search.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       Flask
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       Imported by app.books
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# search.py
+'''
+    Full-Text Search Helpers
+    ========================
+
+    GET /books/search turns the user's text into an InnoDB boolean-mode
+    query: every word is required and matched as a prefix, so "hidd harb"
+    finds "The Hidden Harbor".  Results are ranked by relevance, so pages
+    are addressed by offset (inside an opaque cursor) and the result list
+    is capped at SEARCH_MAX_RESULTS, as with any ranked search.
+
+    Query parameters:
+        q       - search text (required)
+        limit   - page size (defaults to SEARCH_PAGE_SIZE, capped at MAX_PAGE_SIZE)
+        cursor  - "next_cursor" value from the previous page
+'''
+
+import re
+
+from flask import current_app, request
+
+from .pagination import _non_negative_int, decode_cursor, encode_cursor, parse_limit
+
+# Characters InnoDB's full-text parser treats as part of a word
+WORD = re.compile(r'\w+', re.UNICODE)
+MAX_TERMS = 10
+
+# InnoDB's default stopword list (INFORMATION_SCHEMA.INNODB_FT_DEFAULT_STOPWORD);
+# these are never indexed, so requiring one would match nothing.
+STOPWORDS = frozenset((
+    'a', 'about', 'an', 'are', 'as', 'at', 'be', 'by', 'com', 'de', 'en', 'for', 'from', 'how',
+    'i', 'in', 'is', 'it', 'la', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was', 'what',
+    'when', 'where', 'who', 'will', 'with', 'und', 'www',
+))
+
+
+class SearchError(ValueError):
+    """
+    Raised when the search text has no searchable word.
+    """
+
+
+def boolean_query(text: str, min_token_size: int) -> str:
+    """
+    Builds a boolean-mode full-text query requiring every word as a prefix.
+
+    Operators in the input are dropped, and so are stopwords and words
+    shorter than the index's minimum token size, which are not indexed.
+
+    Args:
+        text (str): Search text as typed by the user.
+        min_token_size (int): Shortest indexed word.
+
+    Returns:
+        str: Query for MATCH ... AGAINST (... IN BOOLEAN MODE), e.g. "+hidd* +harb*".
+
+    Raises:
+        SearchError: If no searchable word remains.
+    """
+    terms = [word for word in WORD.findall(text)
+             if len(word) >= min_token_size and word.lower() not in STOPWORDS][:MAX_TERMS]
+    if not terms:
+        raise SearchError(f"'q' must contain a word of at least {min_token_size} characters")
+    return ' '.join(f'+{term}*' for term in terms)
+
+
+def get_search_params() -> tuple:
+    """
+    Reads the search text and page position from the current request.
+
+    Returns:
+        tuple: (boolean query, limit, offset)
+
+    Raises:
+        SearchError: If q is missing or has no searchable word.
+        PaginationError: If limit or cursor are invalid.
+    """
+    config = current_app.config
+    query = boolean_query(request.args.get('q', ''), config['SEARCH_MIN_TOKEN_SIZE'])
+
+    limit = parse_limit(request.args, config['SEARCH_PAGE_SIZE'], config['MAX_PAGE_SIZE'])
+
+    offset = 0
+    if 'cursor' in request.args:
+        offset = _non_negative_int('cursor', decode_cursor(request.args['cursor']).get('offset'))
+    return query, limit, offset
+
+
+def next_search_cursor(rows: list, limit: int, offset: int, max_results: int) -> tuple:
+    """
+    Trims a "limit + 1" ranked result set to one page and builds the next cursor.
+
+    Args:
+        rows (list): Ranked rows, at most limit + 1 of them.
+        limit (int): Page size.
+        offset (int): Rank of the first row.
+        max_results (int): Deepest rank served.
+
+    Returns:
+        tuple: (page rows, next cursor or None)
+    """
+    if len(rows) <= limit or offset + limit >= max_results:
+        return rows[:limit], None
+    return rows[:limit], encode_cursor({'offset': offset + limit})
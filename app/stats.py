@@ -0,0 +1,242 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./app/stats.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       mysql-connector-python
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       Imported by app.books, app.authors and app.purge
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# stats.py
+'''
+    Per-Author Aggregates
+    =====================
+
+    author_stats holds one row per author (authors who never had a book
+    may have none): the number of books, the number of live books and the
+    publication date range of the live books.  Reports and
+    GET /authors/:id?include=stats read one row by primary key instead of
+    grouping over books.
+
+    The write handlers keep it current inside their own transactions:
+
+        new books            add_books()        counts added from the new ID range
+        update, delete,      refresh_authors()  the author's row recomputed over
+        restore, purge                          idx_books_author_live
+
+    A date range cannot be shrunk incrementally, so every change other
+    than an insert recomputes the affected authors' rows; each recompute
+    reads only that author's books.  The functions returning
+    (query, params) are shared with the async app; rebuild() recomputes
+    every row in batches (python -m tools.rebuild_author_stats).
+'''
+
+STATS_FIELDS = ('book_count', 'live_book_count', 'first_published', 'last_published')
+
+_AGGREGATE = """
+    INSERT INTO author_stats (author_id, book_count, live_book_count, first_published, last_published)
+    SELECT a.id, COUNT(b.id), COALESCE(SUM(b.is_deleted = 0), 0),
+           MIN(CASE WHEN b.is_deleted = 0 THEN b.publication_date END),
+           MAX(CASE WHEN b.is_deleted = 0 THEN b.publication_date END)
+    FROM authors a LEFT JOIN books b ON b.author_id = a.id
+    WHERE {where}
+    GROUP BY a.id
+    ON DUPLICATE KEY UPDATE
+        book_count = VALUES(book_count), live_book_count = VALUES(live_book_count),
+        first_published = VALUES(first_published), last_published = VALUES(last_published)
+"""
+
+
+def _placeholders(values) -> str:
+    return ', '.join(['%s'] * len(values))
+
+
+def add_books_sql(first_id: int, last_id: int) -> tuple:
+    """
+    Builds the statement adding newly inserted books to their authors' rows.
+
+    Args:
+        first_id (int): First ID of the inserted books.
+        last_id (int): Last ID of the inserted books (consecutive IDs).
+
+    Returns:
+        tuple: (query, params)
+    """
+    query = """
+        INSERT INTO author_stats (author_id, book_count, live_book_count, first_published, last_published)
+        SELECT author_id, COUNT(*), SUM(is_deleted = 0),
+               MIN(CASE WHEN is_deleted = 0 THEN publication_date END),
+               MAX(CASE WHEN is_deleted = 0 THEN publication_date END)
+        FROM books
+        WHERE id BETWEEN %s AND %s AND author_id IS NOT NULL
+        GROUP BY author_id
+        ON DUPLICATE KEY UPDATE
+            book_count = book_count + VALUES(book_count),
+            live_book_count = live_book_count + VALUES(live_book_count),
+            first_published = LEAST(COALESCE(first_published, VALUES(first_published)),
+                                    COALESCE(VALUES(first_published), first_published)),
+            last_published = GREATEST(COALESCE(last_published, VALUES(last_published)),
+                                      COALESCE(VALUES(last_published), last_published))
+    """
+    return query, (first_id, last_id)
+
+
+def refresh_authors_sql(author_ids: list) -> tuple:
+    """
+    Builds the statement recomputing the rows of the given authors.
+
+    Returns:
+        tuple: (query, params)
+    """
+    ids = tuple(author_ids)
+    return _AGGREGATE.format(where=f"a.id IN ({_placeholders(ids)})"), ids
+
+
+def refresh_book_authors_sql(book_ids: list) -> tuple:
+    """
+    Builds the statement recomputing the rows of the authors of the given books.
+
+    Returns:
+        tuple: (query, params)
+    """
+    ids = tuple(book_ids)
+    where = f"a.id IN (SELECT author_id FROM books WHERE id IN ({_placeholders(ids)}))"
+    return _AGGREGATE.format(where=where), ids
+
+
+def add_books(cursor, first_id: int, last_id: int) -> None:
+    """
+    Adds newly inserted books (IDs first_id..last_id) to their authors' rows.
+    """
+    cursor.execute(*add_books_sql(first_id, last_id))
+
+
+def refresh_authors(cursor, author_ids) -> None:
+    """
+    Recomputes the rows of the given authors; None IDs are ignored.
+    """
+    author_ids = sorted(set(author_id for author_id in author_ids if author_id is not None))
+    if author_ids:
+        cursor.execute(*refresh_authors_sql(author_ids))
+
+
+def refresh_book_authors(cursor, book_ids) -> None:
+    """
+    Recomputes the rows of the authors of the given books.
+    """
+    book_ids = list(book_ids)
+    if book_ids:
+        cursor.execute(*refresh_book_authors_sql(book_ids))
+
+
+def discard_authors(cursor, author_ids) -> None:
+    """
+    Deletes the rows of authors removed from the authors table.
+    """
+    author_ids = tuple(author_ids)
+    if author_ids:
+        cursor.execute(f"DELETE FROM author_stats WHERE author_id IN ({_placeholders(author_ids)})", author_ids)
+
+
+def fetch_author_stats(cursor, author_id: int) -> dict:
+    """
+    Reads an author's aggregates with one primary key lookup.
+
+    Args:
+        cursor: Database cursor.
+        author_id (int): Author's ID.
+
+    Returns:
+        dict: STATS_FIELDS; zeros and None for an author without books.
+    """
+    cursor.execute(f"SELECT {', '.join(STATS_FIELDS)} FROM author_stats WHERE author_id = %s", (author_id,))
+    row = cursor.fetchone()
+    return dict(zip(STATS_FIELDS, row or (0, 0, None, None)))
+
+
+def rebuild(conn, batch_size: int = 1000, first_id: int = 1) -> int:
+    """
+    Recomputes every row, batch_size authors per transaction.
+
+    Walks author IDs in ranges, so each batch reads one slice of authors
+    and their books through idx_books_author_live, then drops rows of
+    authors that no longer exist.
+
+    Args:
+        conn: Database connection (autocommit off).
+        batch_size (int): Authors per batch.
+        first_id (int): Lowest author ID recomputed, e.g. the first of a bulk load.
+
+    Returns:
+        int: Rows in author_stats afterwards.
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT COALESCE(MAX(id), 0) FROM authors")
+        (max_id,) = cursor.fetchone()
+        for start in range(first_id - 1, max_id, batch_size):
+            cursor.execute(_AGGREGATE.format(where="a.id > %s AND a.id <= %s"), (start, start + batch_size))
+            conn.commit()
+        cursor.execute("DELETE s FROM author_stats s LEFT JOIN authors a ON a.id = s.author_id WHERE a.id IS NULL")
+        conn.commit()
+        cursor.execute("SELECT COUNT(*) FROM author_stats")
+        return cursor.fetchone()[0]
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
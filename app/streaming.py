@@ -0,0 +1,136 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./app/streaming.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       Flask, mysql-connector-python
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       Import stream_rows in blueprints
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# streaming.py
+'''
+    Streaming (NDJSON) Export Helpers
+    =================================
+
+    List endpoints can stream every matching row as newline-delimited JSON
+    instead of returning one page.  Rows are read from an unbuffered cursor
+    in fixed-size batches, so memory use stays bounded whatever the table
+    size.
+
+    A client asks for a stream with "?stream=1" or "Accept: application/x-ndjson".
+'''
+
+import logging
+
+from flask import Response, current_app, request, stream_with_context
+from .database import get_db
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+logger = logging.getLogger(__name__)
+
+
+def wants_stream() -> bool:
+    """
+    Tells whether the current request asks for an NDJSON stream.
+
+    Returns:
+        bool: True for "?stream=1" or when NDJSON is the preferred media type.
+    """
+    if request.args.get('stream', '').lower() in ('1', 'true', 'yes'):
+        return True
+    best = request.accept_mimetypes.best_match(['application/json', NDJSON_MIMETYPE])
+    return best == NDJSON_MIMETYPE
+
+
+def stream_rows(query: str, params: tuple = (), transform=None) -> Response:
+    """
+    Runs a query and streams its rows as NDJSON, one row per line.
+
+    The query is executed before the response starts, so database errors
+    still surface as a normal 500.  The connection stays checked out until
+    the last batch has been sent.
+
+    Args:
+        query (str): SQL SELECT statement.
+        params (tuple): Query parameters.
+        transform (callable): Optional function shaping each row before encoding.
+
+    Returns:
+        Response: Streaming response with mimetype application/x-ndjson.
+    """
+    batch_size = current_app.config['STREAM_BATCH_SIZE']
+    cursor = get_db().cursor(buffered=False)
+    cursor.execute(query, params)
+
+    def generate():
+        dumps = current_app.json.dumps
+        shape = transform or (lambda row: row)
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield ''.join(dumps(shape(row)) + '\n' for row in rows)
+        finally:
+            try:
+                cursor.close()
+            except Exception as e:
+                # An abandoned stream leaves unread rows; the pool discards that connection.
+                logger.warning(f"Stream closed before all rows were read: {str(e)}")
+
+    return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
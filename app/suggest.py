@@ -0,0 +1,481 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./app/suggest.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       Flask, mysql-connector-python
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       GET /suggest?q=hidd
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# suggest.py
+'''
+    In-Process Prefix Index for Type-Ahead Suggestions
+    ==================================================
+
+    GET /suggest answers from memory, without a MySQL round trip.  Each
+    process holds one PrefixIndex for live book titles and one for live
+    author names:
+
+        - a sorted array of keys (case-folded text from each word start,
+          so "harb" finds "The Hidden Harbor") with a parallel array of IDs
+        - a small sorted delta taking writes, merged into the array once it
+          outgrows SUGGEST_COMPACT_RATIO of it
+        - the current text of every indexed row; array entries that no
+          longer match it are skipped and dropped at the next merge
+
+    A background thread loads both tables with a streaming scan on the
+    process's first request.  Every SUGGEST_REFRESH_INTERVAL seconds it
+    then re-reads the rows whose updated_at is at most
+    SUGGEST_REFRESH_OVERLAP seconds before the newest version it has seen,
+    and drops the rows the purge job archived in the same window.  The
+    overlap catches a transaction that commits after another one with a
+    later updated_at; re-applying a row already seen changes nothing.  The
+    write handlers also update the index directly, so a process sees its
+    own writes at once and other processes' writes within one interval.
+'''
+
+import heapq
+import logging
+import re
+import threading
+import time
+from array import array
+from bisect import bisect_left
+
+from flask import Blueprint, current_app, jsonify, request
+
+from .database import connection_factory
+
+suggest_blueprint = Blueprint('suggest', __name__)
+logger = logging.getLogger(__name__)
+
+_SPACES = re.compile(r'\s+')
+
+# kind -> (table, text column)
+SOURCES = {'book': ('books', 'title'), 'author': ('authors', 'name')}
+
+
+def normalize(text: str) -> str:
+    """
+    Case-folds text and collapses whitespace, as keys and queries are compared.
+    """
+    return _SPACES.sub(' ', text).strip().casefold()
+
+
+class PrefixIndex:
+    """
+    Thread-safe prefix index from text to row ID.
+
+    Args:
+        max_words (int): Word starts indexed per text.
+        compact_ratio (float): Delta size, relative to the array, that triggers a merge.
+    """
+
+    def __init__(self, max_words: int = 8, compact_ratio: float = 0.05):
+        self.max_words = max_words
+        self.compact_ratio = compact_ratio
+        self._lock = threading.Lock()
+        self._keys = []
+        self._ids = array('q')
+        self._delta = []    # sorted (key, id) pairs
+        self._texts = {}    # id -> current text
+        self._hidden = set()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._texts) - len(self._hidden)
+
+    def keys_for(self, text: str) -> list:
+        """
+        Returns the keys of a text: its normalized form from each word start.
+        """
+        norm = normalize(text)
+        starts = [0] + [match.end() for match in re.finditer(' ', norm)]
+        return [norm[start:] for start in starts[:self.max_words] if norm[start:]]
+
+    def load(self, rows) -> None:
+        """
+        Replaces the whole index.
+
+        Args:
+            rows (iterable): (id, text) pairs of live rows.
+        """
+        texts = {}
+        entries = []
+        for row_id, text in rows:
+            if text:
+                texts[row_id] = text
+                entries.extend((key, row_id) for key in self.keys_for(text))
+        entries.sort()
+        keys = [key for key, _ in entries]
+        ids = array('q', (row_id for _, row_id in entries))
+        with self._lock:
+            # Writes made while loading are kept; the refresh poll settles any conflict.
+            for _, row_id in self._delta:
+                if row_id in self._texts:
+                    texts[row_id] = self._texts[row_id]
+            self._keys, self._ids = keys, ids
+            self._texts = texts
+            self._hidden &= set(texts)
+            self._compact()
+
+    def put(self, row_id: int, text: str) -> None:
+        """
+        Indexes a row under its current text; a hidden row stays hidden.
+        """
+        if not text:
+            return self.discard(row_id)
+        with self._lock:
+            previous = self._texts.get(row_id)
+            if previous == text:
+                return
+            self._texts[row_id] = text
+            for key in self.keys_for(text):
+                index = bisect_left(self._delta, (key, row_id))
+                self._delta.insert(index, (key, row_id))
+            if len(self._delta) > max(1000, len(self._keys) * self.compact_ratio):
+                self._compact()
+
+    def discard(self, row_id: int) -> None:
+        """
+        Hides a row that was deleted; its text is kept for a later restore.
+        """
+        with self._lock:
+            if row_id in self._texts:
+                self._hidden.add(row_id)
+
+    def remove(self, row_id: int) -> None:
+        """
+        Forgets a row that no longer exists; its array entries go at the next merge.
+        """
+        with self._lock:
+            self._texts.pop(row_id, None)
+            self._hidden.discard(row_id)
+
+    def restore(self, row_id: int) -> bool:
+        """
+        Shows a row hidden by discard().
+
+        Returns:
+            bool: False when the row's text is unknown to this index.
+        """
+        with self._lock:
+            self._hidden.discard(row_id)
+            return row_id in self._texts
+
+    def search(self, prefix: str, limit: int = 10) -> list:
+        """
+        Returns live rows with a key starting with prefix, in key order.
+
+        Args:
+            prefix (str): Typed text.
+            limit (int): Maximum number of rows.
+
+        Returns:
+            list: (id, text) pairs, each row at most once.
+        """
+        prefix = normalize(prefix)
+        results, seen = [], set()
+        if not prefix:
+            return results
+        with self._lock:
+            start = bisect_left(self._keys, prefix)
+            base = ((self._keys[i], self._ids[i]) for i in range(start, len(self._keys)))
+            delta = iter(self._delta[bisect_left(self._delta, (prefix,)):])
+            for key, row_id in heapq.merge(base, delta):
+                if not key.startswith(prefix):
+                    break
+                if row_id in seen or row_id in self._hidden:
+                    continue
+                text = self._texts.get(row_id)
+                if text is None or not normalize(text).endswith(key):
+                    continue
+                seen.add(row_id)
+                results.append((row_id, text))
+                if len(results) == limit:
+                    break
+        return results
+
+    def _compact(self) -> None:
+        """
+        Merges the delta into the array and drops stale entries.  Caller holds the lock.
+        """
+        valid = lambda entry: (entry[1] in self._texts
+                               and normalize(self._texts[entry[1]]).endswith(entry[0]))
+        merged = [entry for entry in heapq.merge(zip(self._keys, self._ids), self._delta) if valid(entry)]
+        self._keys = [key for key, _ in merged]
+        self._ids = array('q', (row_id for _, row_id in merged))
+        self._delta = []
+
+
+class SuggestIndexes:
+    """
+    The book and author prefix indexes of one application, plus their loader thread.
+
+    Args:
+        app_config (dict): Flask application config.
+    """
+
+    def __init__(self, app_config):
+        self.indexes = {kind: PrefixIndex(app_config['SUGGEST_MAX_WORDS'], app_config['SUGGEST_COMPACT_RATIO'])
+                        for kind in SOURCES}
+        self.refresh_interval = app_config['SUGGEST_REFRESH_INTERVAL']
+        self.refresh_overlap = app_config['SUGGEST_REFRESH_OVERLAP']
+        self.batch_size = app_config['STREAM_BATCH_SIZE']
+        self.ready = threading.Event()
+        self._connect = connection_factory(app_config)
+        self._started = False
+        self._start_lock = threading.Lock()
+
+    def start(self) -> None:
+        """
+        Starts the loader thread once per process.
+        """
+        if self._started:
+            return
+        with self._start_lock:
+            if not self._started:
+                self._started = True
+                threading.Thread(target=self._run, name='suggest-index', daemon=True).start()
+
+    def _run(self) -> None:
+        since = {}
+        conn = None
+        while True:
+            try:
+                if conn is None:
+                    conn = self._connect()
+                    conn.autocommit = True
+                if not self.ready.is_set():
+                    for kind in SOURCES:
+                        since[kind] = self._load(conn, kind)
+                    self.ready.set()
+                    logger.info('Suggestion index loaded: '
+                                + ', '.join(f'{len(index)} {kind}s' for kind, index in self.indexes.items()))
+                else:
+                    for kind in SOURCES:
+                        since[kind] = self._refresh(conn, kind, since[kind])
+            except Exception as e:
+                logger.error(f"Suggestion index update failed: {str(e)}")
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+                conn = None
+            time.sleep(self.refresh_interval)
+
+    def _load(self, conn, kind: str):
+        """
+        Loads one index with a streaming scan of the live rows.
+
+        Returns:
+            tuple: (updated_at, archived_at) versions read before the scan;
+            refreshes start there.
+        """
+        table, column = SOURCES[kind]
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT (SELECT MAX(updated_at) FROM {table}), "
+                       f"(SELECT MAX(archived_at) FROM {table}_archive)")
+        version = cursor.fetchone()
+        cursor.close()
+
+        def rows():
+            cursor = conn.cursor(buffered=False)
+            cursor.execute(f"SELECT id, {column} FROM {table} WHERE is_deleted = 0")
+            while True:
+                batch = cursor.fetchmany(self.batch_size)
+                if not batch:
+                    break
+                yield from batch
+            cursor.close()
+
+        self.indexes[kind].load(rows())
+        return version
+
+    def _refresh(self, conn, kind: str, since: tuple) -> tuple:
+        """
+        Applies rows changed, and drops rows archived, since the given versions.
+
+        Both polls reach SUGGEST_REFRESH_OVERLAP seconds back, so a row
+        whose transaction committed after a later-stamped one is still
+        seen.  Rows read again are applied again, which changes nothing.
+
+        Args:
+            since (tuple): (updated_at, archived_at) versions; None for an empty table.
+
+        Returns:
+            tuple: New versions.
+        """
+        table, column = SOURCES[kind]
+        index = self.indexes[kind]
+        updated, archived = since
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT id, {column}, is_deleted, updated_at FROM {table} "
+                       f"WHERE updated_at >= %s - INTERVAL %s SECOND ORDER BY updated_at",
+                       (updated or '1970-01-01', self.refresh_overlap))
+        for row_id, text, is_deleted, updated_at in cursor.fetchall():
+            if is_deleted:
+                index.discard(row_id)
+            else:
+                index.put(row_id, text)
+                index.restore(row_id)
+            updated = updated_at
+        cursor.execute(f"SELECT id, archived_at FROM {table}_archive "
+                       f"WHERE archived_at >= %s - INTERVAL %s SECOND ORDER BY archived_at",
+                       (archived or '1970-01-01', self.refresh_overlap))
+        for row_id, archived_at in cursor.fetchall():
+            index.remove(row_id)
+            archived = archived_at
+        cursor.close()
+        return updated, archived
+
+
+def get_suggest():
+    """
+    Returns the suggestion indexes of the current application, or None when disabled.
+    """
+    return current_app.extensions.get('suggest')
+
+
+def suggest_put(kind: str, row_id: int, text: str) -> None:
+    """
+    Indexes a created or updated row.  Called by the write handlers.
+    """
+    suggest = get_suggest()
+    if suggest is not None:
+        suggest.indexes[kind].put(row_id, text)
+
+
+def suggest_discard(kind: str, row_id: int) -> None:
+    """
+    Hides a soft-deleted row.  Called by the delete handlers.
+    """
+    suggest = get_suggest()
+    if suggest is not None:
+        suggest.indexes[kind].discard(row_id)
+
+
+def suggest_restore(kind: str, row_id: int) -> None:
+    """
+    Shows a restored row again.  Called by the restore handlers.
+    """
+    suggest = get_suggest()
+    if suggest is not None:
+        suggest.indexes[kind].restore(row_id)
+
+
+# endpoint: GET /suggest
+@suggest_blueprint.route('/suggest', methods=['GET'])
+def suggest() -> dict:
+    """
+    Suggest book titles and author names starting with the typed text.
+
+    A word start anywhere in the title or name matches.
+
+    Query Parameters:
+        q (str): Typed text.
+        type (str): 'book', 'author' or 'all' (default).
+        limit (int): Suggestions per type (default SUGGEST_LIMIT, at most 100).
+
+    API Response:
+        200 OK - Suggestions retrieved successfully (possibly none).
+        400 Bad Request - Missing q, invalid type or limit.
+        503 Service Unavailable - The index of this process is still loading.
+
+    Response Schema:
+        {
+            "books": [{"id": int, "title": str}],
+            "authors": [{"id": int, "name": str}]
+        }
+    """
+    text = request.args.get('q', '')
+    if not normalize(text):
+        return jsonify({'error': "'q' is required"}), 400
+    kind = request.args.get('type', 'all')
+    if kind not in ('book', 'author', 'all'):
+        return jsonify({'error': "'type' must be one of: book, author, all"}), 400
+    try:
+        limit = int(request.args.get('limit', current_app.config['SUGGEST_LIMIT']))
+    except ValueError:
+        return jsonify({'error': "'limit' must be an integer"}), 400
+    if not 1 <= limit <= 100:
+        return jsonify({'error': "'limit' must be between 1 and 100"}), 400
+
+    indexes = get_suggest()
+    if indexes is None or not indexes.ready.is_set():
+        return jsonify({'error': 'Suggestion index is loading'}), 503
+
+    body = {}
+    for source, (table, column) in SOURCES.items():
+        if kind in (source, 'all'):
+            body[table] = [{'id': row_id, column: value}
+                           for row_id, value in indexes.indexes[source].search(text, limit)]
+    return jsonify(body)
+
+
+def init_app(app) -> None:
+    """
+    Attaches the suggestion indexes; loading starts with the first request.
+
+    Args:
+        app (Flask): Flask application.
+    """
+    app.register_blueprint(suggest_blueprint)
+    if not app.config['SUGGEST_ENABLED']:
+        return
+    indexes = app.extensions['suggest'] = SuggestIndexes(app.config)
+    app.before_request(indexes.start)
@@ -67,10 +67,12 @@
         Returns all authors from the database.
 '''
 
-from app import app
-from app.database import db
+from app import create_app
+from app.database import get_db
 import logging
 
+app = create_app()
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -86,7 +88,7 @@ def test_connection():
     """
     try:
         # Create a cursor object to execute SQL queries
-        cursor = db.cursor()
+        cursor = get_db().cursor()
         
         # Execute SELECT query to fetch all authors
         cursor.execute("SELECT * FROM authors")
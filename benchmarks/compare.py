@@ -0,0 +1,133 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./benchmarks/compare.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       -- NOT Applicable -- (standard library only)
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       python -m benchmarks.compare baseline.json current.json --tolerance 10
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# compare.py
+'''
+    Benchmark Result Comparison
+    ===========================
+
+    Matches the results of two run_benchmarks.py reports by scenario and
+    concurrency and prints the change in throughput and tail latency.
+    Exits with status 1 when any pair regressed by more than --tolerance
+    percent (lower req/s, or higher p95/p99), so it can gate CI.
+'''
+
+import argparse
+import json
+import sys
+
+# metric -> True when a higher value is better
+METRICS = {'rps': True, 'p95_ms': False, 'p99_ms': False}
+
+
+def load_results(path: str) -> dict:
+    """
+    Reads a report and indexes its results by (scenario, concurrency).
+    """
+    with open(path) as f:
+        report = json.load(f)
+    return {(result['scenario'], result['concurrency']): result for result in report['results']}
+
+
+def compare(baseline: dict, current: dict, tolerance: float) -> list:
+    """
+    Compares the results present in both reports.
+
+    Args:
+        baseline (dict): Indexed baseline results.
+        current (dict): Indexed current results.
+        tolerance (float): Allowed change in percent before a regression is flagged.
+
+    Returns:
+        list: (scenario, concurrency, metric, old, new, change %, regressed) tuples.
+    """
+    rows = []
+    for key in sorted(baseline.keys() & current.keys()):
+        for metric, higher_is_better in METRICS.items():
+            old, new = baseline[key][metric], current[key][metric]
+            change = (new - old) / old * 100 if old else 0.0
+            worse = -change if higher_is_better else change
+            rows.append(key + (metric, old, new, round(change, 1), worse > tolerance))
+    return rows
+
+
+def main():
+    """
+    Prints the comparison and exits non-zero on regressions.
+    """
+    parser = argparse.ArgumentParser(description='Compare two benchmark reports.')
+    parser.add_argument('baseline', help='report of the reference commit')
+    parser.add_argument('current', help='report of the commit under test')
+    parser.add_argument('--tolerance', type=float, default=10,
+                        help='allowed regression in percent (default 10)')
+    args = parser.parse_args()
+
+    rows = compare(load_results(args.baseline), load_results(args.current), args.tolerance)
+    for scenario, concurrency, metric, old, new, change, regressed in rows:
+        flag = '  REGRESSION' if regressed else ''
+        print(f"{scenario:<24} c={concurrency:<4} {metric:<7} {old:>10} -> {new:>10} ({change:+.1f}%){flag}")
+    sys.exit(1 if any(row[-1] for row in rows) else 0)
+
+
+if __name__ == '__main__':
+    main()
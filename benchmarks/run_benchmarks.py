@@ -0,0 +1,299 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./benchmarks/run_benchmarks.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       -- NOT Applicable -- (standard library only)
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       python -m benchmarks.run_benchmarks --url http://localhost:8000 --output results.json
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# run_benchmarks.py
+'''
+    HTTP Benchmark Runner
+    =====================
+
+    Drives a running server (e.g. "python run.py --production") with a
+    fixed number of concurrent keep-alive clients per scenario and reports
+    latency percentiles and throughput as JSON:
+
+        {
+            "meta": {"commit": str, "url": str, "duration": float, ...},
+            "results": [
+                {
+                    "scenario": str, "concurrency": int,
+                    "requests": int, "errors": int, "rps": float,
+                    "p50_ms": float, "p95_ms": float, "p99_ms": float,
+                    "mean_ms": float, "max_ms": float
+                }
+            ]
+        }
+
+    Request IDs are drawn from a seeded random generator, so repeated runs
+    against the same seeded database issue the same request mix.  Compare
+    two result files with benchmarks/compare.py.
+'''
+
+import argparse
+import http.client
+import json
+import math
+import platform
+import random
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+
+def scenarios(books: int, authors: int, page_size: int) -> dict:
+    """
+    Returns the benchmarked requests.
+
+    Each scenario is a function of a random generator returning
+    (method, path, body).  Write scenarios are only run with --writes.
+
+    Args:
+        books (int): Number of seeded books (IDs 1..books).
+        authors (int): Number of seeded authors (IDs 1..authors).
+        page_size (int): limit used by list scenarios.
+
+    Returns:
+        dict: Scenario name -> (request function, is_write)
+    """
+    def book_id(rng):
+        return rng.randint(1, books)
+
+    def author_id(rng):
+        return rng.randint(1, authors)
+
+    return {
+        'list_books_first_page': (lambda rng: ('GET', f'/books?limit={page_size}', None), False),
+        'list_books_deep_page': (lambda rng: ('GET', f'/books?limit={page_size}&after_id={book_id(rng)}', None), False),
+        'list_books_fields': (lambda rng: ('GET', f'/books?limit={page_size}&after_id={book_id(rng)}&fields=title', None), False),
+        'get_book': (lambda rng: ('GET', f'/books/{book_id(rng)}', None), False),
+        'list_authors_deep_page': (lambda rng: ('GET', f'/authors?limit={page_size}&after_id={author_id(rng)}', None), False),
+        'get_author': (lambda rng: ('GET', f'/authors/{author_id(rng)}', None), False),
+        'get_author_books': (lambda rng: ('GET', f'/authors/{author_id(rng)}/books?limit={page_size}', None), False),
+        'create_book': (lambda rng: ('POST', '/books', {
+            'title': f'Benchmark {rng.randrange(10 ** 9)}',
+            'author_id': author_id(rng),
+            'publication_date': '2024-01-01'}), True),
+        'update_book': (lambda rng: ('PUT', f'/books/{book_id(rng)}', {
+            'title': f'Benchmark {rng.randrange(10 ** 9)}',
+            'author_id': author_id(rng),
+            'publication_date': '2024-01-01'}), True),
+    }
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """
+    Returns the nearest-rank percentile of an ascending list.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def run_level(url: str, request_for, concurrency: int, duration: float, seed: int) -> dict:
+    """
+    Runs one scenario with a fixed number of clients for a fixed time.
+
+    Every client thread owns one keep-alive connection and sends requests
+    back to back.  A request that fails or answers with a status >= 400
+    counts as an error; its latency is still recorded.
+
+    Args:
+        url (str): Server base URL.
+        request_for (callable): Scenario request function.
+        concurrency (int): Number of concurrent clients.
+        duration (float): Seconds to run.
+        seed (int): Random seed; client n uses seed + n.
+
+    Returns:
+        dict: Request count, error count, throughput and latency percentiles.
+    """
+    target = urlsplit(url)
+    connection_class = http.client.HTTPSConnection if target.scheme == 'https' else http.client.HTTPConnection
+    latencies = [[] for _ in range(concurrency)]
+    errors = [0] * concurrency
+    start_barrier = threading.Barrier(concurrency + 1)
+    deadline = [0.0]
+
+    def client(n):
+        rng = random.Random(seed + n)
+        conn = connection_class(target.hostname, target.port, timeout=30)
+        start_barrier.wait()
+        while time.perf_counter() < deadline[0]:
+            method, path, body = request_for(rng)
+            headers = {'Content-Type': 'application/json'} if body is not None else {}
+            started = time.perf_counter()
+            try:
+                conn.request(method, path, body=json.dumps(body) if body is not None else None,
+                             headers=headers)
+                response = conn.getresponse()
+                response.read()
+                if response.status >= 400:
+                    errors[n] += 1
+            except (OSError, http.client.HTTPException):
+                errors[n] += 1
+                conn.close()
+                conn = connection_class(target.hostname, target.port, timeout=30)
+            latencies[n].append(time.perf_counter() - started)
+        conn.close()
+
+    threads = [threading.Thread(target=client, args=(n,), daemon=True) for n in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    deadline[0] = time.perf_counter() + duration
+    began = time.perf_counter()
+    start_barrier.wait()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - began
+
+    samples = sorted(latency for client_latencies in latencies for latency in client_latencies)
+    to_ms = lambda seconds: round(seconds * 1000, 3)
+    return {
+        'concurrency': concurrency,
+        'requests': len(samples),
+        'errors': sum(errors),
+        'seconds': round(elapsed, 3),
+        'rps': round(len(samples) / elapsed, 1) if elapsed else 0.0,
+        'p50_ms': to_ms(percentile(samples, 0.50)),
+        'p95_ms': to_ms(percentile(samples, 0.95)),
+        'p99_ms': to_ms(percentile(samples, 0.99)),
+        'mean_ms': to_ms(sum(samples) / len(samples)) if samples else 0.0,
+        'max_ms': to_ms(samples[-1]) if samples else 0.0,
+    }
+
+
+def current_commit() -> str:
+    """
+    Returns the checked-out git commit, or None outside a git checkout.
+    """
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    """
+    Runs the selected scenarios at every concurrency level and writes the JSON report.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark the Bookstore API over HTTP.')
+    parser.add_argument('--url', default='http://localhost:8000', help='server base URL')
+    parser.add_argument('--books', type=int, default=1000000, help='number of seeded books')
+    parser.add_argument('--authors', type=int, default=100000, help='number of seeded authors')
+    parser.add_argument('--concurrency', default='1,8,32,64',
+                        help='comma-separated concurrency levels (default 1,8,32,64)')
+    parser.add_argument('--duration', type=float, default=10, help='seconds per level (default 10)')
+    parser.add_argument('--warmup', type=float, default=2, help='warm-up seconds per scenario (default 2)')
+    parser.add_argument('--page-size', type=int, default=100, help='limit for list scenarios (default 100)')
+    parser.add_argument('--scenario', action='append', help='run only this scenario (repeatable)')
+    parser.add_argument('--writes', action='store_true', help='include write scenarios (modifies data)')
+    parser.add_argument('--seed', type=int, default=42, help='random seed (default 42)')
+    parser.add_argument('--output', help='write the JSON report here instead of stdout')
+    args = parser.parse_args()
+
+    available = scenarios(args.books, args.authors, args.page_size)
+    names = args.scenario or [name for name, (_, is_write) in available.items() if args.writes or not is_write]
+    unknown = set(names) - set(available)
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(sorted(unknown))}")
+    levels = [int(level) for level in args.concurrency.split(',')]
+
+    results = []
+    for name in names:
+        request_for = available[name][0]
+        if args.warmup > 0:
+            run_level(args.url, request_for, max(levels), args.warmup, args.seed)
+        for level in levels:
+            result = dict(scenario=name, **run_level(args.url, request_for, level, args.duration, args.seed))
+            results.append(result)
+            print(f"{name:<24} c={level:<4} {result['rps']:>9} req/s  p50={result['p50_ms']}ms "
+                  f"p95={result['p95_ms']}ms p99={result['p99_ms']}ms errors={result['errors']}",
+                  file=sys.stderr)
+
+    report = {
+        'meta': {
+            'commit': current_commit(),
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'url': args.url,
+            'books': args.books,
+            'authors': args.authors,
+            'duration': args.duration,
+            'page_size': args.page_size,
+            'seed': args.seed,
+            'python': platform.python_version(),
+        },
+        'results': results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
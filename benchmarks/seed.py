@@ -0,0 +1,133 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./benchmarks/seed.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       mysql-connector-python
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       python -m benchmarks.seed --authors 100000 --books 1000000 --reset
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# seed.py
+'''
+    Benchmark Data Seeder
+    =====================
+
+    Fills the database configured in app/config.py with a fixed number of
+    authors and books through tools/generate_data.py.  The data is derived
+    from --seed, so two runs with the same arguments produce the same
+    catalogue and benchmark results stay comparable.  Nothing is
+    soft-deleted, so every seeded ID can be requested.
+
+    --reset empties both tables first; IDs then start at 1, which is what
+    run_benchmarks.py assumes when picking IDs to request.
+'''
+
+import argparse
+import logging
+
+from app.database import establish_database_connection
+from tools.generate_data import generate
+
+logger = logging.getLogger(__name__)
+
+
+def reset_tables(conn) -> None:
+    """
+    Removes every book and author and resets their AUTO_INCREMENT counters.
+
+    Args:
+        conn: Database connection.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+    cursor.execute("TRUNCATE TABLE books")
+    cursor.execute("TRUNCATE TABLE authors")
+    cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+    cursor.close()
+
+
+def main():
+    """
+    Seeds the database from the command line.
+    """
+    parser = argparse.ArgumentParser(description='Seed the database for benchmarks.')
+    parser.add_argument('--authors', type=int, default=100000, help='number of authors (default 100000)')
+    parser.add_argument('--books', type=int, default=1000000, help='number of books (default 1000000)')
+    parser.add_argument('--skew', type=float, default=1.0,
+                        help='Zipf exponent of books per author, 0 for uniform (default 1.0)')
+    parser.add_argument('--batch-size', type=int, default=5000, help='rows per INSERT (default 5000)')
+    parser.add_argument('--seed', type=int, default=42, help='random seed (default 42)')
+    parser.add_argument('--reset', action='store_true', help='empty the books and authors tables first')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s',
+                        datefmt='%Y-%m-%d %H:%M:%S')
+
+    conn = establish_database_connection()
+    try:
+        if args.reset:
+            reset_tables(conn)
+        result = generate(conn, args.authors, args.books, method='insert', skew=args.skew,
+                          deleted_fraction=0, batch_size=args.batch_size, seed=args.seed)
+        logger.info(f"Seeded {result['authors']} authors and {result['books']} books "
+                    f"in {result['seconds']}s")
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
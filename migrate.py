@@ -0,0 +1,119 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./migrate.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       mysql-connector-python
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       python migrate.py [--status]
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# migrate.py
+'''
+    Schema Migration Runner
+    =======================
+
+    Applies pending migrations from sql/migrations to the configured database.
+'''
+
+import argparse
+import logging
+
+from app.database import establish_database_connection
+from app.migrations import apply_migrations, pending_migrations
+
+
+def configure_logging():
+    """
+    Configures logging settings.
+
+    Sets logging level to INFO so each applied migration is reported.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s [%(levelname)s] %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
+
+def main():
+    """
+    Applies pending migrations, or lists them with --status.
+    """
+    parser = argparse.ArgumentParser(description='Apply database schema migrations.')
+    parser.add_argument('--status', action='store_true', help='list pending migrations without applying them')
+    args = parser.parse_args()
+
+    configure_logging()
+    logger = logging.getLogger()
+
+    conn = establish_database_connection()
+    try:
+        if args.status:
+            pending = pending_migrations(conn)
+            for migration in pending:
+                print(f"pending  {migration.version:04d}_{migration.name}")
+            if not pending:
+                print('Database schema is up to date')
+        else:
+            applied = apply_migrations(conn)
+            logger.info(f"Applied {len(applied)} migration(s)")
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./purge.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       mysql-connector-python
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       python purge.py [--retention-days N] [--dry-run]
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# purge.py
+'''
+    Purge Job
+    =========
+
+    Moves rows soft-deleted longer than the retention window from books and
+    authors into books_archive and authors_archive, in small throttled
+    batches (see app/purge.py).  Safe to run while the API is serving and
+    to schedule, e.g. nightly from cron:
+
+        0 3 * * *  cd /srv/bookstore && python purge.py
+'''
+
+import argparse
+import logging
+
+from app.config import Config
+from app.database import establish_database_connection
+from app.purge import purge
+
+
+def configure_logging():
+    """
+    Configures logging settings.
+
+    Sets logging level to INFO so progress is reported.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s [%(levelname)s] %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
+
+def main():
+    """
+    Runs the purge with settings from the command line and config.Config.
+    """
+    parser = argparse.ArgumentParser(description='Archive and delete long soft-deleted rows.')
+    parser.add_argument('--retention-days', type=float, default=Config.PURGE_RETENTION_DAYS,
+                        help=f'days a soft-deleted row is kept (default {Config.PURGE_RETENTION_DAYS:g})')
+    parser.add_argument('--batch-size', type=int, default=Config.PURGE_BATCH_SIZE,
+                        help=f'rows per transaction (default {Config.PURGE_BATCH_SIZE})')
+    parser.add_argument('--sleep', type=float, default=Config.PURGE_SLEEP,
+                        help=f'seconds between batches (default {Config.PURGE_SLEEP:g})')
+    parser.add_argument('--max-batches', type=int, help='stop after this many batches per table')
+    parser.add_argument('--dry-run', action='store_true', help='count the rows without purging them')
+    args = parser.parse_args()
+    if args.retention_days < 0 or args.batch_size < 1:
+        parser.error('--retention-days must not be negative and --batch-size must be positive')
+
+    configure_logging()
+    logger = logging.getLogger()
+
+    conn = establish_database_connection()
+    try:
+        purged = purge(conn, args.retention_days, args.batch_size, args.sleep, args.max_batches, args.dry_run)
+        verb = 'Would purge' if args.dry_run else 'Purged'
+        logger.info(f"{verb} {purged['books']} book(s) and {purged['authors']} author(s)")
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
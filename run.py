@@ -25,7 +25,7 @@
 # version           :       1.0
 # Release           :       R1
 #
-# Dependencies      :       Flask
+# Dependencies      :       Flask, gunicorn
 #
 # Installation      :       $ pip install requirements.txt
 #
@@ -65,27 +65,34 @@
 '''
     Application Runner
     ==================
+
+    python run.py                 - Flask development server with debug mode
+    python run.py --production    - pre-fork, multi-threaded gunicorn server
+                                    configured by config.ProductionConfig
 '''
 
+import argparse
 import logging
 
 def configure_logging():
     """
     Configures logging settings.
 
-    Sets logging level to ERROR and formats log messages.
+    Sets logging level to ERROR (WARNING for the slow-query log) and
+    formats log messages.
     """
     logging.basicConfig(
         level=logging.ERROR,
         format='%(asctime)s [%(levelname)s] %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
+    # Slow-query reports are warnings; keep them visible.
+    logging.getLogger('app.profiling').setLevel(logging.WARNING)
 
 configure_logging()
 
 logger = logging.getLogger()
 
-from app import app 
 
 def run_application():
     """
@@ -93,8 +100,58 @@ def run_application():
 
     Enables debug mode.
     """
+    from app import create_app
+    app = create_app()
     app.run(debug=True)
 
 
+def run_production_server():
+    """
+    Runs the application under gunicorn with the ProductionConfig settings.
+
+    Workers are forked before any database connection is opened, and each
+    one builds its own connection pool on first use.  SIGTERM triggers a
+    graceful shutdown: workers stop accepting connections and get
+    SERVER_GRACEFUL_TIMEOUT seconds to finish in-flight requests.
+    """
+    from gunicorn.app.base import BaseApplication
+    from app import config, create_app
+    app = create_app(config.ProductionConfig)
+
+    def worker_exit(server, worker):
+        app.extensions['db_pool'].close_all()
+
+    options = {
+        'bind': app.config['SERVER_BIND'],
+        'workers': app.config['SERVER_WORKERS'],
+        'worker_class': 'gthread',
+        'threads': app.config['SERVER_THREADS'],
+        'keepalive': app.config['SERVER_KEEPALIVE'],
+        'timeout': app.config['SERVER_TIMEOUT'],
+        'graceful_timeout': app.config['SERVER_GRACEFUL_TIMEOUT'],
+        'worker_exit': worker_exit,
+    }
+
+    class ProductionServer(BaseApplication):
+        """
+        Embeds gunicorn so its settings come from the Flask config.
+        """
+
+        def load_config(self):
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return app
+
+    ProductionServer().run()
+
+
 if __name__ == '__main__':
-    run_application()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Run the Bookstore API.')
+    parser.add_argument('--production', action='store_true',
+                        help='serve with gunicorn using config.ProductionConfig')
+    if parser.parse_args().production:
+        run_production_server()
+    else:
+        run_application()
@@ -0,0 +1,18 @@
+-- File name: 0001_add_soft_delete_indexes.sql
+-- Purpose: Indexes for the soft-delete and books-by-author access patterns.
+
+
+-- Live-row scans and keyset pages on 'books':
+--   WHERE is_deleted = 0 AND id > ? ORDER BY id
+CREATE INDEX idx_books_is_deleted_id ON books (is_deleted, id);
+
+-- Live-row scans and keyset pages on 'authors'.
+CREATE INDEX idx_authors_is_deleted_id ON authors (is_deleted, id);
+
+-- Books of one author among live rows:
+--   WHERE author_id = ? AND is_deleted = 0 AND id > ? ORDER BY id
+-- It also serves the foreign key, so the single-column index MySQL
+-- created for FOREIGN KEY (author_id) is dropped.
+ALTER TABLE books
+  ADD INDEX idx_books_author_live (author_id, is_deleted, id),
+  DROP INDEX author_id;
@@ -0,0 +1,16 @@
+-- File name: 0002_add_updated_at.sql
+-- Purpose: Row versions for ETag / Last-Modified support.
+
+
+-- 'updated_at' changes whenever a row is inserted or any of its values
+-- change (including soft delete and restore).  Row ETags are derived from
+-- it, and the index lets MAX(updated_at) act as a cheap collection version.
+ALTER TABLE books
+  ADD COLUMN updated_at TIMESTAMP(6) NOT NULL
+    DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+  ADD INDEX idx_books_updated_at (updated_at);
+
+ALTER TABLE authors
+  ADD COLUMN updated_at TIMESTAMP(6) NOT NULL
+    DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+  ADD INDEX idx_authors_updated_at (updated_at);
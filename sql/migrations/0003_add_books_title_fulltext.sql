@@ -0,0 +1,9 @@
+-- File name: 0003_add_books_title_fulltext.sql
+-- Purpose: Full-text index behind GET /books/search.
+
+
+-- InnoDB ranks matches with this index; terms shorter than
+-- innodb_ft_min_token_size (3 by default) are not indexed, which is why
+-- the endpoint ignores them (see SEARCH_MIN_TOKEN_SIZE).
+ALTER TABLE books
+  ADD FULLTEXT INDEX ft_books_title (title);
@@ -0,0 +1,20 @@
+-- File name: 0004_add_filter_sort_indexes.sql
+-- Purpose: Indexes behind the filters and sort orders of the list endpoints.
+
+
+-- GET /books?sort=publication_date and ?published_after= / ?published_before=:
+--   WHERE is_deleted = 0 AND publication_date > ? ORDER BY publication_date, id
+CREATE INDEX idx_books_live_published ON books (is_deleted, publication_date, id);
+
+-- GET /books?sort=title and ?title_prefix= (LIKE 'prefix%' is a range scan)
+CREATE INDEX idx_books_live_title ON books (is_deleted, title, id);
+
+-- GET /authors?email_domain=: a stored generated column makes the domain
+-- indexable, where LIKE '%@domain' could never use an index.
+ALTER TABLE authors
+  ADD COLUMN email_domain VARCHAR(255)
+    AS (SUBSTRING_INDEX(email, '@', -1)) STORED,
+  ADD INDEX idx_authors_live_domain (is_deleted, email_domain, id);
+
+-- GET /authors?sort=name
+CREATE INDEX idx_authors_live_name ON authors (is_deleted, name, id);
@@ -0,0 +1,18 @@
+-- File name: 0005_add_deleted_at.sql
+-- Purpose: Record when a row was soft-deleted.
+
+
+-- 'deleted_at' is set together with is_deleted = 1 and cleared on restore.
+-- A cascading author delete stamps the author and its books with the same
+-- value, which is how the cascading restore finds exactly those books
+-- (books deleted on their own before keep their earlier stamp).
+ALTER TABLE books
+  ADD COLUMN deleted_at DATETIME(6) NULL;
+
+ALTER TABLE authors
+  ADD COLUMN deleted_at DATETIME(6) NULL;
+
+-- Rows deleted before this migration: the last change is the best estimate.
+-- Assigning updated_at to itself keeps ON UPDATE from bumping it.
+UPDATE books SET deleted_at = updated_at, updated_at = updated_at WHERE is_deleted = 1;
+UPDATE authors SET deleted_at = updated_at, updated_at = updated_at WHERE is_deleted = 1;
@@ -0,0 +1,35 @@
+-- File name: 0006_add_archive_tables.sql
+-- Purpose: Archive tables and indexes for the purge job (purge.py).
+
+
+-- The purge job walks rows soft-deleted before the retention cutoff:
+--   WHERE is_deleted = 1 AND deleted_at < ? AND (deleted_at, id) > (?, ?)
+--   ORDER BY deleted_at, id LIMIT ?
+CREATE INDEX idx_books_purge ON books (is_deleted, deleted_at, id);
+CREATE INDEX idx_authors_purge ON authors (is_deleted, deleted_at, id);
+
+-- Purged rows are moved here.  No foreign keys, so books can be archived
+-- while their author is still live and authors archived in any order.
+CREATE TABLE books_archive (
+  id INT NOT NULL,
+  title VARCHAR(255) NOT NULL,
+  author_id INT,
+  publication_date DATE,
+  is_deleted TINYINT(1),
+  updated_at TIMESTAMP(6) NULL,
+  deleted_at DATETIME(6) NULL,
+  archived_at DATETIME(6) NOT NULL,
+  PRIMARY KEY (id),
+  INDEX idx_books_archive_author (author_id)
+);
+
+CREATE TABLE authors_archive (
+  id INT NOT NULL,
+  name VARCHAR(255) NOT NULL,
+  email VARCHAR(255),
+  is_deleted TINYINT(1),
+  updated_at TIMESTAMP(6) NULL,
+  deleted_at DATETIME(6) NULL,
+  archived_at DATETIME(6) NOT NULL,
+  PRIMARY KEY (id)
+);
@@ -0,0 +1,24 @@
+-- File name: 0007_add_author_stats.sql
+-- Purpose: Per-author book aggregates, maintained by the write handlers.
+
+
+-- One row per author:
+--   book_count       - books of the author, soft-deleted ones included
+--   live_book_count  - books with is_deleted = 0
+--   first_published / last_published - publication date range of live books
+-- See app/stats.py; rebuild with python -m tools.rebuild_author_stats.
+CREATE TABLE author_stats (
+  author_id INT NOT NULL,
+  book_count INT NOT NULL DEFAULT 0,
+  live_book_count INT NOT NULL DEFAULT 0,
+  first_published DATE NULL,
+  last_published DATE NULL,
+  PRIMARY KEY (author_id)
+);
+
+INSERT INTO author_stats (author_id, book_count, live_book_count, first_published, last_published)
+SELECT a.id, COUNT(b.id), COALESCE(SUM(b.is_deleted = 0), 0),
+       MIN(CASE WHEN b.is_deleted = 0 THEN b.publication_date END),
+       MAX(CASE WHEN b.is_deleted = 0 THEN b.publication_date END)
+FROM authors a LEFT JOIN books b ON b.author_id = a.id
+GROUP BY a.id;
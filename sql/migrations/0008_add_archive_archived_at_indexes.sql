@@ -0,0 +1,10 @@
+-- File name: 0008_add_archive_archived_at_indexes.sql
+-- Purpose: Let readers notice rows removed by the purge job.
+
+
+-- Each process polls for rows archived since its last refresh
+-- (app/suggest.py) and drops them from its in-memory index:
+--   WHERE archived_at >= ? ORDER BY archived_at
+-- List ETags (app/etags.py) fold MAX(archived_at) into the table version.
+CREATE INDEX idx_books_archive_archived_at ON books_archive (archived_at);
+CREATE INDEX idx_authors_archive_archived_at ON authors_archive (archived_at);
@@ -0,0 +1,90 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./tests/conftest.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       pytest, Flask
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       Loaded by pytest for every module in tests/
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# tests/conftest.py
+'''
+    Shared Test Fixtures
+    ====================
+
+    Fixtures used by more than one test module.  The HTTP client fixtures
+    stay in their modules, since each builds the app it tests.
+'''
+
+import pytest
+from app import create_app
+from app.database import get_db
+from app.migrations import apply_migrations
+
+
+@pytest.fixture
+def db():
+    """
+    Pytest fixture yielding a migrated database connection.
+
+    Returns:
+        db (MySQLConnection): Connection with every migration applied.
+    """
+    with create_app({'TESTING': True}).app_context():
+        connection = get_db()
+        apply_migrations(connection)
+        yield connection
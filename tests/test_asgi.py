@@ -0,0 +1,230 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./tests/test_asgi.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       pytest, Quart, aiomysql
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       Run tests using : pytest tests/
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# test_asgi.py
+'''
+    Test Suite for the Async (ASGI) Variant
+    =======================================
+
+    Request validation in app/asgi.py, which is answered before a pooled
+    connection is needed.
+'''
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip('quart')
+pytest.importorskip('aiomysql')
+
+from app.asgi import create_asgi_app
+from app.cache import cache_key
+
+
+@pytest.fixture
+def client():
+    """
+    Pytest fixture to create an async test client.
+
+    Returns:
+        client (QuartClient): Test client instance.
+    """
+    app = create_asgi_app({'TESTING': True})
+    yield app.test_client()
+
+
+def test_get_books_invalid_page_params(client):
+    """
+    Test async GET /books endpoint with invalid paging parameters.
+
+    Returns:
+        400 BAD REQUEST
+    """
+    async def run():
+        for url in ('/books?limit=abc', '/books?limit=0', '/books?cursor=not-a-cursor'):
+            response = await client.get(url)
+            assert response.status_code == 400
+
+    asyncio.run(run())
+
+
+def test_get_books_invalid_filters(client):
+    """
+    Test async GET /books endpoint with filters and sorts it cannot honour.
+
+    Returns:
+        400 BAD REQUEST
+    """
+    async def run():
+        for url in ('/books?sort=price', '/books?author_id=abc',
+                    '/books?published_after=yesterday', '/books?stream=1'):
+            response = await client.get(url)
+            assert response.status_code == 400
+
+    asyncio.run(run())
+
+
+def test_get_authors_unknown_field(client):
+    """
+    Test async GET /authors endpoint with a field outside the whitelist.
+
+    Returns:
+        400 BAD REQUEST
+    """
+    async def run():
+        response = await client.get('/authors?fields=password')
+        assert response.status_code == 400
+
+    asyncio.run(run())
+
+
+def test_create_book_missing_fields(client):
+    """
+    Test async POST /books endpoint with missing fields.
+
+    Returns:
+        400 BAD REQUEST
+    """
+    async def run():
+        response = await client.post('/books', json={'title': 'New Book'})
+        assert response.status_code == 400
+
+    asyncio.run(run())
+
+
+def test_get_book_shares_cache_shape(client):
+    """
+    Test async GET /books/:id endpoint with a row cached by the WSGI app.
+
+    Returns:
+        200 OK
+
+    Scenario:
+        - Store a row the way app.books.get_book caches it (with updated_at)
+        - Check the async view serves it without the version column
+    """
+    async def run():
+        row = (7, 'Cached', 1, '2020-01-01', 0, datetime(2024, 1, 1))
+        client.app.extensions['cache'].set(cache_key('book', 7), row)
+        response = await client.get('/books/7?fields=id,title')
+        assert response.status_code == 200
+        assert await response.get_json() == {'book': {'id': 7, 'title': 'Cached'}}
+        assert (await client.get('/authors/1?include=books')).status_code == 400
+
+    asyncio.run(run())
+
+
+def test_get_books_by_ids_from_cache(client):
+    """
+    Test async GET /books?ids= endpoint with every row in the cache.
+
+    Returns:
+        200 OK
+
+    Scenario:
+        - Cache two books the way app.books.get_book does
+        - Check they come back in request order without touching MySQL
+        - Check an invalid ID list is rejected
+    """
+    async def run():
+        cache = client.app.extensions['cache']
+        cache.set(cache_key('book', 8), (8, 'Eight', 1, '2020-01-01', 0, datetime(2024, 1, 1)))
+        cache.set(cache_key('book', 9), (9, 'Nine', 1, '2020-01-01', 0, datetime(2024, 1, 1)))
+        response = await client.get('/books?ids=9,8,9&fields=id,title')
+        assert response.status_code == 200
+        assert await response.get_json() == {'books': [{'id': 9, 'title': 'Nine'}, {'id': 8, 'title': 'Eight'}],
+                                             'missing': []}
+        for url in ('/books?ids=', '/books?ids=1,abc', '/authors?ids=0'):
+            assert (await client.get(url)).status_code == 400
+
+    asyncio.run(run())
+
+
+def test_bulk_delete_invalid_body(client):
+    """
+    Test async POST /books/bulk-delete and /authors/bulk-restore with invalid bodies.
+
+    Returns:
+        400 BAD REQUEST
+    """
+    async def run():
+        for body in ({}, {'ids': []}, {'ids': [1, 'two']}, {'ids': [True]}):
+            assert (await client.post('/books/bulk-delete', json=body)).status_code == 400
+            assert (await client.post('/authors/bulk-restore', json=body)).status_code == 400
+
+    asyncio.run(run())
+
+
+def test_author_cascade_unsupported_value(client):
+    """
+    Test async DELETE /authors/:id and PATCH /authors/:id/restore with an unknown cascade.
+
+    Returns:
+        400 BAD REQUEST
+    """
+    async def run():
+        assert (await client.delete('/authors/1?cascade=reviews')).status_code == 400
+        assert (await client.patch('/authors/1/restore?cascade=all')).status_code == 400
+
+    asyncio.run(run())
@@ -68,11 +68,21 @@
 
     This test suite covers all authors API endpoints:
         - GET /authors
+        - GET /authors?limit=&cursor=
+        - GET /authors?stream=1
+        - GET /authors?fields=
+        - GET /authors?email_domain=&sort=
+        - GET /authors?ids=
         - GET /authors/:id
+        - GET /authors/:id?include=books
+        - GET /authors/:id?include=stats
+        - GET /authors/:id/books
         - POST /authors
         - PUT /authors/:id
-        - DELETE /authors/:id
-        - PATCH /authors/:id/restore
+        - DELETE /authors/:id (?cascade=books)
+        - PATCH /authors/:id/restore (?cascade=books)
+        - POST /authors/bulk-delete
+        - POST /authors/bulk-restore
 
     Run these tests using pytest tests/ to ensure your API is working correctly.
 '''
@@ -91,9 +101,9 @@
 # Note: Exclude the htmlcov/ directory from Git commits by adding it to .gitignore.
 """
 
+import json
 import pytest
-from app import app
-from app.database import db
+from app import create_app
 import uuid
 
 @pytest.fixture
@@ -104,7 +114,8 @@ def client():
     Returns:
         client (FlaskClient): Test client instance.
     """
-    app.config['TESTING'] = True
+    # Lists written a moment ago still get validators, so ETag tests need no sleep
+    app = create_app({'TESTING': True, 'ETAG_SETTLE_SECONDS': 0})
     client = app.test_client()
 
     yield client
@@ -121,6 +132,131 @@ def test_get_authors(client):
     assert response.status_code == 200
 
 
+def test_get_authors_paginated(client):
+    """
+    Test GET /authors endpoint with keyset pagination.
+
+    Returns:
+        200 OK
+
+    Scenario:
+        - Fetch a page of one author
+        - Follow next_cursor and check the next page starts after it
+    """
+    response = client.get('/authors?limit=1')
+    assert response.status_code == 200
+    first_page = response.get_json()
+    assert len(first_page['authors']) <= 1
+
+    if first_page['next_cursor']:
+        response = client.get(f"/authors?limit=1&cursor={first_page['next_cursor']}")
+        assert response.status_code == 200
+        second_page = response.get_json()
+        assert second_page['authors'][0][0] > first_page['authors'][0][0]
+
+
+def test_get_authors_invalid_page_params(client):
+    """
+    Test GET /authors endpoint with invalid paging parameters.
+
+    Returns:
+        400 BAD REQUEST
+    """
+    assert client.get('/authors?limit=abc').status_code == 400
+    assert client.get('/authors?limit=0').status_code == 400
+    assert client.get('/authors?cursor=not-a-cursor').status_code == 400
+
+
+def test_get_authors_stream(client):
+    """
+    Test GET /authors endpoint in NDJSON streaming mode.
+
+    Returns:
+        200 OK
+
+    Scenario:
+        - Request the stream with ?stream=1 and with the NDJSON Accept header
+        - Check every line is a JSON-encoded author row
+    """
+    for response in (client.get('/authors?stream=1'),
+                     client.get('/authors', headers={'Accept': 'application/x-ndjson'})):
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        for line in response.get_data(as_text=True).splitlines():
+            assert isinstance(json.loads(line), list)
+
+
+def test_get_authors_fields(client):
+    """
+    Test GET /authors endpoint with a sparse fieldset.
+
+    Returns:
+        200 OK
+
+    Scenario:
+        - Request only name
+        - Check each author is an object holding exactly those fields
+    """
+    response = client.get('/authors?limit=5&fields=name')
+    assert response.status_code == 200
+    for author in response.get_json()['authors']:
+        assert sorted(author) == ['name']
+
+
+def test_get_authors_unknown_field(client):
+    """
+    Test GET /authors endpoint with a field outside the whitelist.
+
+    Returns:
+        400 BAD REQUEST
+    """
+    assert client.get('/authors?fields=password').status_code == 400
+    assert client.get('/authors?fields=').status_code == 400
+
+
+def test_get_authors_by_email_domain(client):
+    """
+    Test GET /authors endpoint with an email domain filter sorted by name.
+
+    Returns:
+        200 OK
+
+    Scenario:
+        - Create two authors at a unique domain
+        - Check only they are listed, in name order
+    """
+    domain = f"{uuid.uuid4().hex}.example"
+    client.post('/authors', json={'name': 'Zora Domain', 'email': f'zora@{domain}'})
+    client.post('/authors', json={'name': 'Abel Domain', 'email': f'abel@{domain}'})
+
+    response = client.get(f'/authors?email_domain={domain}&sort=name&fields=name,email')
+    assert response.status_code == 200
+    assert [author['name'] for author in response.get_json()['authors']] == ['Abel Domain', 'Zora Domain']
+
+    assert client.get('/authors?sort=password').status_code == 400
+    assert client.get('/authors?email_domain=@').status_code == 400
+
+
+def test_get_authors_by_ids(client):
+    """
+    Test GET /authors endpoint with a list of IDs.
+
+    Returns:
+        200 OK
+
+    Scenario:
+        - Request an existing author and an unknown one
+        - Check the found author and the missing list
+    """
+    response = client.get('/authors?ids=1,999999999')
+    assert response.status_code == 200
+    body = response.get_json()
+    assert [author[0] for author in body['authors']] == [1]
+    assert body['missing'] == [999999999]
+
+    assert client.get('/authors?ids=1,x').status_code == 400
+
+
 def test_get_author_by_id(client):
     """
     Test GET /authors/:id endpoint.
@@ -136,6 +272,110 @@ def test_get_author_by_id(client):
     assert response.status_code == 200
 
 
+def test_get_author_books(client):
+    """
+    Test GET /authors/:id/books endpoint.
+
+    Returns:
+        200 OK
+
+    Scenario:
+        - Create a book for author 1
+        - Check every returned book belongs to author 1 and the new one is listed
+    """
+    unique_title = f"Bibliography-{uuid.uuid4()}-Book"
+    data = [{'title': unique_title, 'author_id': 1, 'publication_date': '2022-01-01'}]
+    client.post('/books/batch', json=data)
+
+    books, cursor = [], None
+    while True:
+        url = '/authors/1/books?limit=50' + (f'&cursor={cursor}' if cursor else '')
+        response = client.get(url)
+        assert response.status_code == 200
+        page = response.get_json()
+        books.extend(page['books'])
+        cursor = page['next_cursor']
+        if not cursor:
+            break
+
+    assert all(book[2] == 1 for book in books)
+    assert unique_title in [book[1] for book in books]
+
+
+def test_get_non_existent_author_books(client):
+    """
+    Test GET /authors/:id/books endpoint with non-existent ID.
+
+    Returns:
+        404 NOT FOUND
+    """
+    response = client.get('/authors/999/books')
+    assert response.status_code == 404
+
+
+def test_get_author_include_books(client):
+    """
+    Test GET /authors/:id?include=books endpoint.
+
+    Returns:
+        200 OK
+    """
+    response = client.get('/authors/1?include=books&limit=5')
+    assert response.status_code == 200
+    body = response.get_json()
+    assert 'author' in body and len(body['books']) <= 5
+    assert 'books_next_cursor' in body
+
+    assert client.get('/authors/1?include=reviews').status_code == 400
+
+
+def test_get_author_include_stats(client):
+    """
+    Test GET /authors/:id?include=stats endpoint as books change.
+
+    Returns:
+        200 OK
+
+    Scenario:
+        - Create an author with two books and delete the older one
+        - Check the counts and date range, then restore the book and check again
+    """
+    domain = f"{uuid.uuid4().hex}.example"
+    client.post('/authors', json={'name': 'Stats Author', 'email': f'stats@{domain}'})
+    author_id = client.get(f'/authors?email_domain={domain}&fields=id').get_json()['authors'][0]['id']
+
+    def stats():
+        response = client.get(f'/authors/{author_id}?include=stats')
+        assert response.status_code == 200
+        return response.get_json()['stats']
+
+    assert stats()['book_count'] == 0
+    response = client.post('/books/batch', json=[
+        {'title': 'Stats Old', 'author_id': author_id, 'publication_date': '1999-05-01'},
+        {'title': 'Stats New', 'author_id': author_id, 'publication_date': '2021-05-01'}])
+    old_id = response.get_json()['results'][0]['id']
+    client.delete(f'/books/{old_id}')
+
+    current = stats()
+    assert (current['book_count'], current['live_book_count']) == (2, 1)
+    assert '1999' not in current['first_published'] and '2021' in current['last_published']
+
+    client.patch(f'/books/{old_id}/restore')
+    current = stats()
+    assert current['live_book_count'] == 2 and '1999' in current['first_published']
+
+
+def test_get_author_not_modified(client):
+    """
+    Test GET /authors/:id endpoint with If-None-Match.
+
+    Returns:
+        304 NOT MODIFIED
+    """
+    etag = client.get('/authors/1').headers['ETag']
+    response = client.get('/authors/1', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+
 def test_get_non_existent_author(client):
     """
     Test GET /authors/:id endpoint with non-existent ID.
@@ -264,6 +504,40 @@ def test_restore_author(client):
     assert response.status_code == 200
 
 
+def test_cascading_delete_and_restore_author(client):
+    """
+    Test DELETE /authors/:id?cascade=books and PATCH /authors/:id/restore?cascade=books.
+
+    Returns:
+        200 OK
+
+    Scenario:
+        - Create an author with two books and delete one book on its own
+        - Delete the author with cascade and check its other book is hidden
+        - Restore with cascade and check only the book deleted with the author is back
+    """
+    domain = f"{uuid.uuid4().hex}.example"
+    client.post('/authors', json={'name': 'Cascade Author', 'email': f'cascade@{domain}'})
+    author_id = client.get(f'/authors?email_domain={domain}&fields=id').get_json()['authors'][0]['id']
+    response = client.post('/books/batch', json=[{'title': f'Cascade-{n}', 'author_id': author_id,
+                                                  'publication_date': '2022-01-01'} for n in range(2)])
+    kept, single = (result['id'] for result in response.get_json()['results'])
+    client.delete(f'/books/{single}')
+
+    response = client.delete(f'/authors/{author_id}?cascade=books')
+    assert response.status_code == 200
+    assert response.get_json()['books_deleted'] == 1
+    assert client.get(f'/books/{kept}').status_code == 404
+
+    response = client.patch(f'/authors/{author_id}/restore?cascade=books')
+    assert response.status_code == 200
+    assert response.get_json()['books_restored'] == 1
+    assert client.get(f'/books/{kept}').status_code == 200
+    assert client.get(f'/books/{single}').status_code == 404
+
+    assert client.delete(f'/authors/{author_id}?cascade=reviews').status_code == 400
+
+
 def test_restore_non_existent_author(client):
     """
     Test PATCH /authors/:id/restore endpoint with non-existent ID.
@@ -296,3 +570,25 @@ def test_restore_already_active_author(client):
     response = client.patch('/authors/1/restore')
     assert response.status_code == 400
 
+
+def test_bulk_delete_and_restore_authors(client):
+    """
+    Test POST /authors/bulk-delete and POST /authors/bulk-restore endpoints.
+
+    Returns:
+        200 OK
+
+    Scenario:
+        - Create an author and look up its ID
+        - Bulk delete it together with an unknown ID, then bulk restore it
+    """
+    domain = f"{uuid.uuid4().hex}.example"
+    client.post('/authors', json={'name': 'Bulk Author', 'email': f'bulk@{domain}'})
+    author_id = client.get(f'/authors?email_domain={domain}&fields=id').get_json()['authors'][0]['id']
+
+    response = client.post('/authors/bulk-delete', json={'ids': [author_id, 999999999]})
+    assert response.status_code == 200
+    assert response.get_json() == {'changed': [author_id], 'unchanged': [], 'missing': [999999999]}
+
+    response = client.post('/authors/bulk-restore', json={'ids': [author_id]})
+    assert response.get_json()['changed'] == [author_id]
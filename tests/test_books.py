@@ -68,18 +68,27 @@
 
     This test suite covers all books API endpoints:
         - GET /books
+        - GET /books?limit=&cursor=
+        - GET /books?stream=1
+        - GET /books?fields=
+        - GET /books?author_id=&published_after=&title_prefix=&sort=
+        - GET /books?ids=
+        - GET /books/search
         - GET /books/:id
         - POST /books
+        - POST /books/batch
         - PUT /books/:id
         - DELETE /books/:id
         - PATCH /books/:id/restore
+        - POST /books/bulk-delete
+        - POST /books/bulk-restore
 
     Run these tests using pytest tests/ to ensure your API is working correctly.
 '''
 
+import json
 import pytest
-from app import app
-from app.database import db
+from app import create_app
 import uuid
 
 @pytest.fixture
@@ -90,7 +99,8 @@ def client():
     Returns:
         client (FlaskClient): Test client instance.
     """
-    app.config['TESTING'] = True
+    # Lists written a moment ago still get validators, so ETag tests need no sleep
+    app = create_app({'TESTING': True, 'ETAG_SETTLE_SECONDS': 0})
     client = app.test_client()
 
     yield client
@@ -107,6 +117,87 @@ def test_get_books(client):
     assert response.status_code == 200
 
 
+def test_get_books_paginated(client):
+    """
+    Test GET /books endpoint with keyset pagination.
+
+    Returns:
+        200 OK
+
+    Scenario:
+        - Fetch a page of one book
+        - Follow next_cursor and check the next page starts after it
+    """
+    response = client.get('/books?limit=1')
+    assert response.status_code == 200
+    first_page = response.get_json()
+    assert len(first_page['books']) <= 1
+
+    if first_page['next_cursor']:
+        response = client.get(f"/books?limit=1&cursor={first_page['next_cursor']}")
+        assert response.status_code == 200
+        second_page = response.get_json()
+        assert second_page['books'][0][0] > first_page['books'][0][0]
+
+
+def test_get_books_invalid_page_params(client):
+    """
+    Test GET /books endpoint with invalid paging parameters.
+
+    Returns:
+        400 BAD REQUEST
+    """
+    assert client.get('/books?limit=abc').status_code == 400
+    assert client.get('/books?limit=0').status_code == 400
+    assert client.get('/books?cursor=not-a-cursor').status_code == 400
+
+
+def test_get_books_stream(client):
+    """
+    Test GET /books endpoint in NDJSON streaming mode.
+
+    Returns:
+        200 OK
+
+    Scenario:
+        - Request the stream with ?stream=1 and with the NDJSON Accept header
+        - Check every line is a JSON-encoded book row
+    """
+    for response in (client.get('/books?stream=1'),
+                     client.get('/books', headers={'Accept': 'application/x-ndjson'})):
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        for line in response.get_data(as_text=True).splitlines():
+            assert isinstance(json.loads(line), list)
+
+
+def test_get_books_fields(client):
+    """
+    Test GET /books endpoint with a sparse fieldset.
+
+    Returns:
+        200 OK
+
+    Scenario:
+        - Request only title, publication_date
+        - Check each book is an object holding exactly those fields
+    """
+    response = client.get('/books?limit=5&fields=title,publication_date')
+    assert response.status_code == 200
+    for book in response.get_json()['books']:
+        assert sorted(book) == ['publication_date', 'title']
+
+
+def test_get_books_unknown_field(client):
+    """
+    Test GET /books endpoint with a field outside the whitelist.
+
+    Returns:
+        400 BAD REQUEST
+    """
+    assert client.get('/books?fields=is_deleted').status_code == 400
+    assert client.get('/books?fields=').status_code == 400
+
 def test_get_book_by_id(client):
     """
     Test GET /books/:id endpoint.
@@ -122,6 +213,191 @@ def test_get_book_by_id(client):
     assert response.status_code == 200
 
 
+def test_get_book_not_modified(client):
+    """
+    Test GET /books/:id endpoint with If-None-Match.
+
+    Returns:
+        304 NOT MODIFIED, then 200 OK after an update
+
+    Scenario:
+        - Read book 1 and keep its ETag
+        - Read it again with If-None-Match
+        - Update it and check the old ETag no longer matches
+    """
+    response = client.get('/books/1')
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    assert response.headers['Last-Modified']
+
+    response = client.get('/books/1', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.get_data() == b''
+
+    updated_data = {'title': f"Etag-{uuid.uuid4()}-Book", 'author_id': 1, 'publication_date': '2022-01-01'}
+    client.put('/books/1', json=updated_data)
+    response = client.get('/books/1', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+
+
+def test_get_books_not_modified(client):
+    """
+    Test GET /books endpoint with If-None-Match.
+
+    Returns:
+        304 NOT MODIFIED, then 200 OK after a new book is created
+
+    Scenario:
+        - Read a page and keep its ETag
+        - Read it again with If-None-Match
+        - Create a book and check the collection ETag changed
+    """
+    etag = client.get('/books?limit=5').headers['ETag']
+    assert client.get('/books?limit=5', headers={'If-None-Match': etag}).status_code == 304
+    assert client.get('/books?limit=6', headers={'If-None-Match': etag}).status_code == 200
+
+    data = {'title': f"Etag-{uuid.uuid4()}-Book", 'author_id': 1, 'publication_date': '2022-01-01'}
+    client.post('/books', json=data)
+    assert client.get('/books?limit=5', headers={'If-None-Match': etag}).status_code == 200
+
+
+def test_get_books_unsettled_without_etag():
+    """
+    Test GET /books endpoint right after a write, within ETAG_SETTLE_SECONDS.
+
+    Returns:
+        200 OK without ETag or Last-Modified
+
+    Scenario:
+        - Create a book with a long settle window configured
+        - Check the page is served without validators
+    """
+    client = create_app({'TESTING': True, 'ETAG_SETTLE_SECONDS': 3600}).test_client()
+    data = {'title': f"Unsettled-{uuid.uuid4()}-Book", 'author_id': 1, 'publication_date': '2022-01-01'}
+    client.post('/books', json=data)
+    response = client.get('/books?limit=5')
+    assert response.status_code == 200
+    assert 'ETag' not in response.headers
+    assert 'Last-Modified' not in response.headers
+
+def test_get_books_filtered_sorted(client):
+    """
+    Test GET /books endpoint with filters and a sort order.
+
+    Returns:
+        200 OK
+
+    Scenario:
+        - Create three books sharing a unique title prefix, one published earlier
+        - Page through them newest first, one book per page
+        - Check the order and that the date filter drops the early book
+    """
+    prefix = f"Sorted-{uuid.uuid4()}"
+    books = [{'title': f'{prefix}-{n}', 'author_id': 1, 'publication_date': published}
+             for n, published in enumerate(('2021-05-01', '2023-01-01', '2023-01-01'))]
+    client.post('/books/batch', json=books)
+
+    titles, cursor = [], None
+    while True:
+        url = f'/books?title_prefix={prefix}&sort=-publication_date&limit=1&fields=title'
+        response = client.get(url + (f'&cursor={cursor}' if cursor else ''))
+        assert response.status_code == 200
+        page = response.get_json()
+        titles.extend(book['title'] for book in page['books'])
+        cursor = page['next_cursor']
+        if not cursor:
+            break
+    assert titles == [f'{prefix}-2', f'{prefix}-1', f'{prefix}-0']
+
+    response = client.get(f'/books?title_prefix={prefix}&published_after=2022-01-01&author_id=1')
+    assert len(response.get_json()['books']) == 2
+
+
+def test_get_books_invalid_filters(client):
+    """
+    Test GET /books endpoint with invalid filter and sort parameters.
+
+    Returns:
+        400 BAD REQUEST
+    """
+    assert client.get('/books?sort=price').status_code == 400
+    assert client.get('/books?sort=title,title').status_code == 400
+    assert client.get('/books?published_before=yesterday').status_code == 400
+    assert client.get('/books?author_id=one').status_code == 400
+    assert client.get('/books?sort=title&after_id=10').status_code == 400
+
+
+def test_get_books_by_ids(client):
+    """
+    Test GET /books endpoint with a list of IDs.
+
+    Returns:
+        200 OK
+
+    Scenario:
+        - Create two books
+        - Request them in reverse order with a duplicate and an unknown ID
+        - Check the order, the projection and the missing list, then repeat from the cache
+    """
+    titles = [f"Multi-{uuid.uuid4()}" for _ in range(2)]
+    response = client.post('/books/batch', json=[{'title': title, 'author_id': 1, 'publication_date': '2022-01-01'}
+                                                 for title in titles])
+    first, second = (result['id'] for result in response.get_json()['results'])
+
+    for _ in range(2):
+        response = client.get(f'/books?ids={second},{first},{second},999999999&fields=id,title')
+        assert response.status_code == 200
+        assert response.get_json() == {'books': [{'id': second, 'title': titles[1]},
+                                                 {'id': first, 'title': titles[0]}],
+                                       'missing': [999999999]}
+
+
+def test_get_books_by_invalid_ids(client):
+    """
+    Test GET /books endpoint with an invalid list of IDs.
+
+    Returns:
+        400 BAD REQUEST
+    """
+    assert client.get('/books?ids=').status_code == 400
+    assert client.get('/books?ids=1,two').status_code == 400
+    assert client.get('/books?ids=-1').status_code == 400
+
+
+def test_search_books(client):
+    """
+    Test GET /books/search endpoint.
+
+    Returns:
+        200 OK
+
+    Scenario:
+        - Create a book whose title holds a unique word
+        - Search for a prefix of that word and find the book with its author's name
+    """
+    word = uuid.uuid4().hex
+    data = {'title': f'The {word} Chronicle', 'author_id': 1, 'publication_date': '2022-01-01'}
+    client.post('/books', json=data)
+
+    response = client.get(f'/books/search?q={word[:12]}&limit=5')
+    assert response.status_code == 200
+    body = response.get_json()
+    assert [book['title'] for book in body['books']] == [data['title']]
+    assert body['books'][0]['author_name'] and body['next_cursor'] is None
+
+
+def test_search_books_invalid_query(client):
+    """
+    Test GET /books/search endpoint without a searchable word.
+
+    Returns:
+        400 BAD REQUEST
+    """
+    assert client.get('/books/search').status_code == 400
+    assert client.get('/books/search?q=a+of').status_code == 400
+    assert client.get('/books/search?q=river&limit=0').status_code == 400
+
+
 def test_get_non_existent_book(client):
     """
     Test GET /books/:id endpoint with non-existent ID.
@@ -158,6 +434,58 @@ def test_create_book_missing_fields(client):
     assert response.status_code == 400
 
 
+def test_create_books_batch(client):
+    """
+    Test POST /books/batch endpoint.
+
+    Returns:
+        207 MULTI-STATUS
+
+    Scenario:
+        - Send two valid books and one with missing fields
+        - Check the valid ones are created with consecutive IDs
+    """
+    books = [
+        {'title': f"Batch-{uuid.uuid4()}-Book", 'author_id': 1, 'publication_date': '2022-01-01'},
+        {'title': 'Missing Fields'},
+        {'title': f"Batch-{uuid.uuid4()}-Book", 'author_id': 1, 'publication_date': '2022-01-02'},
+    ]
+    response = client.post('/books/batch', json=books)
+    assert response.status_code == 207
+
+    body = response.get_json()
+    assert body['created'] == 2 and body['failed'] == 1
+    first, invalid, second = body['results']
+    assert invalid['status'] == 'error'
+    assert second['id'] == first['id'] + 1
+    assert client.get(f"/books/{second['id']}").get_json()['book'][1] == books[2]['title']
+
+
+def test_create_books_batch_ndjson(client):
+    """
+    Test POST /books/batch endpoint with an NDJSON body.
+
+    Returns:
+        201 CREATED
+    """
+    lines = [json.dumps({'title': f"Batch-{uuid.uuid4()}-Book", 'author_id': 1,
+                         'publication_date': '2022-01-01'}) for _ in range(3)]
+    response = client.post('/books/batch', data='\n'.join(lines),
+                           content_type='application/x-ndjson')
+    assert response.status_code == 201
+    assert response.get_json()['created'] == 3
+
+
+def test_create_books_batch_invalid_body(client):
+    """
+    Test POST /books/batch endpoint with a body that is not a list.
+
+    Returns:
+        400 BAD REQUEST
+    """
+    assert client.post('/books/batch', json={'title': 'Not a list'}).status_code == 400
+    assert client.post('/books/batch', json=[]).status_code == 400
+
 def test_update_book(client):
     """
     Test PUT /books/:id endpoint.
@@ -178,6 +506,46 @@ def test_update_book(client):
     assert response.status_code == 200
 
 
+def test_update_book_invalidates_cache(client):
+    """
+    Test GET /books/:id returns fresh data after PUT /books/:id.
+
+    Returns:
+        200 OK
+
+    Scenario:
+        - Read book 1 so it is cached
+        - Update its title
+        - Read it again and check the new title is returned
+    """
+    client.get('/books/1')
+
+    unique_title = f"Cached-{uuid.uuid4()}-Book"
+    updated_data = {'title': unique_title, 'author_id': 1, 'publication_date': '2022-01-01'}
+    client.put('/books/1', json=updated_data)
+
+    response = client.get('/books/1')
+    assert response.status_code == 200
+    assert response.get_json()['book'][1] == unique_title
+
+
+def test_update_book_with_unchanged_values(client):
+    """
+    Test PUT /books/:id endpoint when the values do not change.
+
+    Returns:
+        200 OK
+
+    Scenario:
+        - Send the same update twice; the second one matches but changes no row
+    """
+    updated_data = {'title': 'Same Book', 'author_id': 1, 'publication_date': '2022-01-01'}
+    client.put('/books/1', json=updated_data)
+
+    response = client.put('/books/1', json=updated_data)
+    assert response.status_code == 200
+    assert response.get_json()['book']['title'] == 'Same Book'
+
 def test_update_non_existent_book(client):
     """
     Test PUT /books/:id endpoint with non-existent ID.
@@ -212,6 +580,24 @@ def test_delete_book(client):
     assert response.status_code == 200
 
 
+def test_delete_already_deleted_book(client):
+    """
+    Test DELETE /books/:id endpoint on a book that is already deleted.
+
+    Returns:
+        404 NOT FOUND
+
+    Scenario:
+        - Create a book and delete it
+        - Delete it again
+    """
+    unique_title = f"Deleted-{uuid.uuid4()}-Book"
+    data = [{'title': unique_title, 'author_id': 1, 'publication_date': '2022-01-01'}]
+    book_id = client.post('/books/batch', json=data).get_json()['results'][0]['id']
+
+    assert client.delete(f'/books/{book_id}').status_code == 200
+    assert client.delete(f'/books/{book_id}').status_code == 404
+
 def test_delete_non_existent_book(client):
     """
     Test DELETE /books/:id endpoint with non-existent ID.
@@ -280,4 +666,46 @@ def test_restore_already_active_book(client):
 
     response = client.patch('/books/1/restore')
     assert response.status_code == 400
-    
\ No newline at end of file
+    
+
+
+def test_bulk_delete_and_restore_books(client):
+    """
+    Test POST /books/bulk-delete and POST /books/bulk-restore endpoints.
+
+    Returns:
+        200 OK
+
+    Scenario:
+        - Create two books
+        - Bulk delete them with a duplicate and an unknown ID, then again
+        - Check they are hidden, then bulk restore them
+    """
+    books = [{'title': f"Bulk-{uuid.uuid4()}", 'author_id': 1, 'publication_date': '2022-01-01'}
+             for _ in range(2)]
+    response = client.post('/books/batch', json=books)
+    ids = [result['id'] for result in response.get_json()['results']]
+
+    response = client.post('/books/bulk-delete', json={'ids': ids + [ids[0], 999999999]})
+    assert response.status_code == 200
+    assert response.get_json() == {'changed': ids, 'unchanged': [], 'missing': [999999999]}
+    assert client.get(f'/books/{ids[0]}').status_code == 404
+
+    response = client.post('/books/bulk-delete', json={'ids': ids})
+    assert response.get_json()['unchanged'] == ids
+
+    response = client.post('/books/bulk-restore', json={'ids': ids})
+    assert response.get_json()['changed'] == ids
+    assert client.get(f'/books/{ids[0]}').status_code == 200
+
+
+def test_bulk_delete_books_invalid_body(client):
+    """
+    Test POST /books/bulk-delete endpoint with an invalid body.
+
+    Returns:
+        400 BAD REQUEST
+    """
+    assert client.post('/books/bulk-delete', json=[1, 2]).status_code == 400
+    assert client.post('/books/bulk-delete', json={'ids': []}).status_code == 400
+    assert client.post('/books/bulk-restore', json={'ids': [1, 'two']}).status_code == 400
@@ -0,0 +1,131 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./tests/test_cache.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       pytest
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       Run tests using : pytest tests/
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# tests/test_cache.py
+'''
+    Test Suite for the Cache Backends
+    ======================================
+
+    These tests cover app.cache and run without a MySQL server.
+'''
+
+import time
+
+import pytest
+from app.cache import LRUCache, NullCache, cache_key, create_cache
+
+
+def test_lru_get_and_set():
+    """
+    A stored value is returned until it is deleted.
+    """
+    cache = LRUCache()
+    cache.set(cache_key('book', 1), ('Title',))
+    assert cache.get('book:1') == ('Title',)
+    cache.delete('book:1', 'book:2')
+    assert cache.get('book:1') is None
+
+
+def test_lru_evicts_least_recently_used():
+    """
+    The least recently read entry is evicted once max_entries is exceeded.
+    """
+    cache = LRUCache(max_entries=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1 and cache.get('c') == 3
+
+
+def test_lru_entries_expire():
+    """
+    Entries are dropped once their TTL has passed.
+    """
+    cache = LRUCache(ttl=0.01)
+    cache.set('a', 1)
+    time.sleep(0.02)
+    assert cache.get('a') is None
+    assert len(cache) == 0
+
+
+def test_lru_get_many_and_set_many():
+    """
+    set_many stores every pair; get_many returns the hits and omits misses.
+    """
+    cache = LRUCache(max_entries=2)
+    cache.set_many({'a': 1, 'b': 2, 'c': 3})
+    assert cache.get_many(['a', 'b', 'c', 'd']) == {'b': 2, 'c': 3}
+    assert NullCache().get_many(['b']) == {}
+
+
+def test_create_cache_selects_backend():
+    """
+    CACHE_TYPE picks the backend; unknown values are rejected.
+    """
+    config = {'CACHE_TYPE': 'null', 'CACHE_MAX_ENTRIES': 10, 'CACHE_TTL': 1}
+    assert isinstance(create_cache(config), NullCache)
+    assert isinstance(create_cache(dict(config, CACHE_TYPE='LRU')), LRUCache)
+    with pytest.raises(ValueError):
+        create_cache(dict(config, CACHE_TYPE='memcached'))
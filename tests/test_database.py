@@ -0,0 +1,272 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./tests/test_database.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       pytest
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       Run tests using : pytest tests/
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# tests/test_database.py
+'''
+    Test Suite for the Connection Pool
+    ======================================
+
+    These tests exercise app.database.ConnectionPool with in-memory fake
+    connections, so they run without a MySQL server.
+'''
+
+import os
+import threading
+import time
+
+import pytest
+from app import create_app
+import app.database
+from app.database import ConnectionPool, PoolTimeoutError
+
+
+class FakeConnection:
+    """
+    Minimal stand-in for a mysql.connector connection.
+    """
+
+    def __init__(self):
+        self.closed = False
+        self.broken = False
+        self.in_transaction = False
+        self.unread_result = False
+        self.rollbacks = 0
+
+    def ping(self, reconnect=False):
+        if self.broken:
+            raise ConnectionError('gone away')
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.in_transaction = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def opened():
+    """
+    Returns the list of connections created by the pool under test.
+    """
+    return []
+
+
+@pytest.fixture
+def make_pool(opened):
+    """
+    Returns a factory building pools over FakeConnection objects.
+    """
+    def factory(**kwargs):
+        def connect():
+            conn = FakeConnection()
+            opened.append(conn)
+            return conn
+        return ConnectionPool(connect, **kwargs)
+    return factory
+
+
+def test_connections_are_reused(make_pool, opened):
+    """
+    A released connection is handed out again instead of opening a new one.
+    """
+    pool = make_pool(max_size=2)
+    conn = pool.acquire()
+    pool.release(conn)
+    assert pool.acquire() is conn
+    assert len(opened) == 1
+
+
+def test_acquire_times_out_when_exhausted(make_pool):
+    """
+    Acquire raises PoolTimeoutError once max_size connections are checked out.
+    """
+    pool = make_pool(max_size=1, timeout=0.05)
+    pool.acquire()
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire()
+
+
+def test_waiter_wakes_on_release(make_pool):
+    """
+    A blocked acquire receives the connection released by another thread.
+    """
+    pool = make_pool(max_size=1, timeout=2)
+    conn = pool.acquire()
+    threading.Timer(0.05, pool.release, args=(conn,)).start()
+    assert pool.acquire() is conn
+
+
+def test_broken_connection_is_replaced(make_pool, opened):
+    """
+    A connection failing its ping on checkout is closed and replaced.
+    """
+    pool = make_pool(max_size=1, ping_interval=0)
+    conn = pool.acquire()
+    pool.release(conn)
+    conn.broken = True
+    fresh = pool.acquire()
+    assert fresh is not conn and conn.closed
+    assert pool.size == 1
+
+
+def test_release_rolls_back_open_transaction(make_pool):
+    """
+    Uncommitted work is rolled back before a connection is pooled again.
+    """
+    pool = make_pool()
+    conn = pool.acquire()
+    conn.in_transaction = True
+    pool.release(conn)
+    assert conn.rollbacks == 1 and pool.idle == 1
+
+
+def test_release_discards_connection_with_unread_result(make_pool):
+    """
+    A connection with a pending result set is closed, not reused.
+    """
+    pool = make_pool()
+    conn = pool.acquire()
+    conn.unread_result = True
+    pool.release(conn)
+    assert conn.closed and pool.size == 0
+
+
+def test_idle_connections_are_reaped_down_to_min_size(make_pool):
+    """
+    Connections idle past idle_timeout are closed, keeping min_size open.
+    """
+    pool = make_pool(min_size=1, max_size=3, idle_timeout=0.01)
+    conns = [pool.acquire() for _ in range(3)]
+    for conn in conns[:2]:
+        pool.release(conn)
+    time.sleep(0.02)
+    pool.release(conns[2])
+    assert pool.size == 1
+    assert conns[0].closed and conns[1].closed and not conns[2].closed
+
+
+def test_idle_connections_are_reaped_when_quiet(make_pool):
+    """
+    Connections above min_size are closed after idle_timeout even if the pool is not used again.
+    """
+    pool = make_pool(min_size=1, max_size=3, idle_timeout=0.05)
+    conns = [pool.acquire() for _ in range(3)]
+    for conn in conns:
+        pool.release(conn)
+    deadline = time.monotonic() + 2
+    while pool.size > 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert pool.size == 1 and pool.idle == 1
+    assert sum(conn.closed for conn in conns) == 2
+
+
+def test_acquire_reaps_idle_connections(make_pool):
+    """
+    A checkout after a quiet period gets a connection that was kept, never a reaped one.
+    """
+    pool = make_pool(min_size=1, max_size=2, idle_timeout=0.05)
+    first, second = pool.acquire(), pool.acquire()
+    pool.release(first)
+    pool.release(second)
+    time.sleep(0.1)
+    assert pool.acquire() is second
+    assert first.closed and pool.size == 1
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires os.fork')
+def test_forked_child_starts_with_empty_pool(make_pool):
+    """
+    A forked worker does not reuse connections opened by its parent.
+    """
+    pool = make_pool()
+    pool.release(pool.acquire())
+
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.write(write_end, b'%d,%d' % (pool.size, pool.idle))
+        os._exit(0)
+    os.waitpid(pid, 0)
+    assert os.read(read_end, 16) == b'0,0'
+    assert pool.size == 1 and pool.idle == 1
+
+
+def test_create_app_opens_no_connection():
+    """
+    Building the application does not touch the database.
+    """
+    app = create_app({'TESTING': True, 'MYSQL_POOL_MAX_SIZE': 3})
+    pool = app.extensions['db_pool']
+    assert pool.size == 0 and pool.max_size == 3
+
+
+def test_pool_connects_with_app_config(monkeypatch):
+    """
+    Pooled connections use the application's MYSQL_* settings, not the defaults.
+    """
+    seen = []
+    monkeypatch.setattr(app.database.mysql.connector, 'connect', lambda **kwargs: seen.append(kwargs))
+    application = create_app({'TESTING': True, 'MYSQL_HOST': 'db.example', 'MYSQL_DB': 'other_db'})
+    application.extensions['db_pool']._connect()
+    assert seen[0]['host'] == 'db.example' and seen[0]['database'] == 'other_db'
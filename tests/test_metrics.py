@@ -0,0 +1,176 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./tests/test_metrics.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       pytest, Flask
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       Run tests using : pytest tests/
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# test_metrics.py
+'''
+    Test Suite for Request Metrics
+    ==============================
+
+    Covers the metric types and GET /metrics; none of these tests need a
+    database connection.
+'''
+
+import pytest
+from flask import Response, stream_with_context
+from app import create_app
+from app.metrics import Histogram, observe_query
+
+
+@pytest.fixture
+def app():
+    """
+    Pytest fixture to create an application.
+
+    Returns:
+        app (Flask): Application instance.
+    """
+    app = create_app({'TESTING': True})
+    yield app
+
+
+def test_histogram_buckets_are_cumulative():
+    """
+    Test Histogram.render() bucket counts.
+
+    Scenario:
+        - Observe values below, on and above the bucket bounds
+        - Check every le bucket counts the observations up to its bound
+    """
+    histogram = Histogram('latency', 'Latency.', (0.1, 1.0), ('route',))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, '/books')
+
+    lines = histogram.render()
+    assert 'latency_bucket{route="/books",le="0.1"} 2' in lines
+    assert 'latency_bucket{route="/books",le="1.0"} 3' in lines
+    assert 'latency_bucket{route="/books",le="+Inf"} 4' in lines
+    assert 'latency_count{route="/books"} 4' in lines
+
+
+def test_metrics_endpoint(app):
+    """
+    Test GET /metrics endpoint.
+
+    Returns:
+        200 OK
+
+    Scenario:
+        - Make a request answered without touching the database
+        - Check it is counted under its route pattern
+    """
+    client = app.test_client()
+    client.get('/books?limit=abc')
+
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    body = response.get_data(as_text=True)
+    assert 'http_requests_total{route="/books",method="GET",status="400"} 1' in body
+    assert 'http_request_db_queries_count{route="/books",method="GET"} 1' in body
+    assert 'db_pool_connections{state="open"} 0' in body
+
+
+def test_streamed_response_size(app):
+    """
+    Test response size recording for a streamed response.
+
+    Scenario:
+        - Stream a 30-byte body in three chunks
+        - Check the size is recorded once the stream has been closed
+    """
+    @app.route('/chunks')
+    def chunks():
+        return Response(iter(['x' * 10] * 3))
+
+    client = app.test_client()
+    response = client.get('/chunks')
+    response.get_data()
+    response.close()
+
+    body = client.get('/metrics').get_data(as_text=True)
+    assert 'http_response_size_bytes_sum{route="/chunks",method="GET"} 30' in body
+
+
+def test_streamed_response_queries(app):
+    """
+    Test database time recording for a streamed response.
+
+    Scenario:
+        - Stream a body whose chunks report driver calls, as stream_rows fetches do
+        - Check those calls are recorded once the stream has been closed
+    """
+    @app.route('/fetches')
+    def fetches():
+        def generate():
+            for _ in range(3):
+                observe_query(0.25, 1)
+                yield 'x'
+        return Response(stream_with_context(generate()))
+
+    client = app.test_client()
+    response = client.get('/fetches')
+    response.get_data()
+    response.close()
+
+    body = client.get('/metrics').get_data(as_text=True)
+    assert 'http_request_db_queries_sum{route="/fetches",method="GET"} 3' in body
+    assert 'http_request_db_seconds_sum{route="/fetches",method="GET"} 0.75' in body
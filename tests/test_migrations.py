@@ -0,0 +1,221 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./tests/test_migrations.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       pytest, Flask
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       Run tests using : pytest tests/
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# tests/test_migrations.py
+'''
+    Test Suite for Schema Migrations and Index Usage
+    ======================================
+
+    Checks that the migration files parse, then applies them and uses
+    EXPLAIN to assert the hot queries of the list endpoints use the
+    indexes they add.
+'''
+
+from app.migrations import apply_migrations, load_migrations, split_statements
+
+
+def explain(db, query, params=()):
+    """
+    Runs EXPLAIN on a query.
+
+    Returns:
+        list: One dict per row of the EXPLAIN output.
+    """
+    cursor = db.cursor()
+    cursor.execute("EXPLAIN " + query, params)
+    rows = [dict(zip(cursor.column_names, row)) for row in cursor.fetchall()]
+    cursor.close()
+    return rows
+
+
+def test_migrations_are_numbered_and_parse():
+    """
+    Migration versions are unique and ascending, and every file has statements.
+    """
+    migrations = load_migrations()
+    versions = [migration.version for migration in migrations]
+    assert versions == sorted(set(versions))
+    for migration in migrations:
+        with open(migration.path, encoding='utf-8') as f:
+            assert split_statements(f.read())
+
+
+def test_split_statements_ignores_comments():
+    """
+    Comment lines are dropped and statements are split on ';'.
+    """
+    sql = "-- a comment; with a semicolon\nCREATE INDEX a ON t (x);\r\n\nDROP INDEX a ON t;\n"
+    assert split_statements(sql) == ['CREATE INDEX a ON t (x)', 'DROP INDEX a ON t']
+
+
+def test_apply_migrations_is_idempotent(db):
+    """
+    A second run finds nothing left to apply.
+    """
+    assert apply_migrations(db) == []
+
+
+def test_live_books_page_uses_index(db):
+    """
+    The GET /books page query is an index range scan, not a table scan.
+    """
+    plan = explain(db, "SELECT * FROM books WHERE is_deleted = 0 AND id > %s ORDER BY id LIMIT %s", (0, 101))
+    assert plan[0]['type'] != 'ALL'
+    assert plan[0]['key'] in ('idx_books_is_deleted_id', 'PRIMARY')
+
+
+def test_live_authors_page_uses_index(db):
+    """
+    The GET /authors page query is an index range scan, not a table scan.
+    """
+    plan = explain(db, "SELECT * FROM authors WHERE is_deleted = 0 AND id > %s ORDER BY id LIMIT %s", (0, 101))
+    assert plan[0]['type'] != 'ALL'
+    assert plan[0]['key'] in ('idx_authors_is_deleted_id', 'PRIMARY')
+
+
+def test_books_by_author_uses_composite_index(db):
+    """
+    Live books of one author are read through (author_id, is_deleted, id).
+    """
+    plan = explain(db, "SELECT id FROM books WHERE author_id = %s AND is_deleted = 0 AND id > %s ORDER BY id",
+                   (1, 0))
+    assert plan[0]['key'] == 'idx_books_author_live'
+    assert 'filesort' not in (plan[0]['Extra'] or '')
+
+
+def test_author_books_join_uses_composite_index(db):
+    """
+    GET /authors/:id/books joins the author as a constant and range-scans its books.
+    """
+    query = ("SELECT b.* FROM authors a "
+             "LEFT JOIN books b ON b.author_id = a.id AND b.is_deleted = 0 AND b.id > %s "
+             "WHERE a.id = %s AND a.is_deleted = 0 ORDER BY b.id LIMIT %s")
+    plan = {row['table']: row for row in explain(db, query, (0, 1, 101))}
+    assert plan['a']['key'] == 'PRIMARY'
+    assert plan['b']['key'] == 'idx_books_author_live'
+
+
+def test_cascading_delete_uses_composite_index(db):
+    """
+    DELETE /authors/:id?cascade=books updates the author's books through (author_id, is_deleted, id).
+    """
+    query = ("UPDATE books b JOIN authors a ON a.id = b.author_id "
+             "SET b.is_deleted = 1, b.deleted_at = a.deleted_at "
+             "WHERE b.author_id = %s AND b.is_deleted = 0")
+    plan = {row['table']: row for row in explain(db, query, (1,))}
+    assert plan['b']['key'] == 'idx_books_author_live'
+
+
+def test_author_stats_refresh_uses_composite_index(db):
+    """
+    Recomputing one author's author_stats row reads only that author's books.
+    """
+    query = ("SELECT a.id, COUNT(b.id) FROM authors a LEFT JOIN books b ON b.author_id = a.id "
+             "WHERE a.id IN (%s) GROUP BY a.id")
+    plan = {row['table']: row for row in explain(db, query, (1,))}
+    assert plan['a']['key'] == 'PRIMARY'
+    assert plan['b']['key'] == 'idx_books_author_live'
+
+
+def test_collection_version_uses_index(db):
+    """
+    MAX(updated_at) and MAX(archived_at) for list ETags are answered from indexes, not scans.
+    """
+    plan = explain(db, "SELECT MAX(updated_at) FROM books")
+    assert plan[0]['type'] != 'ALL'
+    assert 'Select tables optimized away' in (plan[0]['Extra'] or '') or plan[0]['key'] == 'idx_books_updated_at'
+
+    plan = explain(db, "SELECT MAX(archived_at) FROM books_archive")
+    assert plan[0]['type'] != 'ALL'
+
+
+def test_title_search_uses_fulltext_index(db):
+    """
+    GET /books/search matches titles through the FULLTEXT index.
+    """
+    query = ("SELECT id FROM books WHERE MATCH (title) AGAINST (%s IN BOOLEAN MODE) "
+             "AND is_deleted = 0")
+    plan = explain(db, query, ('+river*',))
+    assert plan[0]['type'] == 'fulltext'
+    assert plan[0]['key'] == 'ft_books_title'
+
+
+def test_sorted_books_page_uses_index(db):
+    """
+    GET /books?sort=publication_date reads its page in index order, without a filesort.
+    """
+    query = ("SELECT id FROM books WHERE is_deleted = 0 AND (publication_date >= %s) "
+             "AND (publication_date > %s OR (publication_date = %s AND id > %s)) "
+             "ORDER BY publication_date ASC, id ASC LIMIT %s")
+    plan = explain(db, query, ('2020-01-01', '2020-01-01', '2020-01-01', 0, 101))
+    assert plan[0]['key'] == 'idx_books_live_published'
+    assert 'filesort' not in (plan[0]['Extra'] or '')
+
+
+def test_email_domain_filter_uses_index(db):
+    """
+    GET /authors?email_domain= looks the generated domain column up in its index.
+    """
+    plan = explain(db, "SELECT id FROM authors WHERE is_deleted = 0 AND email_domain = %s ORDER BY id",
+                   ('example.com',))
+    assert plan[0]['key'] == 'idx_authors_live_domain'
@@ -0,0 +1,186 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./tests/test_profiling.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       pytest, Flask
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       Run tests using : pytest tests/
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# test_profiling.py
+'''
+    Test Suite for Query Profiling
+    ==============================
+
+    Covers SQL normalization, the query profiler, the profiling cursor
+    wrapper and GET /admin/queries; none of these tests need a database.
+'''
+
+from app import create_app
+from app.database import InstrumentedConnection
+from app.profiling import QueryProfiler, normalize_sql, param_shape
+
+
+class FakeCursor:
+    """
+    Cursor returning canned rows, for driving the profiling wrapper.
+    """
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.with_rows = False
+        self.column_names = ('id', 'select_type')
+
+    def execute(self, operation, params=None):
+        self.with_rows = operation.lstrip().upper().startswith(('SELECT', 'EXPLAIN'))
+
+    def fetchone(self):
+        return self.rows.pop(0) if self.rows else None
+
+    def fetchall(self):
+        rows, self.rows = self.rows, []
+        return rows
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    """
+    Connection handing out FakeCursor objects.
+    """
+    unread_result = False
+
+    def cursor(self):
+        return FakeCursor([(1, 'SIMPLE')])
+
+
+def test_normalize_sql():
+    """
+    Test normalize_sql() groups statements differing only in values.
+    """
+    assert normalize_sql("SELECT * FROM books WHERE id = 5 AND title = 'x'") == \
+        'SELECT * FROM books WHERE id = ? AND title = ?'
+    assert normalize_sql('SELECT id FROM books\n WHERE id IN (%s, %s, %s)') == \
+        'SELECT id FROM books WHERE id IN (...)'
+    assert param_shape((1, 'a')) == '(int, str)'
+    assert param_shape([(1, 'a')] * 3, many=True) == '3 x (int, str)'
+
+
+def test_profiler_aggregates_and_eviction():
+    """
+    Test QueryProfiler.record() aggregates and its entry bound.
+
+    Scenario:
+        - Record the same statement twice with different literals
+        - Record two more statements into a profiler holding two entries
+        - Check the cheapest statement was dropped
+    """
+    profiler = QueryProfiler(threshold=1.0, max_entries=2)
+    profiler.record('SELECT * FROM books WHERE id = 1', None, 0.5)
+    profiler.record('SELECT * FROM books WHERE id = 2', None, 1.5)
+    profiler.record('SELECT * FROM authors', None, 0.1)
+    profiler.record('SELECT * FROM authors WHERE id = %s', (1,), 0.2)
+
+    top = profiler.top()
+    assert [entry['sql'] for entry in top] == ['SELECT * FROM books WHERE id = ?',
+                                               'SELECT * FROM authors WHERE id = ?']
+    assert top[0]['count'] == 2 and top[0]['slow_count'] == 1
+    assert top[0]['max_seconds'] == 1.5 and top[0]['avg_seconds'] == 1.0
+
+
+def test_slow_select_is_explained():
+    """
+    Test EXPLAIN capture for a slow SELECT through the cursor wrapper.
+
+    Scenario:
+        - Run a SELECT with a zero threshold and EXPLAIN enabled
+        - Finish the connection as request teardown does
+        - Check the statement was profiled with its plan attached
+    """
+    profiler = QueryProfiler(threshold=0.0, explain=True)
+    db = InstrumentedConnection(FakeConnection(), profiler)
+    cursor = db.cursor()
+    cursor.execute('SELECT id FROM books WHERE id = %s', (7,))
+    assert cursor.fetchone() == (1, 'SIMPLE')
+    db.finish()
+
+    entry, = profiler.top()
+    assert entry['sql'] == 'SELECT id FROM books WHERE id = ?'
+    assert entry['params'] == '(int)'
+    assert entry['explain'] == [{'id': 1, 'select_type': 'SIMPLE'}]
+
+
+def test_admin_queries_requires_token():
+    """
+    Test GET /admin/queries endpoint authorization.
+
+    Returns:
+        403 FORBIDDEN without ADMIN_TOKEN configured
+        401 UNAUTHORIZED with a wrong token
+        200 OK with the configured token
+    """
+    assert create_app({'TESTING': True, 'ADMIN_TOKEN': None}).test_client() \
+        .get('/admin/queries').status_code == 403
+
+    client = create_app({'TESTING': True, 'ADMIN_TOKEN': 'secret'}).test_client()
+    assert client.get('/admin/queries', headers={'X-Admin-Token': 'wrong'}).status_code == 401
+    response = client.get('/admin/queries', headers={'X-Admin-Token': 'secret'})
+    assert response.status_code == 200
+    assert response.get_json()['queries'] == []
+    assert client.get('/admin/queries?order=name',
+                      headers={'X-Admin-Token': 'secret'}).status_code == 400
@@ -0,0 +1,169 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./tests/test_purge.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       pytest, Flask
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       Run tests using : pytest tests/
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# tests/test_purge.py
+'''
+    Test Suite for the Purge Job
+    ======================================
+
+    Soft-deletes rows, backdates their deleted_at and checks that
+    app.purge moves exactly the rows past the retention window into the
+    archive tables.
+'''
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from app.purge import purge_cutoff, purge_table
+
+
+def insert(db, query, params, deleted_days_ago=None):
+    """
+    Inserts a row, optionally soft-deleted the given number of days ago.
+
+    Returns:
+        int: ID of the new row.
+    """
+    cursor = db.cursor()
+    cursor.execute(query, params)
+    row_id = cursor.lastrowid
+    if deleted_days_ago is not None:
+        table = query.split()[2]
+        cursor.execute(f"UPDATE {table} SET is_deleted = 1, "
+                       f"deleted_at = NOW(6) - INTERVAL %s DAY WHERE id = %s", (deleted_days_ago, row_id))
+    db.commit()
+    cursor.close()
+    return row_id
+
+
+def location(db, table, row_id):
+    """
+    Returns which of the hot and archive tables hold a row.
+    """
+    cursor = db.cursor()
+    found = []
+    for name in (table, f'{table}_archive'):
+        cursor.execute(f"SELECT 1 FROM {name} WHERE id = %s", (row_id,))
+        if cursor.fetchone():
+            found.append(name)
+    cursor.close()
+    return found
+
+
+def test_purge_cutoff():
+    """
+    The cutoff lies retention_days before now.
+    """
+    assert purge_cutoff(90, datetime(2026, 4, 1)) == datetime(2026, 1, 1)
+
+
+def test_purge_cutoff_defaults_to_utc():
+    """
+    Without now, the cutoff is taken from the UTC clock, like deleted_at.
+    """
+    before = datetime.now(timezone.utc).replace(tzinfo=None)
+    cutoff = purge_cutoff(1)
+    after = datetime.now(timezone.utc).replace(tzinfo=None)
+    assert before - timedelta(days=1) <= cutoff <= after - timedelta(days=1)
+
+
+def test_purge_archives_rows_past_retention(db):
+    """
+    Only rows deleted before the cutoff are moved, in batches.
+
+    Scenario:
+        - An author with a recently deleted book, an author without books,
+          both deleted long ago, and a long-deleted book
+        - Purge books, then authors, one row per batch
+        - Check which rows moved to the archive
+    """
+    tag = uuid.uuid4().hex
+    kept_author = insert(db, "INSERT INTO authors (name, email) VALUES (%s, %s)",
+                         ('Kept', f'kept@{tag}.example'), deleted_days_ago=200)
+    lone_author = insert(db, "INSERT INTO authors (name, email) VALUES (%s, %s)",
+                         ('Lone', f'lone@{tag}.example'), deleted_days_ago=200)
+    book = "INSERT INTO books (title, author_id, publication_date) VALUES (%s, %s, %s)"
+    old_book = insert(db, book, (f'Old-{tag}', kept_author, '2001-01-01'), deleted_days_ago=200)
+    recent_book = insert(db, book, (f'Recent-{tag}', kept_author, '2001-01-01'), deleted_days_ago=5)
+
+    cutoff = purge_cutoff(90)
+    assert purge_table(db, 'books', cutoff, batch_size=1, sleep=0) >= 1
+    assert purge_table(db, 'authors', cutoff, batch_size=1, sleep=0) >= 1
+
+    assert location(db, 'books', old_book) == ['books_archive']
+    assert location(db, 'books', recent_book) == ['books']
+    assert location(db, 'authors', lone_author) == ['authors_archive']
+    # Still referenced by a book in the hot table
+    assert location(db, 'authors', kept_author) == ['authors']
+
+
+def test_purge_dry_run_changes_nothing(db):
+    """
+    A dry run counts the rows it would purge and leaves them in place.
+    """
+    tag = uuid.uuid4().hex
+    author = insert(db, "INSERT INTO authors (name, email) VALUES (%s, %s)",
+                    ('Dry', f'dry@{tag}.example'), deleted_days_ago=200)
+
+    assert purge_table(db, 'authors', purge_cutoff(90), sleep=0, dry_run=True) >= 1
+    assert location(db, 'authors', author) == ['authors']
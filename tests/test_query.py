@@ -0,0 +1,135 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./tests/test_query.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       pytest
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       Run tests using : pytest tests/
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# test_query.py
+'''
+    Test Suite for the List Query Builder
+    =====================================
+
+    Checks the SQL and cursors ListQuery builds; none of these tests need
+    a database connection.
+'''
+
+import pytest
+from app.pagination import PaginationError, decode_cursor
+from app.query import AUTHOR_LIST, BOOK_LIST, ListQuery, QueryError, parse_sort
+
+
+def test_parse_sort_appends_id():
+    """
+    The sort always ends with id, in the direction of the last key.
+    """
+    assert parse_sort(None, BOOK_LIST) == (('id', False),)
+    assert parse_sort('-publication_date', BOOK_LIST) == (('publication_date', True), ('id', True))
+    assert parse_sort('publication_date,-id', BOOK_LIST) == (('publication_date', False), ('id', True))
+    with pytest.raises(QueryError):
+        parse_sort('title; DROP TABLE books', BOOK_LIST)
+
+
+def test_filters_are_parameterized():
+    """
+    Filter values only ever reach the query as bind parameters.
+    """
+    listing = ListQuery(BOOK_LIST, {'author_id': '7', 'title_prefix': "50%_off'"})
+    query, params = listing.sql(('id', 'title'), 10)
+    assert query == ("SELECT id, title FROM books WHERE is_deleted = 0 AND author_id = %s "
+                     "AND title LIKE %s ORDER BY id ASC LIMIT %s")
+    assert params == (7, "50\\%\\_off'%", 11)
+
+
+def test_cursor_round_trip():
+    """
+    A cursor from one page starts the next page after the last row's sort key.
+
+    Scenario:
+        - Build a page sorted by name and take its cursor
+        - Check the next query seeks past the last name and id
+    """
+    listing = ListQuery(AUTHOR_LIST, {'sort': 'name'})
+    columns = ('id', 'name')
+    rows, cursor = listing.paginate([(3, 'Ann'), (1, 'Bea'), (2, 'Cy')], 2, columns)
+    assert rows == [(3, 'Ann'), (1, 'Bea')]
+    assert decode_cursor(cursor) == {'sort': 'name,id', 'after': ['Bea', 1]}
+
+    query, params = ListQuery(AUTHOR_LIST, {'sort': 'name', 'cursor': cursor}).sql(columns, 2)
+    assert '(name >= %s) AND (name > %s OR (name = %s AND id > %s))' in query
+    assert params == ('Bea', 'Bea', 'Bea', 1, 3)
+
+
+def test_cursor_must_match_sort():
+    """
+    A cursor cannot be replayed under a different sort.
+    """
+    _, cursor = ListQuery(AUTHOR_LIST, {'sort': 'name'}).paginate([(1, 'A'), (2, 'B')], 1, ('id', 'name'))
+    with pytest.raises(PaginationError):
+        ListQuery(AUTHOR_LIST, {'sort': '-name', 'cursor': cursor})
+
+
+def test_null_sort_values():
+    """
+    Descending sorts put NULLs last, so rows after a dated row include them.
+    """
+    listing = ListQuery(BOOK_LIST, {'sort': '-publication_date'})
+    _, cursor = listing.paginate([(5, '2020-01-01'), (4, None)], 1, ('id', 'publication_date'))
+    query, _ = ListQuery(BOOK_LIST, {'sort': '-publication_date', 'cursor': cursor}).sql(('id',), 1)
+    assert 'publication_date IS NULL' in query
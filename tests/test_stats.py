@@ -0,0 +1,108 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./tests/test_stats.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       pytest, Flask
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       Run tests using : pytest tests/
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# tests/test_stats.py
+'''
+    Test Suite for the author_stats Aggregates
+    ======================================
+
+    Checks the statements app.stats builds, and that a rebuild agrees with
+    a GROUP BY over books.
+'''
+
+from app.stats import add_books_sql, rebuild, refresh_authors_sql, refresh_book_authors_sql
+
+
+def test_statements_are_parameterized():
+    """
+    IDs only reach the statements as bind parameters, one placeholder each.
+    """
+    query, params = add_books_sql(10, 12)
+    assert params == (10, 12) and 'BETWEEN %s AND %s' in query
+
+    query, params = refresh_authors_sql([3, 5])
+    assert params == (3, 5) and 'a.id IN (%s, %s)' in query
+
+    query, params = refresh_book_authors_sql([7])
+    assert params == (7,) and 'WHERE id IN (%s)' in query
+
+
+def test_rebuild_matches_books(db):
+    """
+    After a rebuild every author's row equals a fresh aggregate over books.
+    """
+    rebuild(db, batch_size=50)
+    cursor = db.cursor()
+    cursor.execute("""
+        SELECT a.id, COUNT(b.id), COALESCE(SUM(b.is_deleted = 0), 0),
+               MIN(CASE WHEN b.is_deleted = 0 THEN b.publication_date END),
+               MAX(CASE WHEN b.is_deleted = 0 THEN b.publication_date END)
+        FROM authors a LEFT JOIN books b ON b.author_id = a.id
+        GROUP BY a.id ORDER BY a.id
+    """)
+    expected = [tuple(row) for row in cursor.fetchall()]
+    cursor.execute("SELECT author_id, book_count, live_book_count, first_published, last_published "
+                   "FROM author_stats ORDER BY author_id")
+    actual = [tuple(row) for row in cursor.fetchall()]
+    cursor.close()
+    assert actual == expected
@@ -0,0 +1,172 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./tests/test_suggest.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       pytest, Flask
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       Run tests using : pytest tests/
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# test_suggest.py
+'''
+    Test Suite for Type-Ahead Suggestions
+    =====================================
+
+    Covers the in-process PrefixIndex and the validation of GET /suggest;
+    none of these tests need a database connection.
+'''
+
+import pytest
+from app import create_app
+from app.suggest import PrefixIndex
+
+
+@pytest.fixture
+def index():
+    """
+    Pytest fixture yielding a loaded prefix index.
+
+    Returns:
+        index (PrefixIndex): Index of three titles.
+    """
+    index = PrefixIndex()
+    index.load([(1, 'The Hidden Harbor'), (2, 'Harbor Lights'), (3, 'Winter Song')])
+    yield index
+
+
+def test_search_matches_word_starts(index):
+    """
+    Test PrefixIndex.search() on the first and on later words.
+    """
+    assert index.search('harb') == [(1, 'The Hidden Harbor'), (2, 'Harbor Lights')]
+    assert index.search('THE hid') == [(1, 'The Hidden Harbor')]
+    assert index.search('song', limit=1) == [(3, 'Winter Song')]
+    assert index.search('lights harbor') == []
+
+
+def test_put_replaces_old_text(index):
+    """
+    Test PrefixIndex.put() for new and updated rows.
+
+    Scenario:
+        - Rename a book and add a new one
+        - Check the old title no longer matches and both new ones do
+    """
+    index.put(3, 'Summer Song')
+    index.put(4, 'Winterhalter')
+    assert index.search('winter') == [(4, 'Winterhalter')]
+    assert index.search('summ') == [(3, 'Summer Song')]
+
+
+def test_discard_and_restore(index):
+    """
+    Test PrefixIndex.discard() and restore() for soft delete and restore.
+    """
+    index.discard(2)
+    index.put(2, 'Harbor Lights Revisited')
+    assert index.search('harbor') == [(1, 'The Hidden Harbor')]
+    assert index.restore(2)
+    assert index.search('harbor l') == [(2, 'Harbor Lights Revisited')]
+    assert not index.restore(99)
+
+
+def test_remove_purged_row(index):
+    """
+    Test PrefixIndex.remove() for rows the purge job archived.
+    """
+    index.discard(2)
+    index.remove(2)
+    assert not index.restore(2)
+    assert index.search('harbor') == [(1, 'The Hidden Harbor')]
+    assert len(index) == 2
+
+
+def test_compaction_keeps_results():
+    """
+    Test results stay the same once pending writes are merged into the array.
+    """
+    index = PrefixIndex(compact_ratio=0)
+    index.load([(n, f'Title {n}') for n in range(1, 1001)])
+    for n in range(1, 1500):
+        index.put(n, f'Book {n}')
+    assert index.search('title') == []
+    assert [row_id for row_id, _ in index.search('book 100')] == [100, 1000, 1001, 1002, 1003, 1004,
+                                                                  1005, 1006, 1007, 1008]
+
+
+def test_suggest_invalid_params():
+    """
+    Test GET /suggest endpoint with invalid parameters.
+
+    Returns:
+        400 BAD REQUEST
+    """
+    client = create_app({'TESTING': True, 'SUGGEST_ENABLED': False}).test_client()
+    assert client.get('/suggest').status_code == 400
+    assert client.get('/suggest?q=harb&type=publisher').status_code == 400
+    assert client.get('/suggest?q=harb&limit=0').status_code == 400
+
+
+def test_suggest_disabled():
+    """
+    Test GET /suggest endpoint without an index.
+
+    Returns:
+        503 SERVICE UNAVAILABLE
+    """
+    client = create_app({'TESTING': True, 'SUGGEST_ENABLED': False}).test_client()
+    assert client.get('/suggest?q=harb').status_code == 503
@@ -0,0 +1,405 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./tools/generate_data.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       mysql-connector-python
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       python -m tools.generate_data --authors 1000000 --books 10000000 --method infile
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# generate_data.py
+'''
+    Synthetic Catalogue Generator
+    =============================
+
+    Generates realistic authors and books and bulk-loads them:
+
+        - books per author follow a Zipf distribution (--skew; 0 is uniform),
+          and the popular authors are spread over the whole ID range
+        - author emails are unique (the row ID is part of the local part)
+        - publication dates span --first-year..--last-year, weighted
+          towards recent years
+        - --deleted-fraction of the rows of each table are soft-deleted,
+          with a deleted_at during --last-year
+
+    Rows are appended after the current MAX(id) of each table with explicit
+    IDs, so books can reference authors without reading them back.  The
+    author_stats rows of the new authors are rebuilt after loading.
+
+    Load methods (--method):
+        insert  - multi-row INSERTs, one transaction per --batch-size rows
+        infile  - CSV files of --file-rows rows loaded with LOAD DATA LOCAL
+                  INFILE; fastest, needs local_infile=ON on the server
+        csv     - only write the CSV files to --directory
+
+    The same --seed always produces the same rows.
+'''
+
+import argparse
+import bisect
+import csv
+import itertools
+import logging
+import os
+import random
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+import mysql.connector
+
+from app.database import mysql_config
+from app.stats import rebuild
+
+logger = logging.getLogger(__name__)
+
+AUTHOR_COLUMNS = ('id', 'name', 'email', 'is_deleted', 'deleted_at')
+BOOK_COLUMNS = ('id', 'title', 'author_id', 'publication_date', 'is_deleted', 'deleted_at')
+
+FIRST_NAMES = ('Ada', 'Amara', 'Ananya', 'Arjun', 'Ben', 'Carlos', 'Chen', 'Chloe', 'Daniel', 'Elena',
+               'Emeka', 'Fatima', 'Grace', 'Hana', 'Hugo', 'Ines', 'Isaac', 'Ivan', 'Jamal', 'Julia',
+               'Kenji', 'Lars', 'Leila', 'Lucia', 'Maya', 'Mei', 'Mohammed', 'Nadia', 'Noah', 'Olga',
+               'Omar', 'Priya', 'Rafael', 'Rosa', 'Sakura', 'Samuel', 'Sofia', 'Tariq', 'Vera', 'Yusuf')
+LAST_NAMES = ('Abe', 'Adeyemi', 'Alvarez', 'Bauer', 'Bianchi', 'Chandra', 'Cohen', 'Dubois', 'Eriksen',
+              'Fischer', 'Garcia', 'Haddad', 'Ivanova', 'Jensen', 'Kaur', 'Kim', 'Kowalski', 'Larsen',
+              'Mbeki', 'Moreau', 'Nakamura', 'Nguyen', 'Novak', 'Okafor', 'Oliveira', 'Patel', 'Petrov',
+              'Quinn', 'Rossi', 'Santos', 'Schmidt', 'Silva', 'Singh', 'Smith', 'Tanaka', 'Torres',
+              'Urban', 'Virtanen', 'Wang', 'Yilmaz')
+TITLE_ADJECTIVES = ('Silent', 'Hidden', 'Last', 'Broken', 'Golden', 'Distant', 'Forgotten', 'Burning',
+                    'Quiet', 'Endless', 'Crimson', 'Hollow', 'Northern', 'Secret', 'Wandering', 'Final')
+TITLE_NOUNS = ('River', 'Garden', 'Empire', 'Letter', 'Harbor', 'Shadow', 'Orchard', 'Mountain', 'Promise',
+               'Library', 'Winter', 'Voyage', 'Kingdom', 'Bridge', 'Signal', 'Island', 'Machine', 'Song')
+TITLE_PATTERNS = ('The {adjective} {noun}', '{adjective} {noun}s', 'The {noun} of {noun2}s',
+                  'The {noun} and the {noun2}', '{noun}s of the {adjective} {noun2}')
+EMAIL_DOMAINS = ('example.com', 'example.org', 'example.net', 'mail.example', 'books.example')
+
+
+def next_id(conn, table: str) -> int:
+    """
+    Returns the first free ID after the rows already in a table.
+    """
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {table}")
+    (first_id,) = cursor.fetchone()
+    cursor.close()
+    return first_id
+
+
+def deletion(deleted_fraction: float, year: int, rng: random.Random) -> tuple:
+    """
+    Returns the (is_deleted, deleted_at) pair of a new row.
+
+    Deleted rows get a deleted_at during the given year, so the purge job
+    and the cascading restore see them like rows deleted through the API.
+    """
+    if rng.random() >= deleted_fraction:
+        return 0, None
+    deleted_at = datetime(year, 1, 1) + timedelta(seconds=rng.randrange(365 * 86400))
+    return 1, deleted_at.strftime('%Y-%m-%d %H:%M:%S')
+
+
+def author_rows(first_id: int, count: int, deleted_fraction: float, deleted_year: int, rng: random.Random):
+    """
+    Yields author rows in AUTHOR_COLUMNS order.
+    """
+    for author_id in range(first_id, first_id + count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        email = f'{first}.{last}.{author_id}@{rng.choice(EMAIL_DOMAINS)}'.lower()
+        yield (author_id, f'{first} {last}', email, *deletion(deleted_fraction, deleted_year, rng))
+
+
+def author_picker(first_id: int, count: int, skew: float, rng: random.Random):
+    """
+    Returns a function drawing author IDs with Zipf-distributed popularity.
+
+    The author of popularity rank r is drawn with weight 1 / r**skew;
+    ranks are assigned to IDs at random.
+
+    Args:
+        first_id (int): Lowest author ID.
+        count (int): Number of authors.
+        skew (float): Zipf exponent; 0 draws authors uniformly.
+        rng (random.Random): Random generator.
+
+    Returns:
+        callable: rng -> author ID
+    """
+    if skew <= 0:
+        return lambda rng: rng.randrange(first_id, first_id + count)
+    ids = list(range(first_id, first_id + count))
+    rng.shuffle(ids)
+    cumulative = list(itertools.accumulate(1.0 / rank ** skew for rank in range(1, count + 1)))
+    total = cumulative[-1]
+    return lambda rng: ids[bisect.bisect_left(cumulative, rng.random() * total)]
+
+
+def book_title(rng: random.Random) -> str:
+    """
+    Returns a random title such as "The Hidden Harbor".
+    """
+    noun, noun2 = rng.sample(TITLE_NOUNS, 2)
+    return rng.choice(TITLE_PATTERNS).format(adjective=rng.choice(TITLE_ADJECTIVES), noun=noun, noun2=noun2)
+
+
+def book_rows(first_id: int, count: int, pick_author, first_year: int, last_year: int,
+              deleted_fraction: float, rng: random.Random):
+    """
+    Yields book rows in BOOK_COLUMNS order.
+
+    Publication dates follow a triangular distribution peaking at the end
+    of the range, since catalogues hold more recent titles than old ones.
+    """
+    first_date = date(first_year, 1, 1)
+    span = (date(last_year, 12, 31) - first_date).days
+    for book_id in range(first_id, first_id + count):
+        published = first_date + timedelta(days=int(rng.triangular(0, span, span)))
+        yield (book_id, book_title(rng), pick_author(rng), published.isoformat(),
+               *deletion(deleted_fraction, last_year, rng))
+
+
+def chunks(rows, size: int):
+    """
+    Splits an iterable into lists of at most size items.
+    """
+    iterator = iter(rows)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def load_insert(conn, table: str, columns: tuple, rows, batch_size: int) -> int:
+    """
+    Loads rows with multi-row INSERTs, committing after each batch.
+
+    Returns:
+        int: Number of rows loaded.
+    """
+    query = (f"INSERT INTO {table} ({', '.join(columns)}) "
+             f"VALUES ({', '.join(['%s'] * len(columns))})")
+    cursor = conn.cursor()
+    total = 0
+    for chunk in chunks(rows, batch_size):
+        cursor.executemany(query, chunk)
+        conn.commit()
+        total += len(chunk)
+        if total % (batch_size * 100) == 0:
+            logger.info(f"{table}: {total} rows")
+    cursor.close()
+    return total
+
+
+def write_csv(path: str, rows) -> None:
+    """
+    Writes rows to a CSV file in the format LOAD DATA INFILE reads below.
+
+    None is written as \\N, which LOAD DATA reads as NULL (an empty field
+    would not load into a DATETIME column).
+    """
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        csv.writer(f, lineterminator='\n').writerows(
+            tuple('\\N' if value is None else value for value in row) for row in rows)
+
+
+def load_infile(conn, table: str, columns: tuple, rows, file_rows: int, directory: str) -> int:
+    """
+    Loads rows through CSV files and LOAD DATA LOCAL INFILE, one transaction per file.
+
+    Returns:
+        int: Number of rows loaded.
+    """
+    query = (f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} CHARACTER SET utf8mb4 "
+             f"FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' LINES TERMINATED BY '\\n' "
+             f"({', '.join(columns)})")
+    cursor = conn.cursor()
+    total = 0
+    for number, chunk in enumerate(chunks(rows, file_rows), start=1):
+        path = os.path.join(directory, f'{table}_{number:04d}.csv')
+        write_csv(path, chunk)
+        try:
+            cursor.execute(query, (path,))
+            conn.commit()
+        finally:
+            os.remove(path)
+        total += len(chunk)
+        logger.info(f"{table}: {total} rows")
+    cursor.close()
+    return total
+
+
+def write_csv_files(directory: str, table: str, rows, file_rows: int) -> int:
+    """
+    Writes rows to numbered CSV files without loading them.
+
+    Returns:
+        int: Number of rows written.
+    """
+    total = 0
+    for number, chunk in enumerate(chunks(rows, file_rows), start=1):
+        write_csv(os.path.join(directory, f'{table}_{number:04d}.csv'), chunk)
+        total += len(chunk)
+    return total
+
+
+def generate(conn, authors: int, books: int, method: str = 'insert', skew: float = 1.0,
+             deleted_fraction: float = 0.02, first_year: int = 1900, last_year: int = 2025,
+             batch_size: int = 5000, file_rows: int = 500000, directory: str = None,
+             seed: int = 42) -> dict:
+    """
+    Generates and loads a catalogue.
+
+    Unique and foreign key checks are switched off for the loading session:
+    every generated reference points at an author generated in the same run.
+
+    Args:
+        conn: Database connection; opened with allow_local_infile for 'infile'.
+            Only read for the starting IDs with 'csv'.
+        authors (int): Number of authors.
+        books (int): Number of books.
+        method (str): 'insert', 'infile' or 'csv'.
+        skew (float): Zipf exponent of books per author.
+        deleted_fraction (float): Share of soft-deleted rows.
+        first_year (int): Earliest publication year.
+        last_year (int): Latest publication year.
+        batch_size (int): Rows per INSERT ('insert').
+        file_rows (int): Rows per CSV file ('infile' and 'csv').
+        directory (str): Where CSV files go; a temporary directory when None.
+        seed (int): Random seed.
+
+    Returns:
+        dict: Rows loaded per table, first IDs and elapsed seconds.
+    """
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    first_author, first_book = next_id(conn, 'authors'), next_id(conn, 'books')
+    pick_author = author_picker(first_author, authors, skew, rng)
+    tables = (
+        ('authors', AUTHOR_COLUMNS, author_rows(first_author, authors, deleted_fraction, last_year, rng)),
+        ('books', BOOK_COLUMNS, book_rows(first_book, books, pick_author, first_year, last_year,
+                                          deleted_fraction, rng)),
+    )
+
+    loaded = {}
+    with tempfile.TemporaryDirectory(prefix='catalogue-') as scratch:
+        directory = directory or scratch
+        cursor = conn.cursor()
+        if method != 'csv':
+            cursor.execute("SET SESSION unique_checks = 0, foreign_key_checks = 0")
+        try:
+            for table, columns, rows in tables:
+                if method == 'insert':
+                    loaded[table] = load_insert(conn, table, columns, rows, batch_size)
+                elif method == 'infile':
+                    loaded[table] = load_infile(conn, table, columns, rows, file_rows, directory)
+                else:
+                    loaded[table] = write_csv_files(directory, table, rows, file_rows)
+        finally:
+            if method != 'csv':
+                cursor.execute("SET SESSION unique_checks = 1, foreign_key_checks = 1")
+            cursor.close()
+
+    if method != 'csv':
+        # The new books only reference the new authors
+        rebuild(conn, first_id=first_author)
+
+    return {'authors': loaded['authors'], 'books': loaded['books'],
+            'first_author_id': first_author, 'first_book_id': first_book,
+            'seconds': round(time.perf_counter() - start, 1)}
+
+
+def main():
+    """
+    Generates a catalogue from the command line.
+    """
+    parser = argparse.ArgumentParser(description='Generate and bulk-load a synthetic catalogue.')
+    parser.add_argument('--authors', type=int, default=100000, help='number of authors (default 100000)')
+    parser.add_argument('--books', type=int, default=1000000, help='number of books (default 1000000)')
+    parser.add_argument('--method', choices=('insert', 'infile', 'csv'), default='insert',
+                        help='load method (default insert)')
+    parser.add_argument('--skew', type=float, default=1.0,
+                        help='Zipf exponent of books per author, 0 for uniform (default 1.0)')
+    parser.add_argument('--deleted-fraction', type=float, default=0.02,
+                        help='share of soft-deleted rows (default 0.02)')
+    parser.add_argument('--first-year', type=int, default=1900, help='earliest publication year')
+    parser.add_argument('--last-year', type=int, default=2025, help='latest publication year')
+    parser.add_argument('--batch-size', type=int, default=5000, help='rows per INSERT (default 5000)')
+    parser.add_argument('--file-rows', type=int, default=500000, help='rows per CSV file (default 500000)')
+    parser.add_argument('--directory', help='directory for CSV files (required with --method csv)')
+    parser.add_argument('--seed', type=int, default=42, help='random seed (default 42)')
+    args = parser.parse_args()
+    if args.method == 'csv' and not args.directory:
+        parser.error('--method csv needs --directory')
+    if not 0 <= args.deleted_fraction <= 1:
+        parser.error('--deleted-fraction must be between 0 and 1')
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s',
+                        datefmt='%Y-%m-%d %H:%M:%S')
+
+    conn = mysql.connector.connect(**mysql_config, allow_local_infile=args.method == 'infile')
+    try:
+        result = generate(conn, args.authors, args.books, args.method, args.skew,
+                          args.deleted_fraction, args.first_year, args.last_year,
+                          args.batch_size, args.file_rows, args.directory, args.seed)
+        logger.info(f"Generated {result['authors']} authors (from id {result['first_author_id']}) and "
+                    f"{result['books']} books (from id {result['first_book_id']}) in {result['seconds']}s")
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env
+# -*- coding: utf-8 -*-
+
+"""
+    This file is part of aialchemyhub_in
+    (https://github.com/satya25/aialchemyhub_in).
+
+    aialchemyhub_in is free software repository:
+    You can redistribute it and/or modify it under
+    the terms of the MIT License.
+
+    aialchemyhub_in is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    MIT License for more details.
+
+    You should have received a copy of the MIT License along with
+    aialchemyhub_in.  If not, see <https://opensource.org/licenses/MIT>.
+"""
+
+# ----------------------------------------------------------------------------
+# File Name         :       ./tools/rebuild_author_stats.py
+# Created By        :       Satya Prakash Nigam <spnigam25@yahoo.com>
+# Created Date      :       Oct 18, 2026
+# version           :       1.0
+# Release           :       R1
+#
+# Dependencies      :       mysql-connector-python
+#
+# Installation      :       $ pip install requirements.txt
+#
+# Usage             :       python -m tools.rebuild_author_stats [--batch-size 1000]
+#
+# ---------------------------------------------------------------------------
+#
+# Credits and Acknowledgements
+#
+# - Special thanks to the Python community for their excellent library:
+#   https://www.python.org/community/
+#
+# - The APIs used in this script is documented here:
+#   
+#
+# - Code Snippet(s) adapted from    :   -- NOT Applicable --
+#
+# - Dataset(s) sourced  from        :   -- NOT Applicable --
+#
+#
+# - Inspiration for xxx drawn from:
+#   
+#
+# Thank you to the creators and maintainers of these resources!
+#
+# ---------------------------------------------------------------------------
+#
+# - Content Removal Requests
+#
+#   If you are the owner or creator of any content used in this script and
+#   would like it to be removed, please contact me at:  spnigam25@yahoo.com
+#   I will promptly remove the content upon request.
+#
+# ---------------------------------------------------------------------------
+
+# rebuild_author_stats.py
+'''
+    Rebuild of the author_stats Table
+    =================================
+
+    Recomputes every author's row of author_stats from books, a batch of
+    authors per transaction (see app.stats.rebuild).  The API keeps the
+    table current on its own; run this after loading or changing books
+    outside the API, or to repair drift.
+'''
+
+import argparse
+import logging
+
+from app.database import establish_database_connection
+from app.stats import rebuild
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """
+    Rebuilds author_stats from the command line.
+    """
+    parser = argparse.ArgumentParser(description='Recompute the author_stats table from books.')
+    parser.add_argument('--batch-size', type=int, default=1000, help='authors per transaction (default 1000)')
+    parser.add_argument('--first-id', type=int, default=1, help='lowest author ID to recompute (default 1)')
+    args = parser.parse_args()
+    if args.batch_size < 1 or args.first_id < 1:
+        parser.error('--batch-size and --first-id must be positive')
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s',
+                        datefmt='%Y-%m-%d %H:%M:%S')
+
+    conn = establish_database_connection()
+    try:
+        rows = rebuild(conn, args.batch_size, args.first_id)
+        logger.info(f"Rebuilt author_stats: {rows} row(s)")
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()